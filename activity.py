@@ -0,0 +1,109 @@
+"""Günlük okuma aktivitesi özeti.
+
+`daily_activity` tablosu her gün için tek satır tutar (anahtar gün
+numarasıdır, bkz. dates.py); grafikler ham oturum tabloları yerine bu
+tablodan okur. Satırlar oturum kaydedilirken `record_activity` ile aynı
+işlem içinde güncellenir.
+
+`item_activity` tablosu aynı toplamları kitap/makale ve yıl başına tutar
+(`record_item_activity`); yazar ve kaynak dağılımları buradan okunur.
+Kayıt silinirken oturumları ve katkıları `delete_item_sessions` ile geri alınır.
+"""
+from dates import YEAR_SQL
+
+
+def record_activity(conn, day, pages=0, book_minutes=0, article_minutes=0,
+                    book_sessions=0, article_sessions=0):
+    """Günün özet satırına verilen değerleri ekler"""
+    conn.execute('''INSERT INTO daily_activity
+                    (day, pages, book_minutes, article_minutes, book_sessions, article_sessions)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(day) DO UPDATE SET
+                    pages = pages + excluded.pages,
+                    book_minutes = book_minutes + excluded.book_minutes,
+                    article_minutes = article_minutes + excluded.article_minutes,
+                    book_sessions = book_sessions + excluded.book_sessions,
+                    article_sessions = article_sessions + excluded.article_sessions''',
+                 (day, pages, book_minutes, article_minutes, book_sessions, article_sessions))
+
+
+def record_item_activity(conn, kind, item_id, year, pages=0, minutes=0):
+    """Kitabın ("book") ya da makalenin ("article") yıllık satırına bir oturum ekler"""
+    conn.execute('''INSERT INTO item_activity (kind, item_id, year, pages, minutes, sessions)
+                    VALUES (?, ?, ?, ?, ?, 1)
+                    ON CONFLICT(kind, item_id, year) DO UPDATE SET
+                    pages = pages + excluded.pages,
+                    minutes = minutes + excluded.minutes,
+                    sessions = sessions + 1''',
+                 (kind, item_id, year, pages, minutes))
+
+
+def delete_item_sessions(conn, kind, item_id):
+    """Kitabın ya da makalenin oturumlarını ve özetlerdeki katkılarını siler.
+
+    Yabancı anahtarlar kapalı olduğundan kayıt silinirken bunlar kendiliğinden
+    silinmez; çağıran kaydı aynı işlemde siler. Boşalan günler özetten çıkar.
+    """
+    if kind == "book":
+        rows = conn.execute('''SELECT day, SUM(pages_read), SUM(COALESCE(minutes_spent, 0)), COUNT(*)
+                               FROM reading_sessions WHERE book_id = ? AND day IS NOT NULL
+                               GROUP BY day''', (item_id,)).fetchall()
+        for day, pages, minutes, sessions in rows:
+            record_activity(conn, day, pages=-pages, book_minutes=-minutes, book_sessions=-sessions)
+        conn.execute("DELETE FROM reading_sessions WHERE book_id = ?", (item_id,))
+    else:
+        rows = conn.execute('''SELECT day, SUM(minutes_spent), COUNT(*)
+                               FROM article_reading_sessions WHERE article_id = ? AND day IS NOT NULL
+                               GROUP BY day''', (item_id,)).fetchall()
+        for day, minutes, sessions in rows:
+            record_activity(conn, day, article_minutes=-minutes, article_sessions=-sessions)
+        conn.execute("DELETE FROM article_reading_sessions WHERE article_id = ?", (item_id,))
+    conn.executemany('''DELETE FROM daily_activity
+                        WHERE day = ? AND book_sessions = 0 AND article_sessions = 0''',
+                     [(day,) for day, *_ in rows])
+    conn.execute("DELETE FROM item_activity WHERE kind = ? AND item_id = ?", (kind, item_id))
+
+
+def backfill_item_activity(conn):
+    """Yıllık kayıt özetlerini mevcut oturumlardan baştan oluşturur (tarihsiz oturumlar atlanır)"""
+    conn.execute("DELETE FROM item_activity")
+    conn.execute(f'''INSERT INTO item_activity (kind, item_id, year, pages, minutes, sessions)
+                    SELECT 'book', book_id, {YEAR_SQL.format("date")} AS year, SUM(pages_read),
+                           SUM(COALESCE(minutes_spent, 0)), COUNT(*)
+                    FROM reading_sessions
+                    WHERE date IS NOT NULL
+                    GROUP BY book_id, year''')
+    conn.execute(f'''INSERT INTO item_activity (kind, item_id, year, pages, minutes, sessions)
+                    SELECT 'article', article_id, {YEAR_SQL.format("date")} AS year, 0,
+                           SUM(minutes_spent), COUNT(*)
+                    FROM article_reading_sessions
+                    WHERE date IS NOT NULL
+                    GROUP BY article_id, year''')
+
+
+def backfill_daily_activity(conn):
+    """Özet tabloyu mevcut oturumlardan baştan oluşturur (tarihsiz oturumlar atlanır)"""
+    conn.execute("DELETE FROM daily_activity")
+    conn.execute('''INSERT INTO daily_activity (day, pages, book_minutes, book_sessions)
+                    SELECT day, SUM(pages_read), SUM(COALESCE(minutes_spent, 0)), COUNT(*)
+                    FROM reading_sessions
+                    WHERE day IS NOT NULL
+                    GROUP BY day''')
+    conn.execute('''INSERT INTO daily_activity (day, article_minutes, article_sessions)
+                    SELECT day, SUM(minutes_spent), COUNT(*)
+                    FROM article_reading_sessions
+                    WHERE day IS NOT NULL
+                    GROUP BY day
+                    ON CONFLICT(day) DO UPDATE SET
+                    article_minutes = excluded.article_minutes,
+                    article_sessions = excluded.article_sessions''')
+
+
+def activity_range(db, start_day, end_day):
+    """İki gün numarası (dahil) arasındaki özet satırları:
+    (gün numarası, sayfa, makale dakikası, kitap oturumu, makale oturumu, kitap dakikası)"""
+    return db.query('''SELECT day, pages, article_minutes, book_sessions, article_sessions,
+                              book_minutes
+                       FROM daily_activity
+                       WHERE day BETWEEN ? AND ?
+                       ORDER BY day''', (start_day, end_day))
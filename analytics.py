@@ -0,0 +1,141 @@
+"""Yıllık ve tüm zamanlar okuma analizleri.
+
+Ham oturumlar okunmaz: günlük toplamlar `daily_activity`, yazar ve
+kaynak dağılımları `item_activity` özet tablolarından gelir (bkz.
+activity.py). Takvim ısı haritası ve aylık toplamlar günlük satırların
+NumPy ile vektörel olarak hücrelere/aylara dağıtılmasıyla hesaplanır;
+on yıllık bir geçmiş de en fazla birkaç bin satırdır.
+
+Bir `SessionCache` verilirse (bkz. session_cache.py) günlük toplamlar
+özet tablo yerine bellekteki sütunlardan hesaplanır.
+"""
+from collections import namedtuple
+from datetime import date
+
+import numpy as np
+
+from activity import activity_range
+from dates import date_to_day, day_to_date
+from tracing import traced
+
+# Yazar/kaynak dağılımında gösterilen en fazla satır
+TOP = 10
+
+UNKNOWN = "Bilinmiyor"
+
+# `heatmap`: yıllık görünümde 7 x hafta (satır haftanın günü, Pazartesi 0),
+# tüm zamanlarda yıl x 53 hafta; takvim dışı hücreler NaN.
+# `months`: 'YYYY-MM' etiketleri; `authors`/`sources`: (ad, toplam) listeleri
+Analytics = namedtuple("Analytics", "year start rows heatmap months monthly_pages monthly_minutes "
+                                    "authors sources total_pages total_minutes active_days")
+
+
+def years(db):
+    """Aktivite bulunan yıllar, eskiden yeniye"""
+    first, last = db.query_one("SELECT MIN(day), MAX(day) FROM daily_activity")
+    if first is None:
+        return []
+    return list(range(day_to_date(first).year, day_to_date(last).year + 1))
+
+
+def _daily(db, start, end):
+    """Aralıktaki günler (datetime64[D]) ile günlük sayfa ve dakika dizileri"""
+    rows = activity_range(db, date_to_day(start), date_to_day(end))
+    # Gün numarası 1970-01-01'den beri gün olduğundan doğrudan datetime64[D] olur
+    days = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows)).astype("datetime64[D]")
+    pages = np.fromiter((row[1] for row in rows), dtype=np.int64, count=len(rows))
+    # Dakika: makale dakikaları + kitap dakikaları (bkz. activity_range)
+    minutes = np.fromiter((row[2] + row[5] for row in rows), dtype=np.int64, count=len(rows))
+    return days, pages, minutes
+
+
+def _year_heatmap(days, pages, year):
+    """7 x 53/54 haftalık takvim; sütun yılın ilk haftasından itibaren hafta"""
+    start = np.datetime64(f"{year}-01-01")
+    first_weekday = date(year, 1, 1).weekday()
+    length = (np.datetime64(f"{year + 1}-01-01") - start).astype(int)
+    weeks = (length + first_weekday + 6) // 7
+    grid = np.full((7, weeks), np.nan)
+    calendar = np.arange(length) + first_weekday
+    grid[calendar % 7, calendar // 7] = 0
+    cells = (days - start).astype(int) + first_weekday
+    grid[cells % 7, cells // 7] = pages
+    return grid
+
+
+def _all_time_heatmap(days, pages, first_year, last_year):
+    """Yıl x hafta toplamları"""
+    grid = np.zeros((last_year - first_year + 1, 53))
+    day_years = days.astype("datetime64[Y]")
+    rows = day_years.astype(int) + 1970 - first_year
+    weeks = np.minimum((days - day_years).astype(int) // 7, 52)
+    np.add.at(grid, (rows, weeks), pages)
+    return grid
+
+
+def _monthly(days, pages, minutes, first, last):
+    """Aralıktaki her ay için etiket, sayfa ve dakika toplamları"""
+    first_month = np.datetime64(first, "M")
+    count = (np.datetime64(last, "M") - first_month).astype(int) + 1
+    months = first_month + np.arange(count)
+    index = (days.astype("datetime64[M]") - first_month).astype(int)
+    return ([str(month) for month in months],
+            np.bincount(index, weights=pages, minlength=count),
+            np.bincount(index, weights=minutes, minlength=count))
+
+
+def _cached_daily(db, sessions, first, last):
+    """`_daily` ile aynı diziler, oturum önbelleğinden"""
+    first, last = date_to_day(first), date_to_day(last)
+    days = np.arange(first, last + 1).astype("datetime64[D]")
+    pages = sessions.daily(db, "book", "pages", first, last)
+    minutes = (sessions.daily(db, "book", "minutes", first, last)
+               + sessions.daily(db, "article", "minutes", first, last))
+    return days, pages, minutes
+
+
+def _breakdown(db, kind, column, table, value, year, top):
+    """Yazar ya da kaynağa göre toplamlar (yıllık kayıt özetinden)"""
+    where = "kind = ?" + (" AND year = ?" if year else "")
+    params = [kind] + ([year] if year else [])
+    # Önce kayıt başına topla (birincil anahtar sırasıyla), sonra yazar/kaynağa göre
+    return db.query(f'''SELECT COALESCE(NULLIF(t.{column}, ''), ?) AS name, SUM(a.total) AS total
+                        FROM (SELECT item_id, SUM({value}) AS total FROM item_activity
+                              WHERE {where} GROUP BY item_id) a
+                        LEFT JOIN {table} t ON t.id = a.item_id
+                        GROUP BY name HAVING total > 0
+                        ORDER BY total DESC LIMIT ?''', [UNKNOWN] + params + [top])
+
+
+@traced
+def reading_analytics(db, year=None, top=TOP, sessions=None):
+    """`year` yılının ya da (None ise) tüm zamanların analizi; aktivite yoksa None"""
+    available = years(db)
+    if not available:
+        return None
+    if year:
+        first, last = date(year, 1, 1), date(year, 12, 31)
+    else:
+        first, last = date(available[0], 1, 1), date(available[-1], 12, 31)
+    if sessions is not None:
+        days, pages, minutes = _cached_daily(db, sessions, first, last)
+    # Yazar/kaynak toplamları önbellekte tutulmaz (bkz. session_cache.py)
+    with db.snapshot():
+        if sessions is None:
+            days, pages, minutes = _daily(db, first, last)
+        authors = _breakdown(db, "book", "author", "books", "pages", year, top)
+        sources = _breakdown(db, "article", "source", "articles", "minutes", year, top)
+    if year:
+        heatmap = _year_heatmap(days, pages, year)
+        rows = ["Pzt", "Sal", "Çar", "Per", "Cum", "Cmt", "Paz"]
+    else:
+        heatmap = _all_time_heatmap(days, pages, available[0], available[-1])
+        rows = [str(y) for y in available]
+    months, monthly_pages, monthly_minutes = _monthly(days, pages, minutes, first, last)
+    return Analytics(
+        year=year, start=first, rows=rows, heatmap=heatmap, months=months,
+        monthly_pages=monthly_pages, monthly_minutes=monthly_minutes,
+        authors=authors, sources=sources,
+        total_pages=int(pages.sum()), total_minutes=int(minutes.sum()),
+        active_days=int(np.count_nonzero(pages + minutes)),
+    )
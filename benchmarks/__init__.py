@@ -0,0 +1 @@
+"""Okur Takip performans ölçümleri."""
@@ -0,0 +1,162 @@
+"""Sentetik kütüphane üreteci.
+
+Aynı parametreler ve tohum (seed) her zaman aynı veritabanını üretir.
+Tarihler `end` gününe (varsayılan: bugün) göre geriye doğru dağıtılır;
+böylece "son 30 gün" gibi görünümler her gün benzer miktarda veri görür.
+
+    python -m benchmarks.generate kutuphane.db --books 10000 --sessions 1000000 --years 5
+"""
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+from activity import backfill_daily_activity, backfill_item_activity
+from book_stats import backfill_book_stats
+from core import open_database
+from dates import to_epoch
+from migrations import rebuild_stats_counters
+
+_WORDS = ("kitap", "gece", "deniz", "yol", "şehir", "ışık", "zaman", "ağaç", "kuş", "rüya",
+          "sessiz", "uzun", "kayıp", "son", "ilk", "mavi", "kırmızı", "eski", "yeni", "Istanbul",
+          "history", "river", "garden", "silent", "memory", "winter", "dağ", "çocuk", "ev", "ateş")
+_FIRST = ("Ayşe", "Mehmet", "Elif", "Can", "Zeynep", "Emre", "İpek", "Oğuz", "Leyla", "Orhan",
+          "Sabahattin", "Sevgi", "Yusuf", "Ursula", "Jorge", "Virginia", "Franz", "Ahmet")
+_LAST = ("Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Atay", "Pamuk", "Ali", "Le Guin",
+         "Borges", "Woolf", "Kafka", "Tanpınar", "Soysal", "Öztürk", "Aydın")
+_SOURCES = ("Medium", "Vikipedi", "The Atlantic", "Bilim ve Teknik", "arXiv", "Hacker News",
+            "K24", "Aeon", "Nature", "Kişisel blog")
+
+
+def _title(rng):
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 4))).capitalize()
+
+
+def _author(rng, index):
+    # Yazar havuzu: aynı yazarın birden çok kitabı olsun
+    local = random.Random(index)
+    return f"{local.choice(_FIRST)} {local.choice(_LAST)}"
+
+
+def _timestamp(day, rng):
+    return to_epoch(day + timedelta(seconds=rng.randint(7 * 3600, 23 * 3600)))
+
+
+def _books(rng, count, start, days, authors):
+    for i in range(count):
+        added = start + timedelta(days=rng.randrange(days))
+        pages = rng.randint(80, 1200)
+        state = rng.random()
+        if state < 0.1:
+            # Okunuyor
+            row = (rng.randint(0, pages), _timestamp(added, rng), None, 1, None)
+        elif state < 0.6:
+            # Bitirdi
+            finished = min(added + timedelta(days=rng.randint(3, 120)), start + timedelta(days=days))
+            row = (pages, _timestamp(added, rng), _timestamp(finished, rng), 0, rng.randint(1, 5))
+        elif state < 0.65:
+            # Duraklatıldı
+            row = (rng.randint(1, pages), _timestamp(added, rng), None, 0, None)
+        else:
+            # Okunacak
+            row = (0, None, None, 0, None)
+        current_page, start_date, end_date, reading, rating = row
+        yield (f"{_title(rng)} {i + 1}", _author(rng, rng.randrange(authors)), pages, current_page,
+               start_date, end_date, reading, rating, None, _timestamp(added, rng))
+
+
+def _articles(rng, count, start, days):
+    for i in range(count):
+        added = start + timedelta(days=rng.randrange(days))
+        read = rng.random() < 0.6
+        yield (f"{_title(rng)} {i + 1}", _author(rng, rng.randrange(max(1, count // 3))),
+               rng.choice(_SOURCES), f"https://example.org/{i + 1}",
+               _timestamp(added, rng) if read else None, int(read),
+               rng.randint(1, 5) if read else None, None, _timestamp(added, rng))
+
+
+def _sessions(rng, count, item_ids, start, days, with_pages):
+    for _ in range(count):
+        date = _timestamp(start + timedelta(days=rng.randrange(days)), rng)
+        minutes = rng.randint(5, 120)
+        if with_pages:
+            yield (rng.choice(item_ids), date, rng.randint(1, 60),
+                   minutes if rng.random() > 0.1 else None)
+        else:
+            yield rng.choice(item_ids), date, minutes
+
+
+def _bulk_insert(conn, table, columns, rows):
+    """Geçici tablo üzerinden tek INSERT ... SELECT (tetikleyiciler hızlı çalışır)"""
+    names = ", ".join(columns)
+    conn.execute(f"CREATE TEMP TABLE generate_{table} ({names})")
+    conn.executemany(f"INSERT INTO generate_{table} VALUES ({', '.join('?' * len(columns))})", rows)
+    conn.execute(f"INSERT INTO {table} ({names}) SELECT {names} FROM generate_{table}")
+    conn.execute(f"DROP TABLE generate_{table}")
+
+
+def generate(path, books=1000, articles=500, sessions=20000, article_sessions=5000,
+             years=3, seed=0, end=None):
+    """`path`e sentetik bir veritabanı yazar (varsa üzerine yazar)"""
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    rng = random.Random(seed)
+    end = end or datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    days = max(1, int(years * 365))
+    start = end - timedelta(days=days - 1)
+
+    db = open_database(path)
+    try:
+        with db.transaction() as conn:
+            _bulk_insert(conn, "books",
+                         ("title", "author", "total_pages", "current_page", "start_date",
+                          "end_date", "is_currently_reading", "rating", "notes", "added_date"),
+                         _books(rng, books, start, days, max(1, books // 4)))
+            _bulk_insert(conn, "articles",
+                         ("title", "author", "source", "url", "read_date", "is_read",
+                          "rating", "notes", "added_date"),
+                         _articles(rng, articles, start, days))
+
+            started = [row[0] for row in conn.execute(
+                "SELECT id FROM books WHERE start_date IS NOT NULL ORDER BY id")]
+            read = [row[0] for row in conn.execute(
+                "SELECT id FROM articles WHERE is_read = 1 ORDER BY id")]
+            if started:
+                conn.executemany('''INSERT INTO reading_sessions (book_id, date, pages_read, minutes_spent)
+                                    VALUES (?, ?, ?, ?)''',
+                                 _sessions(rng, sessions, started, start, days, True))
+            if read:
+                conn.executemany('''INSERT INTO article_reading_sessions (article_id, date, minutes_spent)
+                                    VALUES (?, ?, ?)''',
+                                 _sessions(rng, article_sessions, read, start, days, False))
+            backfill_daily_activity(conn)
+            backfill_item_activity(conn)
+            backfill_book_stats(conn)
+            rebuild_stats_counters(conn)
+            conn.execute("ANALYZE")
+    finally:
+        db.close()
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik Okur Takip veritabanı üretir")
+    parser.add_argument("path")
+    parser.add_argument("--books", type=int, default=1000)
+    parser.add_argument("--articles", type=int, default=500)
+    parser.add_argument("--sessions", type=int, default=20000, help="kitap okuma oturumu sayısı")
+    parser.add_argument("--article-sessions", type=int, default=5000)
+    parser.add_argument("--years", type=float, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    generate(args.path, args.books, args.articles, args.sessions, args.article_sessions,
+             args.years, args.seed)
+    print(f"{args.path} üretildi ({time.perf_counter() - started:.1f} sn)")
+
+
+if __name__ == "__main__":
+    main()
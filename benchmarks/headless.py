@@ -0,0 +1,110 @@
+"""Ekran olmadan çalışan Treeview ve grafik.
+
+`StubTreeview` Tk yorumlayıcısı oluşturmadan ttk.Treeview arayüzünün
+VirtualTreeview'in kullandığı kısmını taklit eder ve oluşturulan/güncellenen
+öğe sayısını `touched` içinde sayar. `HeadlessActivityChart` grafiği Tk
+tuvali yerine Agg tuvaline çizer (AnalyticsChart için de aynısı);
+çizim süresi gerçek çizimle aynıdır.
+"""
+import itertools
+
+from tkinter import ttk
+
+from widgets import VirtualTreeview
+
+
+class StubTreeview(ttk.Treeview):
+    """Bellekte tutulan, Tk'siz Treeview"""
+
+    def __init__(self, master=None, **kw):
+        self._w = "stub"
+        self._options = {"height": 10}
+        self._options.update(kw)
+        self._items = {}
+        self._selection = ()
+        self._focus = ""
+        self._ids = itertools.count(1)
+        self.touched = 0
+
+    def bind(self, sequence=None, func=None, add=None):
+        return None
+
+    def cget(self, key):
+        return self._options.get(key, "")
+
+    def configure(self, cnf=None, **kw):
+        self._options.update(cnf or {}, **kw)
+
+    config = configure
+
+    def insert(self, parent, index, iid=None, **kw):
+        iid = iid or f"I{next(self._ids):03X}"
+        self._items[iid] = kw.get("values", ())
+        self.touched += 1
+        return iid
+
+    def item(self, item, option=None, **kw):
+        if "values" in kw:
+            self._items[item] = kw["values"]
+            self.touched += 1
+        return {"values": self._items[item]}
+
+    def delete(self, *items):
+        for item in items:
+            del self._items[item]
+            self.touched += 1
+
+    def get_children(self, item=None):
+        return tuple(self._items)
+
+    def selection(self):
+        return self._selection
+
+    def selection_set(self, *items):
+        self._selection = items
+
+    def selection_remove(self, *items):
+        self._selection = tuple(item for item in self._selection if item not in items)
+
+    def focus(self, item=None):
+        if item is None:
+            return self._focus
+        self._focus = item
+
+    def bbox(self, item, column=None):
+        return ""
+
+    def event_generate(self, sequence, **kw):
+        return None
+
+    def destroy(self):
+        self._items.clear()
+
+
+class HeadlessVirtualTreeview(VirtualTreeview, StubTreeview):
+    """VirtualTreeview'in kendisi; yalnızca Tk katmanı taklit edilir"""
+
+
+def _headless(chart_class):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    class HeadlessChart(chart_class):
+        def _create_canvas(self):
+            return FigureCanvasAgg(self.figure)
+
+        def _show(self):
+            pass
+
+    return HeadlessChart(None)
+
+
+def headless_chart():
+    """Agg tuvaline çizen ActivityChart (matplotlib ilk çağrıda yüklenir)"""
+    from charts import ActivityChart
+    return _headless(ActivityChart)
+
+
+def headless_analytics_chart():
+    """Agg tuvaline çizen AnalyticsChart"""
+    from charts import AnalyticsChart
+    return _headless(AnalyticsChart)
@@ -0,0 +1,182 @@
+"""HTTP API yük testi.
+
+Geçici bir veritabanıyla `cli.py serve` sürecini başlatır, örnek kitaplar
+ekler ve ardından keep-alive bağlantılarla eşzamanlı istemciler çalıştırır.
+İsteklerin `--write-ratio` kadarı okuma oturumu kaydı (POST), kalanı
+istatistik, liste, detay ve geçmiş okumalarıdır (GET). Saniyedeki istek
+sayısı ile gecikme yüzdelikleri raporlanır.
+
+Kullanım:
+    python -m benchmarks.load_test --connections 32 --duration 10
+    python -m benchmarks.load_test --url http://127.0.0.1:8765   # çalışan sunucuya
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Client:
+    """Tek bir keep-alive HTTP/1.1 bağlantısı"""
+
+    def __init__(self, host, port, token=None):
+        self.host = host
+        self.port = port
+        self.token = token
+        self.reader = self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, payload=None):
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Length: {len(body)}\r\n"
+        if self.token:
+            head += f"Authorization: Bearer {self.token}\r\n"
+        self.writer.write(head.encode("latin-1") + b"\r\n" + body)
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        data = await self.reader.readexactly(length) if length else b""
+        return status, json.loads(data) if data else None
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+
+
+async def seed(host, port, token, books):
+    """Yük testi için kitaplar ekler, id listesini döndürür"""
+    client = Client(host, port, token)
+    await client.connect()
+    ids = []
+    for i in range(books):
+        status, result = await client.request(
+            "POST", "/api/books", {"title": f"Yük Testi Kitabı {i}", "author": f"Yazar {i % 50}",
+                                   "total_pages": 300, "start_reading": True})
+        if status != 201:
+            raise RuntimeError(f"Kitap eklenemedi: {status} {result}")
+        ids.append(result["id"])
+    client.close()
+    return ids
+
+
+async def worker(host, port, token, book_ids, write_ratio, deadline, latencies, errors, rng):
+    client = Client(host, port, token)
+    await client.connect()
+    try:
+        while time.perf_counter() < deadline:
+            book_id = rng.choice(book_ids)
+            if rng.random() < write_ratio:
+                request = ("POST", f"/api/books/{book_id}/sessions",
+                           {"pages": rng.randint(1, 20), "minutes": rng.randint(5, 60)})
+            else:
+                request = rng.choice((
+                    ("GET", "/api/stats", None),
+                    ("GET", "/api/books?limit=50", None),
+                    ("GET", f"/api/books/{book_id}", None),
+                    ("GET", f"/api/books/{book_id}/sessions", None),
+                ))
+            started = time.perf_counter()
+            status, _ = await client.request(*request)
+            latencies.append(time.perf_counter() - started)
+            if status >= 400:
+                errors.append(status)
+    finally:
+        client.close()
+
+
+async def run_load(host, port, token, connections, duration, write_ratio, books, seed_value):
+    book_ids = await seed(host, port, token, books)
+    latencies, errors = [], []
+    rng = random.Random(seed_value)
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        worker(host, port, token, book_ids, write_ratio, deadline, latencies, errors,
+               random.Random(rng.random()))
+        for _ in range(connections)))
+    elapsed = time.perf_counter() - started
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0] * 99
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(quantiles[49] * 1000, 2),
+        "p95_ms": round(quantiles[94] * 1000, 2),
+        "p99_ms": round(quantiles[98] * 1000, 2),
+    }
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(db_path, port):
+    """Sunucuyu alt süreçte başlatır ve dinlemeye başlamasını bekler"""
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "cli.py"), "--db", db_path, "serve", "--port", str(port)],
+        stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith("Dinleniyor"):
+        process.kill()
+        raise RuntimeError("Sunucu başlatılamadı")
+    return process
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP API yük testi")
+    parser.add_argument("--url", help="çalışan sunucunun adresi (verilmezse geçici sunucu başlatılır)")
+    parser.add_argument("--token")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="saniye")
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--books", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="sonucu JSON olarak yazar")
+    args = parser.parse_args()
+
+    process = None
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.url:
+            url = urlsplit(args.url)
+            host, port = url.hostname, url.port or 80
+        else:
+            host, port = "127.0.0.1", _free_port()
+            process = _start_server(os.path.join(tmp, "load_test.db"), port)
+        try:
+            result = asyncio.run(run_load(host, port, args.token, args.connections, args.duration,
+                                          args.write_ratio, args.books, args.seed))
+        finally:
+            if process:
+                process.terminate()
+                process.wait()
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"{result['requests']} istek, {result['errors']} hata")
+        print(f"{result['requests_per_second']} istek/sn")
+        print(f"gecikme p50 {result['p50_ms']} ms, p95 {result['p95_ms']} ms, p99 {result['p99_ms']} ms")
+
+
+if __name__ == "__main__":
+    main()
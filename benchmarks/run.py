@@ -0,0 +1,329 @@
+"""Sıcak yolların zaman ölçümleri.
+
+Sentetik bir kütüphane üretir (bkz. generate.py) ve arayüzün ağır
+işlerini arka plandaki sorgu ve ön plandaki çizim adımlarıyla birlikte
+doğrudan, eşzamanlı olarak ölçer:
+
+    load_books                  liste sorgusu + sanal Treeview yükleme, kaydırma ve atlama
+    update_stats                istatistik sayaçları
+    book_stats                  kitap istatistikleri önbelleği (detay penceresi)
+    plot_reading_activity       günlük özet sorgusu + grafik çizimi
+    reading_analytics           yıllık/tüm zamanlar analizi (+ plot_: çizimiyle)
+    [..,cache]                  aynı hesaplar oturum önbelleğinden (bkz. session_cache.py)
+    get_book_reading_history    kitap/makale okuma geçmişi
+    save_progress               okuma kaydı + satırın yerinde güncellenmesi
+
+Varsayılan olarak ekransız çalışır: Treeview taklit edilir, grafik Agg
+tuvaline çizilir. `--tk` ile gerçek Tk pencereleri kullanılır (ekran ya
+da Xvfb gerekir: `xvfb-run python -m benchmarks.run --tk`).
+
+Sonuçlar JSON olarak yazılır; `--compare` önceki bir sonuç dosyasıyla
+karşılaştırır ve medyanı eşikten fazla kötüleşen senaryo varsa 1 ile çıkar:
+
+    python -m benchmarks.run --sessions 1000000 --save baseline.json
+    python -m benchmarks.run --sessions 1000000 --compare baseline.json
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import analytics
+import core
+import profiler
+import tracing
+from benchmarks.generate import generate
+from queries import article_query, book_query
+from search import search
+from session_cache import SessionCache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Bu sürenin altındaki farklar gürültü sayılır
+NOISE_MS = 0.5
+
+
+def measure(func, repeat, warmup=1):
+    """`func`i ölçer; milisaniye cinsinden özet döndürür"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "runs": repeat,
+        "min_ms": round(samples[0], 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+    }
+
+
+class Views:
+    """Ölçümlerde kullanılan Treeview ve grafik (Tk'li ya da ekransız)"""
+
+    def __init__(self, use_tk):
+        self.root = None
+        if use_tk:
+            import tkinter as tk
+
+            from charts import ActivityChart, AnalyticsChart
+            from widgets import VirtualTreeview
+            self.root = tk.Tk()
+            self.root.geometry("1200x750")
+            self.books = VirtualTreeview(self.root, columns=("id", "title", "author", "progress", "status"),
+                                         show="headings", height=25)
+            self.books.pack(fill=tk.BOTH, expand=True)
+            self.articles = VirtualTreeview(self.root, columns=("id", "title", "author", "source", "status"),
+                                            show="headings", height=25)
+            frame = tk.Frame(self.root)
+            frame.pack(fill=tk.BOTH, expand=True)
+            self.chart = ActivityChart(frame)
+            self.analytics_chart = AnalyticsChart(tk.Toplevel(self.root))
+        else:
+            from benchmarks.headless import (HeadlessVirtualTreeview, headless_analytics_chart,
+                                             headless_chart)
+            self.books = HeadlessVirtualTreeview(height=25)
+            self.articles = HeadlessVirtualTreeview(height=25)
+            self.chart = headless_chart()
+            self.analytics_chart = headless_analytics_chart()
+
+    def flush(self):
+        """Bekleyen Tk çizimlerini bitirir (ekransızda bir şey yapmaz)"""
+        if self.root is not None:
+            self.root.update()
+
+    def close(self):
+        if self.root is not None:
+            self.root.destroy()
+
+
+def scenarios(db, views, rng, samples):
+    """(ad, fonksiyon) çiftleri; yazan senaryolar en sondadır"""
+    book_ids = [row[0] for row in db.query("SELECT id FROM books")]
+    article_ids = [row[0] for row in db.query("SELECT id FROM articles")]
+    busy_books = [row[0] for row in db.query(
+        "SELECT book_id FROM reading_sessions GROUP BY book_id ORDER BY COUNT(*) DESC LIMIT 10")]
+    picks = [rng.choice(book_ids) for _ in range(samples)] if book_ids else []
+    article_picks = [rng.choice(article_ids) for _ in range(samples)] if article_ids else []
+
+    def cycle(values):
+        return itertools.cycle(values).__next__
+
+    def load(tree, query):
+        def run():
+            tree.load(db, query)
+            views.flush()
+        return run
+
+    def scroll(tree, query):
+        def run():
+            tree.load(db, query)
+            for _ in range(20):
+                tree.yview_scroll(1, "pages")
+            views.flush()
+        return run
+
+    def jump(tree, query):
+        def run():
+            tree.load(db, query)
+            tree.yview_moveto(0.9)
+            tree.yview_moveto(0.5)
+            views.flush()
+        return run
+
+    def activity(days):
+        def run():
+            views.chart.update(days, *core.reading_activity(db, days))
+            views.flush()
+        return run
+
+    def plot_analytics(year):
+        def run():
+            data = analytics.reading_analytics(db, year)
+            if data is not None:
+                views.analytics_chart.update(data)
+            views.flush()
+        return run
+
+    sessions = SessionCache()
+    sessions.sync(db)
+
+    result = []
+    for name in ("all", "reading", "completed", "unread"):
+        result.append((f"load_books[{name}]", load(views.books, book_query(name))))
+    result.append(("load_books[all]+scroll20", scroll(views.books, book_query("all"))))
+    result.append(("load_books[all]+jump", jump(views.books, book_query("all"))))
+    for sort in ("title", "author", "progress"):
+        result.append((f"load_books[{sort} desc]", load(views.books, book_query("all", sort, True))))
+    result.append(("load_books[all+stats]", load(views.books, book_query("all", with_stats=True))))
+    result.append(("load_books[author prefix]", load(views.books, book_query("all", "title", author="a"))))
+    result.append(("load_articles", load(views.articles, article_query())))
+    result.append(("update_stats", lambda: core.get_stats(db)))
+    for days in (7, 30, 90, 365):
+        result.append((f"reading_activity[{days}]", lambda days=days: core.reading_activity(db, days)))
+        result.append((f"reading_activity[{days},cache]",
+                       lambda days=days: core.reading_activity(db, days, sessions)))
+        result.append((f"plot_reading_activity[{days}]", activity(days)))
+    if picks:
+        book = cycle(picks)
+        result.append(("get_book_reading_history", lambda: core.book_history(db, book())))
+        busiest = cycle(busy_books)
+        result.append(("get_book_reading_history[busiest]", lambda: core.book_history(db, busiest())))
+        result.append(("book_stats", lambda: core.book_stats(db, book())))
+    if article_picks:
+        article = cycle(article_picks)
+        result.append(("get_article_reading_history", lambda: core.article_history(db, article())))
+    years = analytics.years(db)
+    for label, year in (("year", years[-1] if years else None), ("all", None)):
+        result.append((f"reading_analytics[{label}]",
+                       lambda year=year: analytics.reading_analytics(db, year)))
+        result.append((f"reading_analytics[{label},cache]",
+                       lambda year=year: analytics.reading_analytics(db, year, sessions=sessions)))
+        result.append((f"plot_analytics[{label}]", plot_analytics(year)))
+    result.append(("session_cache[sync]", lambda: sessions.sync(db)))
+    words = cycle(["kitap", "deniz yol", "Pamuk", "ışık", "river gar", "zzz"])
+    result.append(("search", lambda: search(db, words())))
+
+    if picks:
+        views.books.load(db, book_query("all"))
+        book = cycle(picks)
+
+        def save_progress():
+            book_id = book()
+            core.log_reading(db, book_id, rng.randint(1, 30), rng.randint(5, 60))
+            views.books.refresh_rows([book_id])
+            views.flush()
+        result.append(("save_progress", save_progress))
+
+        def save_progress_cached():
+            core.log_reading(db, book(), rng.randint(1, 30), rng.randint(5, 60))
+            sessions.note_write(db)
+            sessions.sync(db)
+        result.append(("save_progress[cache]", save_progress_cached))
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(path, params, repeat, seed, use_tk, only=None):
+    """Veritabanı kopyası üzerinde senaryoları çalıştırır, sonuç sözlüğü döndürür"""
+    db = core.open_database(path)
+    views = Views(use_tk)
+    results = {}
+    try:
+        for name, func in scenarios(db, views, random.Random(seed), repeat):
+            if only and not any(part in name for part in only):
+                continue
+            results[name] = measure(func, repeat)
+            print(f"{name:40} medyan {results[name]['median_ms']:10.3f} ms   "
+                  f"p95 {results[name]['p95_ms']:10.3f} ms", file=sys.stderr)
+    finally:
+        views.close()
+        db.close()
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "tk": use_tk,
+            "repeat": repeat,
+            "dataset": params,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Medyanı `threshold` oranından fazla kötüleşen senaryoların listesi"""
+    regressions = []
+    for name, result in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        new_ms, old_ms = result["median_ms"], old["median_ms"]
+        change = (new_ms - old_ms) / old_ms if old_ms else 0.0
+        marker = ""
+        if change > threshold and new_ms - old_ms > NOISE_MS:
+            regressions.append(name)
+            marker = "  <-- yavaşladı"
+        print(f"{name:40} {old_ms:10.3f} -> {new_ms:10.3f} ms  {change:+7.1%}{marker}")
+    if baseline["meta"].get("dataset") != current["meta"]["dataset"]:
+        print("Uyarı: veri kümesi parametreleri farklı, karşılaştırma anlamlı olmayabilir",
+              file=sys.stderr)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Okur Takip performans ölçümleri")
+    parser.add_argument("--books", type=int, default=5000)
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument("--sessions", type=int, default=200000)
+    parser.add_argument("--article-sessions", type=int, default=50000)
+    parser.add_argument("--years", type=float, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=20, help="senaryo başına ölçüm sayısı")
+    parser.add_argument("--db", help="üretilen veritabanını bu dosyada saklar; dosya varsa (aynı parametrelerle "
+                             "üretildiği varsayılarak) yeniden kullanır")
+    parser.add_argument("--only", nargs="+", metavar="AD", help="yalnızca adı bunları içeren senaryolar")
+    parser.add_argument("--tk", action="store_true", help="gerçek Tk pencereleri kullanır (ekran gerekir)")
+    parser.add_argument("--save", metavar="DOSYA", help="sonuçları JSON olarak yazar")
+    parser.add_argument("--compare", metavar="DOSYA", help="önceki sonuçlarla karşılaştırır")
+    parser.add_argument("--slow-log", metavar="DOSYA",
+                        help="eşiği aşan SQL ifadelerini planlarıyla bu dosyaya yazar")
+    parser.add_argument("--slow-ms", type=float, default=profiler.SLOW_QUERY_MS)
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="kötüleşme eşiği (varsayılan 0.2 = %%20)")
+    args = parser.parse_args()
+
+    if args.slow_log:
+        tracing.enable_sql()
+        profiler.configure(args.slow_log, args.slow_ms)
+    params = {"books": args.books, "articles": args.articles, "sessions": args.sessions,
+              "article_sessions": args.article_sessions, "years": args.years, "seed": args.seed}
+    with tempfile.TemporaryDirectory() as tmp:
+        source = args.db or os.path.join(tmp, "source.db")
+        if not os.path.exists(source):
+            started = time.perf_counter()
+            generate(source, **params)
+            print(f"Veri üretildi ({time.perf_counter() - started:.1f} sn)", file=sys.stderr)
+        # Yazan senaryolar saklanan veritabanını değiştirmesin
+        path = os.path.join(tmp, "bench.db")
+        shutil.copyfile(source, path)
+        current = run(path, params, args.repeat, args.seed, args.tk, args.only)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(current, baseline, args.threshold):
+            return 1
+    elif not args.save:
+        print(json.dumps(current, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
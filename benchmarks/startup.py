@@ -0,0 +1,109 @@
+"""Açılış süresi ölçümü.
+
+İki değer ölçülür:
+  * içe aktarma süresi: `python -X importtime -c "import okurtakip"`
+    çıktısından modül başına kümülatif süreler,
+  * ilk çizime kadar geçen süre: uygulamayı ayrı bir süreçte başlatıp ana
+    döngünün ilk boşta kalışına (pencere çizildi) kadar geçen süre.
+
+Kullanım (ekran yoksa Xvfb altında):
+    python -m benchmarks.startup --runs 5
+    xvfb-run python -m benchmarks.startup
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_PAINT_SCRIPT = """
+import tkinter as tk
+import okurtakip
+root = tk.Tk()
+app = okurtakip.ReadingTrackerApp(root)
+def painted():
+    print("PAINTED", flush=True)
+    root.destroy()
+root.after(0, lambda: root.after_idle(painted))
+root.mainloop()
+"""
+
+
+def _env():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def import_times(top=10):
+    """`-X importtime` çıktısından en pahalı modülleri döndürür (mikrosaniye)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import okurtakip"],
+        capture_output=True, text=True, env=_env(), check=True
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    total = next((cumulative for name, _, cumulative in modules if name == "okurtakip"), None)
+    heaviest = sorted(modules, key=lambda m: m[2], reverse=True)[:top]
+    return total, heaviest
+
+
+def first_paint(runs=5):
+    """Süreç başlangıcından ilk çizime kadar geçen süreler (saniye)"""
+    times = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as workdir:
+            start = time.perf_counter()
+            process = subprocess.Popen(
+                [sys.executable, "-c", FIRST_PAINT_SCRIPT],
+                stdout=subprocess.PIPE, text=True, cwd=workdir, env=_env()
+            )
+            for line in process.stdout:
+                if line.strip() == "PAINTED":
+                    times.append(time.perf_counter() - start)
+                    break
+            process.wait()
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Okur Takip açılış ölçümü")
+    parser.add_argument("--runs", type=int, default=5, help="ilk çizim ölçüm sayısı")
+    parser.add_argument("--json", action="store_true", help="sonucu JSON olarak yaz")
+    args = parser.parse_args()
+
+    total, heaviest = import_times()
+    paints = first_paint(args.runs)
+    result = {
+        "import_okurtakip_ms": total / 1000 if total is not None else None,
+        "heaviest_imports_ms": {name: cumulative / 1000 for name, _, cumulative in heaviest},
+        "first_paint_ms": {
+            "median": statistics.median(paints) * 1000 if paints else None,
+            "min": min(paints) * 1000 if paints else None,
+            "runs": len(paints),
+        },
+    }
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+    print(f"okurtakip içe aktarma: {result['import_okurtakip_ms']:.1f} ms")
+    for name, ms in result["heaviest_imports_ms"].items():
+        print(f"  {ms:8.1f} ms  {name}")
+    if paints:
+        print(f"İlk çizim: medyan {result['first_paint_ms']['median']:.0f} ms, "
+              f"en iyi {result['first_paint_ms']['min']:.0f} ms ({len(paints)} ölçüm)")
+    else:
+        print("İlk çizim ölçülemedi (ekran yok mu? xvfb-run ile deneyin)")
+
+
+if __name__ == "__main__":
+    main()
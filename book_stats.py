@@ -0,0 +1,137 @@
+"""Kitap başına türetilmiş okuma istatistikleri.
+
+`book_stats` tablosu her kitap için toplamları, aktif gün ve seri
+sayılarını ve yakın dönem okuma temposunu tutar. Satır, oturum
+kaydedilirken `record_book_session` ile aynı işlem içinde güncellenir:
+yeni oturum en son okunan günden eski değilse güncelleme sabit sürelidir
+(birincil anahtarla bir okuma, bir yazma). Geçmişe tarihli oturumlarda
+seriler yeniden hesaplanması gerektiğinden yalnızca o kitabın oturumları
+yeniden okunur.
+
+Yakın dönem temposu (sayfa/gün) `PACE_DAYS` günlük üstel ortalamadır;
+son okunan güne göre tutulur ve tahmini bitiş tarihi bu tempodan
+hesaplanır. Günler gün numarasıyla tutulur (bkz. dates.py).
+"""
+import math
+from collections import namedtuple
+from datetime import date, timedelta
+
+from dates import DAY_SQL, SECONDS_PER_DAY, day_to_date
+
+# Tempo ortalamasının zaman sabiti (gün)
+PACE_DAYS = 14
+
+# Tablo sütunları; `_apply` aynı sırayla çalışır
+_FIELDS = ("sessions", "pages", "minutes", "timed_pages", "timed_sessions",
+           "active_days", "last_day", "streak", "longest_streak", "recent_pace")
+
+BookStats = namedtuple("BookStats", "pages_per_hour average_session finish_date "
+                                    "longest_streak active_days current_streak sessions")
+
+# Kitap listesinin isteğe bağlı sütunları (bkz. queries.book_query)
+FINISH_DATE_SQL = f'''CASE WHEN book_stats.recent_pace > 0 AND books.total_pages > books.current_page
+                           THEN {DAY_SQL.format("(book_stats.last_day + CAST(ROUND((books.total_pages - "
+                                                "books.current_page) / book_stats.recent_pace) AS INTEGER))")}
+                      END'''
+
+LIST_COLUMNS = [
+    "COALESCE(ROUND(book_stats.timed_pages * 60.0 / NULLIF(book_stats.minutes, 0), 1), '')",
+    f"COALESCE({FINISH_DATE_SQL}, '')",
+    "COALESCE(book_stats.longest_streak, '')",
+    "COALESCE(book_stats.active_days, '')",
+]
+
+
+def _apply(row, day, pages, minutes):
+    """Bir oturumu istatistik satırına ekler (oturumlar tarih sırasıyla gelmelidir)"""
+    (sessions, total_pages, total_minutes, timed_pages, timed_sessions,
+     active_days, last_day, streak, longest, pace) = row
+    sessions += 1
+    total_pages += pages
+    if minutes:
+        total_minutes += minutes
+        timed_pages += pages
+        timed_sessions += 1
+    if day != last_day:
+        gap = day - last_day if last_day is not None else None
+        active_days += 1
+        streak = streak + 1 if gap == 1 else 1
+        longest = max(longest, streak)
+        if gap:
+            pace *= math.exp(-gap / PACE_DAYS)
+        last_day = day
+    pace += pages / PACE_DAYS
+    return (sessions, total_pages, total_minutes, timed_pages, timed_sessions,
+            active_days, last_day, streak, longest, pace)
+
+
+def _empty():
+    return (0, 0, 0, 0, 0, 0, None, 0, 0, 0.0)
+
+
+def _store(conn, book_id, row):
+    conn.execute(f'''INSERT OR REPLACE INTO book_stats (book_id, {", ".join(_FIELDS)})
+                     VALUES (?, {", ".join("?" * len(_FIELDS))})''', (book_id, *row))
+
+
+def _rebuild_book(conn, book_id):
+    row = _empty()
+    for day, pages, minutes in conn.execute(f'''SELECT date / {SECONDS_PER_DAY}, pages_read, minutes_spent
+                                                FROM reading_sessions WHERE book_id = ? AND date IS NOT NULL
+                                                ORDER BY date, id''', (book_id,)):
+        row = _apply(row, day, pages, minutes)
+    _store(conn, book_id, row)
+
+
+def record_book_session(conn, book_id, day, pages, minutes):
+    """Kaydedilmiş oturumu (`day` gün numarası) kitabın istatistik satırına ekler"""
+    row = conn.execute(f"SELECT {', '.join(_FIELDS)} FROM book_stats WHERE book_id = ?",
+                       (book_id,)).fetchone()
+    if row is not None and row[6] is not None and day < row[6]:
+        # Geçmişe tarihli oturum: seriler sırayla hesaplandığından kitabı yeniden oku
+        _rebuild_book(conn, book_id)
+        return
+    _store(conn, book_id, _apply(row or _empty(), day, pages, minutes))
+
+
+def backfill_book_stats(conn):
+    """Tabloyu mevcut oturumlardan baştan oluşturur (tek tarama)"""
+    conn.execute("DELETE FROM book_stats")
+    current, row = None, None
+    for book_id, day, pages, minutes in conn.execute(
+            f'''SELECT book_id, date / {SECONDS_PER_DAY}, pages_read, minutes_spent
+                FROM reading_sessions WHERE date IS NOT NULL ORDER BY book_id, date, id'''):
+        if book_id != current:
+            if current is not None:
+                _store(conn, current, row)
+            current, row = book_id, _empty()
+        row = _apply(row, day, pages, minutes)
+    if current is not None:
+        _store(conn, current, row)
+
+
+def load_book_stats(db, book_id, today=None):
+    """Kitabın türetilmiş istatistikleri; hiç oturumu yoksa None"""
+    row = db.query_one(f'''SELECT books.total_pages, books.current_page, {", ".join(_FIELDS)}
+                           FROM book_stats JOIN books ON books.id = book_stats.book_id
+                           WHERE book_stats.book_id = ?''', (book_id,))
+    if row is None or not row[2]:
+        return None
+    (total_pages, current_page, sessions, _, minutes, timed_pages, timed_sessions,
+     active_days, last_day, streak, longest, pace) = row
+    last = day_to_date(last_day)
+    today = today or date.today()
+    finish = None
+    if pace > 0 and total_pages and total_pages > current_page:
+        # Listedeki FINISH_DATE_SQL ile aynı yuvarlama
+        finish = last + timedelta(days=math.floor((total_pages - current_page) / pace + 0.5))
+    return BookStats(
+        pages_per_hour=timed_pages * 60 / minutes if minutes else None,
+        average_session=minutes / timed_sessions if timed_sessions else None,
+        finish_date=finish,
+        longest_streak=longest,
+        active_days=active_days,
+        # Seri dün ya da bugün okunduysa sürüyor sayılır
+        current_streak=streak if (today - last).days <= 1 else 0,
+        sessions=sessions,
+    )
@@ -0,0 +1,231 @@
+import math
+import tkinter as tk
+
+import numpy as np
+
+from matplotlib.figure import Figure
+from matplotlib.ticker import MaxNLocator
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+import tracing
+from dates import format_day
+
+
+def _nice_ceiling(value):
+    """Eksen üst sınırı için 1, 2, 5 x 10^n biçiminde yuvarlanmış değer"""
+    if value <= 0:
+        return 1
+    magnitude = 10 ** math.floor(math.log10(value))
+    for step in (1, 2, 5, 10):
+        if value <= step * magnitude:
+            return step * magnitude
+    return 10 * magnitude
+
+
+class ActivityChart:
+    """Aktivite grafikleri için bir kez oluşturulan Figure ve tuval.
+
+    Aralık (gün sayısı) değişmedikçe çubuklar yeniden yaratılmaz, yalnızca
+    yükseklikleri güncellenir. Eksen sınırları ve başlıklar da aynı
+    kalıyorsa yalnızca çubuklar blitting ile yeniden çizilir; aksi halde
+    `draw_idle` ile tam çizim istenir. Figure pyplot'a kayıtlı olmadığı
+    için bellekte birikmez.
+    """
+
+    def __init__(self, master):
+        self.master = master
+        self.figure = Figure(figsize=(10, 6), tight_layout=True)
+        self.book_ax, self.article_ax = self.figure.subplots(2, 1)
+        self.canvas = self._create_canvas()
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self._shown = False
+        # (gün sayısı, ilk gün numarası)
+        self._days = None
+        self._bars = {}
+        self._backgrounds = {}
+        self._empty_texts = {}
+        self._styles = {
+            self.book_ax: ('skyblue', 'Okunan Sayfalar'),
+            self.article_ax: ('lightgreen', 'Harcanan Dakikalar'),
+        }
+
+        for ax, ylabel in ((self.book_ax, 'Sayfa Sayısı'), (self.article_ax, 'Dakika')):
+            ax.set_ylabel(ylabel)
+            ax.set_ylim(0, 1)
+            self._empty_texts[ax] = ax.text(0.5, 0.5, 'Veri yok', ha='center', va='center',
+                                            transform=ax.transAxes)
+
+    def update(self, days, dates, pages, minutes):
+        """Grafikleri günlük değer listeleriyle günceller (`dates` gün numaraları, bkz. dates.py)"""
+        if not self._shown:
+            self._show()
+            self._shown = True
+
+        # Gün değişince eksen etiketleri de değişir
+        full_redraw = ((days, dates[0]) != self._days
+                       or len(dates) != len(self._bars.get(self.book_ax, ())))
+        if full_redraw:
+            self._days = (days, dates[0])
+            self._rebuild_bars(dates)
+            self.book_ax.set_title(f'Son {days} Günlük Kitap Okuma Aktivitesi')
+            self.article_ax.set_title(f'Son {days} Günlük Makale Okuma Aktivitesi')
+
+        for ax, values in ((self.book_ax, pages), (self.article_ax, minutes)):
+            for rect, value in zip(self._bars[ax], values):
+                rect.set_height(value)
+            tracing.count_items(len(values))
+            top = _nice_ceiling(max(values, default=0) * 1.1)
+            if ax.get_ylim()[1] != top:
+                ax.set_ylim(0, top)
+                full_redraw = True
+            has_data = any(values)
+            if self._empty_texts[ax].get_visible() == has_data:
+                self._empty_texts[ax].set_visible(not has_data)
+                full_redraw = True
+
+        if full_redraw or not self._backgrounds:
+            self.canvas.draw_idle()
+        else:
+            self._blit()
+
+    def _create_canvas(self):
+        return FigureCanvasTkAgg(self.figure, master=self.master)
+
+    def _show(self):
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def _rebuild_bars(self, dates):
+        """Çubukları yeni aralık için yeniden oluşturur"""
+        positions = list(range(len(dates)))
+        step = max(1, len(dates) // 10)
+        for ax in (self.book_ax, self.article_ax):
+            if ax in self._bars:
+                self._bars[ax].remove()
+                ax.get_legend().remove()
+            color, label = self._styles[ax]
+            self._bars[ax] = ax.bar(positions, [0] * len(dates), color=color,
+                                    label=label, animated=True)
+            ax.set_xlim(-0.5, len(dates) - 0.5)
+            ax.set_xticks(positions[::step])
+            # Yalnızca gösterilen etiketler metne çevrilir ('AA-GG')
+            ax.set_xticklabels([format_day(day)[5:] for day in dates[::step]])
+            ax.legend(loc='upper left')
+
+    def _on_draw(self, event):
+        """Tam çizimden sonra arka planı saklar ve çubukları üstüne çizer"""
+        self._backgrounds = {ax: self.canvas.copy_from_bbox(ax.bbox)
+                             for ax in (self.book_ax, self.article_ax)}
+        for ax, bars in self._bars.items():
+            for rect in bars:
+                ax.draw_artist(rect)
+
+    def _blit(self):
+        """Yalnızca çubukları saklanan arka planın üstüne yeniden çizer"""
+        for ax, bars in self._bars.items():
+            self.canvas.restore_region(self._backgrounds[ax])
+            for rect in bars:
+                ax.draw_artist(rect)
+            self.canvas.blit(ax.bbox)
+
+
+class AnalyticsChart:
+    """Yıllık / tüm zamanlar analiz görünümü (bkz. analytics.py).
+
+    Isı haritası, aylık toplamlar ve yazar/kaynak dağılımı tek Figure'da
+    çizilir. Sanatçılar (görüntü, çubuklar) bir kez oluşturulur ve
+    güncellemelerde yalnızca verileri değiştirilir; eksenleri temizlemek
+    ve tight_layout her seferinde tüm tik etiketlerini yeniden ölçtüğünden
+    yerleşim sabit kenar boşluklarıyla yapılır.
+    """
+
+    def __init__(self, master, top=10):
+        self.master = master
+        self.figure = Figure(figsize=(11, 8))
+        grid = self.figure.add_gridspec(3, 2, height_ratios=(1.2, 1, 1.3), left=0.12, right=0.93,
+                                        top=0.95, bottom=0.04, hspace=0.45, wspace=0.45)
+        self.heatmap_ax = self.figure.add_subplot(grid[0, :])
+        self.monthly_ax = self.figure.add_subplot(grid[1, :])
+        self.minutes_ax = self.monthly_ax.twinx()
+        self.breakdown_axes = (self.figure.add_subplot(grid[2, 0]), self.figure.add_subplot(grid[2, 1]))
+        self.canvas = self._create_canvas()
+        self._show()
+
+        self._image = self.heatmap_ax.imshow(np.zeros((7, 53)), aspect="auto", cmap="Greens",
+                                             interpolation="nearest")
+        self.heatmap_ax.set_xlabel("Hafta")
+        # Az tik etiketi: tam çizimin çoğu metin yerleşimidir
+        for axis in (self.heatmap_ax.xaxis, self.monthly_ax.yaxis, self.minutes_ax.yaxis):
+            axis.set_major_locator(MaxNLocator(5, integer=True))
+        self._months = None
+        self._month_bars = None
+        self._minutes_line, = self.minutes_ax.plot([], [], color="seagreen", marker=".")
+        self.monthly_ax.set_title("Aylık Toplamlar")
+        self.monthly_ax.set_ylabel("Sayfa")
+        self.minutes_ax.set_ylabel("Dakika")
+
+        self._breakdown_bars = []
+        self._empty_texts = []
+        for ax, title, color in zip(self.breakdown_axes, ("Yazarlara Göre Sayfa", "Kaynaklara Göre Dakika"),
+                                    ("skyblue", "lightgreen")):
+            self._breakdown_bars.append(ax.barh(range(top), [0] * top, color=color))
+            ax.set_yticks(range(top))
+            ax.set_ylim(top - 0.5, -0.5)
+            ax.set_title(title)
+            ax.xaxis.set_major_locator(MaxNLocator(4, integer=True))
+            self._empty_texts.append(ax.text(0.5, 0.5, 'Veri yok', ha='center', va='center',
+                                             transform=ax.transAxes))
+
+    def _create_canvas(self):
+        return FigureCanvasTkAgg(self.figure, master=self.master)
+
+    def _show(self):
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def update(self, data):
+        """Görünümü bir `Analytics` sonucuyla günceller"""
+        period = str(data.year) if data.year else "Tüm Zamanlar"
+        self._update_heatmap(data, period)
+        self._update_monthly(data)
+        for ax, bars, text, rows in zip(self.breakdown_axes, self._breakdown_bars, self._empty_texts,
+                                        (data.authors, data.sources)):
+            for i, rect in enumerate(bars):
+                rect.set_width(rows[i][1] if i < len(rows) else 0)
+            ax.set_yticklabels([name for name, _ in rows] + [""] * (len(bars) - len(rows)))
+            ax.set_xlim(0, _nice_ceiling(max((total for _, total in rows), default=0)))
+            text.set_visible(not rows)
+        tracing.count_items(data.heatmap.size + len(data.months) + len(data.authors) + len(data.sources))
+        self.canvas.draw_idle()
+
+    def _update_heatmap(self, data, period):
+        ax = self.heatmap_ax
+        rows, columns = data.heatmap.shape
+        self._image.set_data(data.heatmap)
+        self._image.set_extent((-0.5, columns - 0.5, rows - 0.5, -0.5))
+        self._image.set_clim(0, max(np.nanmax(data.heatmap, initial=0), 1))
+        ax.set_xlim(-0.5, columns - 0.5)
+        ax.set_ylim(rows - 0.5, -0.5)
+        ax.set_yticks(range(rows))
+        ax.set_yticklabels(data.rows)
+        ax.set_title(f"{period}: {data.total_pages} sayfa, {data.total_minutes} dakika, "
+                     f"{data.active_days} aktif gün")
+
+    def _update_monthly(self, data):
+        ax = self.monthly_ax
+        count = len(data.months)
+        positions = np.arange(count)
+        if self._months != data.months:
+            # Ay sayısı ya da etiketler değişti: çubukları yeniden oluştur
+            self._months = data.months
+            if self._month_bars is not None:
+                self._month_bars.remove()
+            self._month_bars = ax.bar(positions, data.monthly_pages, color="skyblue")
+            step = max(1, count // 12)
+            ax.set_xticks(positions[::step])
+            ax.set_xticklabels([month[5:] if data.year else month for month in data.months[::step]])
+            ax.set_xlim(-0.5, count - 0.5)
+        else:
+            for rect, value in zip(self._month_bars, data.monthly_pages):
+                rect.set_height(value)
+        self._minutes_line.set_data(positions, data.monthly_minutes)
+        ax.set_ylim(0, _nice_ceiling(max(data.monthly_pages.max(initial=0) * 1.1, 1)))
+        self.minutes_ax.set_ylim(0, _nice_ceiling(max(data.monthly_minutes.max(initial=0) * 1.1, 1)))
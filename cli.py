@@ -0,0 +1,265 @@
+"""Okur Takip komut satırı arayüzü.
+
+    python cli.py add-book "Tutunamayanlar" --author "Oğuz Atay" --pages 724 --start
+    python cli.py log 12 30 --minutes 45
+    python cli.py stats
+
+Arayüzle aynı veri işlemlerini (core.py) kullanır; tkinter ve matplotlib
+hiç içe aktarılmaz, bu yüzden cron ya da kabuk betiklerinden hızlıca
+çağrılabilir. Toplu içe/dışa aktarma modülleri yalnızca ilgili komut
+çalıştırıldığında yüklenir.
+"""
+import argparse
+import sys
+import time
+
+import core
+import profiler
+import tracing
+from dates import format_datetime
+from search import search
+
+
+def _resolve(db, text, kind):
+    """id ya da başlıktan id döndürür; başlıkta en iyi arama sonucu alınır"""
+    if text.isdigit():
+        return int(text)
+    for found, item_id, _, _ in search(db, text):
+        if found == kind:
+            return item_id
+    raise core.NotFoundError(f"{'Kitap' if kind == 'book' else 'Makale'} bulunamadı: {text}")
+
+
+def cmd_add_book(db, args):
+    book_id = core.add_book(db, args.title, args.author, args.pages, args.start)
+    print(book_id)
+
+
+def cmd_log(db, args):
+    book_id = _resolve(db, args.book, "book")
+    core.log_reading(db, book_id, args.pages, args.minutes, args.date)
+    book = core.book_details(db, book_id)
+    total = f"/{book[3]}" if book[3] else ""
+    print(f"{book[1]}: sayfa {book[4]}{total}")
+
+
+def cmd_add_article(db, args):
+    print(core.add_article(db, args.title, args.author, args.source, args.url))
+
+
+def cmd_read_article(db, args):
+    article_id = _resolve(db, args.article, "article")
+    core.mark_article_read(db, article_id, args.rating, args.notes, args.minutes, args.date)
+    print(core.article_details(db, article_id)[1])
+
+
+def cmd_stats(db, args):
+    stats = core.get_stats(db)
+    if args.json:
+        import json
+        print(json.dumps(stats._asdict()))
+        return
+    print(f"Okuyor: {stats.reading_books}")
+    print(f"Bitirdi: {stats.completed_books}")
+    print(f"Okunacak: {stats.unread_books}")
+    print(f"Okunan Makaleler: {stats.read_articles}")
+    print(f"Okunacak Makaleler: {stats.unread_articles}")
+
+
+def cmd_history(db, args):
+    book_id = _resolve(db, args.book, "book")
+    after = None
+    while True:
+        page = core.book_history(db, book_id, after)
+        for date, pages, minutes in page.rows:
+            print(f"{format_datetime(date)}\t{pages}\t{minutes if minutes else '-'}")
+        if page.next is None:
+            return
+        after = page.next
+
+
+def _print_pages(db, query):
+    after = None
+    while True:
+        page = query.page(db, after, limit=500)
+        for values, _ in page:
+            print("\t".join("" if value is None else str(value) for value in values))
+        if len(page) < 500:
+            return
+        after = page[-1][1]
+
+
+def cmd_books(db, args):
+    from queries import book_query
+    _print_pages(db, book_query(args.filter, args.sort, args.desc, author=args.author,
+                                min_progress=args.min_progress, max_progress=args.max_progress))
+
+
+def cmd_articles(db, args):
+    from queries import article_query
+    _print_pages(db, article_query(args.status, args.sort, args.desc,
+                                   author=args.author, source=args.source))
+
+
+def cmd_search(db, args):
+    for kind, item_id, title, author in search(db, args.text, args.limit):
+        label = "Kitap" if kind == "book" else "Makale"
+        print(f"{label}\t{item_id}\t{title}" + (f"\t{author}" if author else ""))
+
+
+def cmd_import(db, args):
+    from importer import import_file
+    for path in args.files:
+        started = time.perf_counter()
+        result = import_file(db, path, args.format,
+                             progress=lambda n: print(f"\r{path}: {n} kayıt", end="",
+                                                      file=sys.stderr, flush=True))
+        elapsed = time.perf_counter() - started
+        print(file=sys.stderr)
+        print(f"{path}: {result.books} kitap, {result.articles} makale eklendi; "
+              f"{result.duplicates} tekrar, {result.skipped} geçersiz kayıt atlandı "
+              f"({elapsed:.1f} sn)")
+
+
+def cmd_export(db, args):
+    from exporter import export_all
+    export_all(db, args.directory, args.format,
+               progress=lambda table, count: print(f"{table}: {count} satır"))
+
+
+def cmd_backup(db, args):
+    from exporter import backup
+    backup(db, args.path,
+           progress=lambda remaining, total: print(
+               f"\r{total - remaining}/{total} sayfa", end="", file=sys.stderr, flush=True))
+    print(file=sys.stderr)
+    print(f"Yedek alındı: {args.path}")
+
+
+def cmd_serve(db, args):
+    from server import run
+    run(db, args.host, args.port, args.token)
+
+
+def cmd_check_stats(db, args):
+    old, new = core.check_stats(db)
+    if old == new:
+        print("İstatistik sayaçları tutarlı.")
+    else:
+        print(f"İstatistik sayaçları düzeltildi: {old} -> {new}")
+        return 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="okurtakip", description="Okur Takip komut satırı")
+    parser.add_argument("--db", default=core.DB_NAME, help="veritabanı dosyası")
+    parser.add_argument("--slow-log", metavar="DOSYA",
+                        help="eşiği aşan SQL ifadelerini planlarıyla bu dosyaya yazar")
+    parser.add_argument("--slow-ms", type=float, default=profiler.SLOW_QUERY_MS,
+                        help="yavaş sorgu eşiği (ms)")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="KOMUT")
+
+    command = commands.add_parser("add-book", help="kitap ekler, id'sini yazar")
+    command.add_argument("title")
+    command.add_argument("--author")
+    command.add_argument("--pages", type=int)
+    command.add_argument("--start", action="store_true", help="hemen okumaya başla")
+    command.set_defaults(func=cmd_add_book)
+
+    command = commands.add_parser("log", help="okuma oturumu kaydeder")
+    command.add_argument("book", help="kitap id'si ya da başlığı")
+    command.add_argument("pages", type=int, help="okunan sayfa sayısı")
+    command.add_argument("--minutes", type=int)
+    command.add_argument("--date", help="'YYYY-MM-DD HH:MM:SS' (varsayılan: şimdi)")
+    command.set_defaults(func=cmd_log)
+
+    command = commands.add_parser("add-article", help="makale ekler, id'sini yazar")
+    command.add_argument("title")
+    command.add_argument("--author")
+    command.add_argument("--source")
+    command.add_argument("--url")
+    command.set_defaults(func=cmd_add_article)
+
+    command = commands.add_parser("read-article", help="makaleyi okundu işaretler")
+    command.add_argument("article", help="makale id'si ya da başlığı")
+    command.add_argument("--rating", type=int)
+    command.add_argument("--notes")
+    command.add_argument("--minutes", type=int, default=0)
+    command.add_argument("--date", help="'YYYY-MM-DD HH:MM:SS' (varsayılan: şimdi)")
+    command.set_defaults(func=cmd_read_article)
+
+    command = commands.add_parser("stats", help="özet istatistikler")
+    command.add_argument("--json", action="store_true")
+    command.set_defaults(func=cmd_stats)
+
+    command = commands.add_parser("history", help="kitabın okuma geçmişi")
+    command.add_argument("book", help="kitap id'si ya da başlığı")
+    command.set_defaults(func=cmd_history)
+
+    command = commands.add_parser("books", help="kitapları listeler")
+    command.add_argument("--filter", choices=("all", "reading", "completed", "unread", "paused"),
+                         default="all")
+    command.add_argument("--sort", choices=("id", "title", "author", "progress", "status"))
+    command.add_argument("--desc", action="store_true", help="azalan sırala")
+    command.add_argument("--author", help="yazar adının başı")
+    command.add_argument("--min-progress", type=float, metavar="YÜZDE")
+    command.add_argument("--max-progress", type=float, metavar="YÜZDE")
+    command.set_defaults(func=cmd_books)
+
+    command = commands.add_parser("articles", help="makaleleri listeler")
+    command.add_argument("--status", choices=("all", "read", "unread"), default="all")
+    command.add_argument("--sort", choices=("id", "title", "author", "source", "status"))
+    command.add_argument("--desc", action="store_true", help="azalan sırala")
+    command.add_argument("--author", help="yazar adının başı")
+    command.add_argument("--source", help="kaynak adının başı")
+    command.set_defaults(func=cmd_articles)
+
+    command = commands.add_parser("search", help="kitap ve makalelerde arar")
+    command.add_argument("text")
+    command.add_argument("--limit", type=int, default=20)
+    command.set_defaults(func=cmd_search)
+
+    command = commands.add_parser("import", help="dışa aktarım dosyalarını içe aktarır")
+    command.add_argument("files", nargs="+", help="CSV, JSON, BibTeX ya da Pocket HTML dosyaları")
+    command.add_argument("--format", choices=("csv", "json", "bibtex", "html"),
+                         help="dosya biçimi (varsayılan: uzantıdan)")
+    command.set_defaults(func=cmd_import)
+
+    command = commands.add_parser("export", help="tabloları klasöre yazar")
+    command.add_argument("directory")
+    command.add_argument("--format", choices=("csv", "jsonl", "columnar"), default="csv")
+    command.set_defaults(func=cmd_export)
+
+    command = commands.add_parser("backup", help="sıcak yedek alır")
+    command.add_argument("path")
+    command.set_defaults(func=cmd_backup)
+
+    command = commands.add_parser("serve", help="HTTP/JSON API sunucusunu başlatır")
+    command.add_argument("--host", default="127.0.0.1",
+                         help="dinlenecek adres (yerel ağ için 0.0.0.0)")
+    command.add_argument("--port", type=int, default=8765)
+    command.add_argument("--token", help="istemcilerin 'Authorization: Bearer' ile göndermesi gereken anahtar")
+    command.set_defaults(func=cmd_serve)
+
+    command = commands.add_parser("check-stats", help="istatistik sayaçlarını doğrular")
+    command.set_defaults(func=cmd_check_stats)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.slow_log:
+        tracing.enable_sql()
+        profiler.configure(args.slow_log, args.slow_ms)
+    db = core.open_database(args.db)
+    try:
+        return args.func(db, args)
+    except ValueError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
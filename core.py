@@ -0,0 +1,271 @@
+"""Arayüzden bağımsız veri işlemleri.
+
+Tk arayüzü (okurtakip.py) ve komut satırı (cli.py) kayıt ekleme, okuma
+oturumu kaydetme ve istatistik okuma işlerini bu modül üzerinden yapar.
+Modül tkinter ya da matplotlib içe aktarmaz. Fonksiyonlar ilk argüman
+olarak bir `Database` alır; geçersiz girdide ValueError yükseltir.
+Veri fonksiyonları izlenir (bkz. tracing.py).
+
+Tarihler saniye, günler gün numarası olarak döner (bkz. dates.py); metne
+çevirmek gösteren tarafın işidir. Tarih argümanları saniye ya da
+'YYYY-MM-DD[ HH:MM:SS]' metni olabilir.
+"""
+from collections import namedtuple
+
+import dates
+from activity import activity_range, delete_item_sessions, record_activity, record_item_activity
+from book_stats import load_book_stats, record_book_session
+from database import Database
+from migrations import initialize, rebuild_stats_counters
+from queries import history_query
+from tracing import traced
+
+DB_NAME = "reading_tracker.db"
+
+
+class NotFoundError(ValueError):
+    """İstenen kitap ya da makale yok"""
+
+
+# Okuma geçmişinin bir sayfası; `next` sonraki sayfanın anahtarıdır, son sayfada None
+HistoryPage = namedtuple("HistoryPage", "rows next")
+
+# Geçmiş sayfasındaki varsayılan oturum sayısı
+HISTORY_PAGE = 200
+
+Stats = namedtuple("Stats", "reading_books completed_books unread_books read_articles unread_articles")
+
+
+def open_database(path=DB_NAME):
+    """Veritabanını açar, tabloları oluşturur ve bekleyen göçleri uygular"""
+    db = Database(path)
+    initialize(db)
+    return db
+
+
+def _date(value):
+    """Tarih argümanı -> saniye; verilmemişse şimdi"""
+    if value is None:
+        return dates.now()
+    try:
+        return dates.to_epoch(value)
+    except ValueError:
+        raise ValueError(f"Geçersiz tarih: {value}") from None
+
+
+def _require_title(title, message):
+    title = (title or "").strip()
+    if not title:
+        raise ValueError(message)
+    return title
+
+
+# Kitaplar
+@traced
+def add_book(db, title, author=None, total_pages=None, start_reading=False):
+    """Yeni kitap ekler, id'sini döndürür"""
+    title = _require_title(title, "Kitap adı boş olamaz!")
+    if total_pages is not None and total_pages <= 0:
+        raise ValueError("Sayfa sayısı pozitif olmalıdır")
+    now = dates.now()
+    return db.execute('''INSERT INTO books (title, author, total_pages, start_date,
+                                            is_currently_reading, added_date)
+                         VALUES (?, ?, ?, ?, ?, ?)''',
+                      (title, author, total_pages, now if start_reading else None,
+                       1 if start_reading else 0, now)).lastrowid
+
+
+@traced
+def update_book(db, book_id, title, author, total_pages, current_page):
+    """Kitap bilgilerini günceller"""
+    title = _require_title(title, "Kitap adı boş olamaz!")
+    db.execute('''UPDATE books SET title=?, author=?, total_pages=?, current_page=?
+                  WHERE id=?''',
+               (title, author, total_pages, current_page, book_id))
+
+
+@traced
+def delete_book(db, book_id):
+    """Kitabı, oturumlarını ve özetlerdeki katkılarını siler (book_stats tetikleyiciyle)"""
+    with db.transaction() as c:
+        delete_item_sessions(c, "book", book_id)
+        c.execute("DELETE FROM books WHERE id=?", (book_id,))
+
+
+@traced
+def log_reading(db, book_id, pages_read, minutes_spent=None, date=None):
+    """Okuma oturumu kaydeder; kitabın mevcut sayfasını ve günlük özeti günceller"""
+    if pages_read <= 0:
+        raise ValueError("Okunan sayfa sayısı pozitif olmalıdır")
+    if minutes_spent is not None and minutes_spent <= 0:
+        raise ValueError("Harcanan süre pozitif olmalıdır")
+    date = _date(date)
+    day = dates.day_number(date)
+
+    with db.transaction() as c:
+        # Kitabın mevcut sayfasını güncelle
+        updated = c.execute('''UPDATE books SET current_page = current_page + ?,
+                               is_currently_reading=1
+                               WHERE id=?''', (pages_read, book_id)).rowcount
+        if not updated:
+            raise NotFoundError(f"Kitap bulunamadı: {book_id}")
+
+        # Okuma oturumunu kaydet
+        c.execute('''INSERT INTO reading_sessions (book_id, date, pages_read, minutes_spent)
+                     VALUES (?, ?, ?, ?)''', (book_id, date, pages_read, minutes_spent))
+
+        # Günlük özeti ve kitabın istatistiklerini güncelle
+        record_activity(c, day, pages=pages_read,
+                        book_minutes=minutes_spent or 0, book_sessions=1)
+        record_item_activity(c, "book", book_id, dates.to_datetime(date).year,
+                             pages_read, minutes_spent or 0)
+        record_book_session(c, book_id, day, pages_read, minutes_spent)
+
+
+@traced
+def book_details(db, book_id):
+    """(id, başlık, yazar, toplam sayfa, mevcut sayfa, başlama, bitiş, okunuyor, puan, notlar)"""
+    return db.query_one('''SELECT id, title, author, total_pages, current_page,
+                           start_date, end_date, is_currently_reading, rating, notes
+                           FROM books WHERE id=?''', (book_id,))
+
+
+@traced
+def book_stats(db, book_id):
+    """Kitabın önbellekteki türetilmiş istatistikleri (bkz. book_stats.py); oturum yoksa None"""
+    return load_book_stats(db, book_id)
+
+
+def _history_page(db, query, after, limit):
+    rows = query.page(db, after, limit)
+    return HistoryPage([values for values, _ in rows],
+                       tuple(rows[-1][1]) if len(rows) == limit else None)
+
+
+@traced
+def book_history(db, book_id, after=None, limit=HISTORY_PAGE):
+    """Kitabın okuma oturumlarından bir sayfa (tarih, sayfa, dakika), yeniden eskiye.
+
+    `after` önceki sayfanın `next` anahtarıdır (tarih, id); tarih saniyedir.
+    """
+    return _history_page(db, history_query("book", book_id), after, limit)
+
+
+# Makaleler
+@traced
+def add_article(db, title, author=None, source=None, url=None):
+    """Yeni makale ekler, id'sini döndürür"""
+    title = _require_title(title, "Makale adı boş olamaz!")
+    return db.execute('''INSERT INTO articles (title, author, source, url, added_date)
+                         VALUES (?, ?, ?, ?, ?)''', (title, author, source, url, dates.now())).lastrowid
+
+
+@traced
+def update_article(db, article_id, title, author, source, url):
+    """Makale bilgilerini günceller"""
+    title = _require_title(title, "Makale adı boş olamaz!")
+    db.execute('''UPDATE articles SET title=?, author=?, source=?, url=?
+                  WHERE id=?''',
+               (title, author, source, url, article_id))
+
+
+@traced
+def delete_article(db, article_id):
+    """Makaleyi, oturumlarını ve özetlerdeki katkılarını siler"""
+    with db.transaction() as c:
+        delete_item_sessions(c, "article", article_id)
+        c.execute("DELETE FROM articles WHERE id=?", (article_id,))
+
+
+@traced
+def mark_article_read(db, article_id, rating=None, notes=None, minutes=0, date=None):
+    """Makaleyi okundu işaretler; süre verilmişse okuma oturumu da kaydeder"""
+    if rating is not None and (rating < 0 or rating > 5):
+        raise ValueError("Puan 0-5 arasında olmalıdır")
+    if minutes < 0:
+        raise ValueError("Süre pozitif olmalıdır")
+    date = _date(date)
+
+    with db.transaction() as c:
+        # Makaleyi okundu olarak işaretle
+        updated = c.execute('''UPDATE articles
+                               SET is_read=1, read_date=?, rating=?, notes=?
+                               WHERE id=?''',
+                            (date, rating, notes, article_id)).rowcount
+        if not updated:
+            raise NotFoundError(f"Makale bulunamadı: {article_id}")
+
+        # Okuma oturumunu kaydet
+        if minutes > 0:
+            c.execute('''INSERT INTO article_reading_sessions (article_id, date, minutes_spent)
+                         VALUES (?, ?, ?)''',
+                      (article_id, date, minutes))
+            record_activity(c, dates.day_number(date), article_minutes=minutes, article_sessions=1)
+            record_item_activity(c, "article", article_id, dates.to_datetime(date).year,
+                                 minutes=minutes)
+
+
+@traced
+def article_details(db, article_id):
+    """(id, başlık, yazar, kaynak, url, okunma tarihi, okundu, puan, notlar)"""
+    return db.query_one('''SELECT id, title, author, source, url, read_date,
+                           is_read, rating, notes FROM articles WHERE id=?''', (article_id,))
+
+
+@traced
+def article_history(db, article_id, after=None, limit=HISTORY_PAGE):
+    """Makalenin okuma oturumlarından bir sayfa (tarih, dakika), yeniden eskiye"""
+    return _history_page(db, history_query("article", article_id), after, limit)
+
+
+# İstatistikler
+@traced
+def get_stats(db):
+    """Sayaçları döndürür (tetikleyicilerle güncel tutulur, bkz. migrations.py)"""
+    return Stats(*db.query_one('''SELECT reading_books, completed_books, unread_books,
+                                         read_articles, unread_articles
+                                  FROM stats_counters WHERE id = 1'''))
+
+
+@traced
+def check_stats(db):
+    """Sayaçları sıfırdan hesaplar; (eski, yeni) değerleri döndürür"""
+    with db.transaction() as conn:
+        return rebuild_stats_counters(conn)
+
+
+@traced
+def reading_activity(db, days, sessions=None):
+    """Son `days` günün (bugün dahil) gün numaraları ile günlük sayfa ve makale dakikaları.
+
+    `sessions` bir SessionCache ise değerler bellekteki sütunlardan okunur.
+    """
+    last = dates.today()
+    first = last - days
+    numbers = list(range(first, last + 1))
+    if sessions is not None:
+        return (numbers,
+                sessions.daily(db, "book", "pages", first, last).tolist(),
+                sessions.daily(db, "article", "minutes", first, last).tolist())
+
+    # Günlük özet tablosundan oku, boş günleri sıfırla doldur
+    pages = [0] * len(numbers)
+    minutes = [0] * len(numbers)
+    for row in activity_range(db, first, last):
+        pages[row[0] - first] = row[1]
+        minutes[row[0] - first] = row[2]
+    return numbers, pages, minutes
+
+
+# Ayarlar
+@traced
+def get_setting(db, key, default=None):
+    """Kaydedilmiş ayar değeri; yoksa `default`"""
+    row = db.query_one("SELECT value FROM settings WHERE key = ?", (key,))
+    return row[0] if row else default
+
+
+@traced
+def set_setting(db, key, value):
+    db.execute('''INSERT INTO settings (key, value) VALUES (?, ?)
+                  ON CONFLICT(key) DO UPDATE SET value = excluded.value''', (key, value))
@@ -0,0 +1,135 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from tracing import connection_factory
+
+
+# Her bağlantı açıldığında uygulanan ayarlar
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-8000",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Bağlantı başına önbelleğe alınan hazır (prepared) ifade sayısı
+CACHED_STATEMENTS = 256
+
+
+class Database:
+    """Uygulamanın tek veri erişim noktası.
+
+    Ana thread uzun ömürlü tek bir bağlantı kullanır. Arka plan thread'leri
+    ilk kullanımda kendi bağlantılarını alır ve thread yaşadığı sürece
+    aynı bağlantıyı kullanır; bağlantılar `close` ile topluca kapatılır.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=CACHED_STATEMENTS,
+            factory=connection_factory()
+        )
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    @property
+    def conn(self):
+        """Çağıran thread'e ait bağlantıyı döndürür, yoksa açar"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            self._local.depth = 0
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """İç içe kullanılabilen yazma işlemi; en dıştaki blok commit eder"""
+        conn = self.conn
+        if self._local.depth == 0:
+            conn.execute("BEGIN IMMEDIATE")
+        self._local.depth += 1
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.execute("ROLLBACK")
+            raise
+        else:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                try:
+                    conn.execute("COMMIT")
+                except BaseException:
+                    # Başarısız COMMIT (örn. SQLITE_BUSY) işlemi açık bırakabilir;
+                    # bağlantı sonraki BEGIN'de takılmasın
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    raise
+
+    @contextmanager
+    def snapshot(self):
+        """Salt okunur işlem; içindeki sorgular aynı anlık görüntüyü görür.
+
+        WAL kipinde yazarları bekletmez. Bir işlemin içinde çağrılırsa o
+        işlemi kullanır.
+        """
+        conn = self.conn
+        if self._local.depth:
+            yield conn
+            return
+        conn.execute("BEGIN")
+        self._local.depth += 1
+        try:
+            yield conn
+        finally:
+            self._local.depth -= 1
+            conn.execute("COMMIT")
+
+    def execute(self, sql, params=()):
+        """Tek bir ifadeyi çalıştırır (işlem dışında otomatik commit edilir)"""
+        return self.conn.execute(sql, params)
+
+    def executemany(self, sql, seq_of_params):
+        """Aynı ifadeyi birden çok parametre kümesiyle tek işlemde çalıştırır"""
+        with self.transaction() as conn:
+            return conn.executemany(sql, seq_of_params)
+
+    def query(self, sql, params=()):
+        """Sorgunun tüm satırlarını döndürür"""
+        return self.conn.execute(sql, params).fetchall()
+
+    def query_one(self, sql, params=()):
+        """Sorgunun ilk satırını döndürür"""
+        return self.conn.execute(sql, params).fetchone()
+
+    def close(self):
+        """Açılmış tüm bağlantıları kapatır.
+
+        Kapanmadan önce `PRAGMA optimize` çalışır: bağlantının kullandığı
+        ve istatistiği eksik ya da eskimiş tablolar (sınırlı örneklemle)
+        analiz edilir, böylece planlayıcı kısmi ve ifade indekslerini seçebilir.
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.execute("PRAGMA analysis_limit=400")
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            conn.close()
+        self._local = threading.local()
@@ -0,0 +1,79 @@
+"""Tarihlerin saklanması ve gösterimi.
+
+Tarih sütunları (kitapların başlama, bitiş ve eklenme, makalelerin okunma
+ve eklenme, oturumların tarihi) INTEGER olarak, 1970-01-01 00:00'dan beri
+geçen saniye cinsinden saklanır. Değerler yerel saattir, saat dilimi
+dönüşümü yapılmaz; böylece günün numarası `saniye // 86400` olur ve oturum
+tablolarındaki `day` sütunu SQLite'ın ürettiği deterministik bir sütundur.
+Özet tablolar (daily_activity, book_stats) da gün numarası tutar.
+Eski verideki okunamayan oturum tarihleri NULL saklanır ve özetlerde sayılmaz.
+
+Karşılaştırma, gruplama ve aralık sorguları tamsayılar üzerinde yapılır;
+metne çevirme yalnızca gösterirken (`format_datetime`, `format_day`) yapılır.
+"""
+from datetime import date, datetime, time, timedelta
+
+SECONDS_PER_DAY = 86400
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
+# Saklanan saniyeyi / gün numarasını SQL içinde gösterim için metne çevirir
+DATE_SQL = "date({}, 'unixepoch')"
+DAY_SQL = "date({} * 86400, 'unixepoch')"
+YEAR_SQL = "CAST(strftime('%Y', {}, 'unixepoch') AS INTEGER)"
+
+
+def to_epoch(value):
+    """datetime, date, 'YYYY-MM-DD[ HH:MM:SS]' ya da saniye -> saniye (None -> None).
+
+    Geçersiz metin ValueError yükseltir; saat dilimli değerler yerel saate çevrilir.
+    """
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.strip())
+    elif not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return (value - _EPOCH) // timedelta(seconds=1)
+
+
+def now():
+    """Şimdiki yerel saat, saniye"""
+    return to_epoch(datetime.now().replace(microsecond=0))
+
+
+def to_datetime(seconds):
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+def day_number(seconds):
+    """Saniye -> gün numarası"""
+    return seconds // SECONDS_PER_DAY
+
+
+def today():
+    """Bugünün gün numarası"""
+    return day_number(now())
+
+
+def day_to_date(day):
+    return date.fromordinal(day + _EPOCH_ORDINAL)
+
+
+def date_to_day(value):
+    return value.toordinal() - _EPOCH_ORDINAL
+
+
+def format_datetime(seconds, fmt=DATETIME_FORMAT):
+    """Saniye -> metin; boş değer için None"""
+    return None if seconds is None else to_datetime(seconds).strftime(fmt)
+
+
+def format_day(day):
+    """Gün numarası -> 'YYYY-MM-DD'"""
+    return day_to_date(day).isoformat()
@@ -0,0 +1,176 @@
+"""Dışa aktarma ve sıcak yedekleme.
+
+Tablolar imleçten `fetchmany` ile parça parça okunup yazılır; bellekte
+en fazla bir parça tutulur. Tüm tablolar tek bir okuma işlemi içinde
+okunduğu için dosyalar birbiriyle tutarlıdır ve WAL kipinde yazarlar bu
+sırada beklemez.
+
+Biçimler:
+
+* csv: başlık satırlı CSV
+* jsonl: satır başına bir JSON nesnesi
+* columnar: Parquet benzeri sütunlu dosya (bkz. `write_columnar`)
+
+Tarihler saklandığı gibi, saniye olarak yazılır (bkz. dates.py).
+
+Yedekleme `sqlite3.Connection.backup` ile sayfa sayfa yapılır; adımlar
+arasında kilit bırakıldığından uygulama yedek alınırken çalışmaya devam
+eder. Yedek önce geçici dosyaya yazılır, bitince yerine taşınır.
+"""
+import csv
+import json
+import os
+import sqlite3
+import struct
+import zlib
+
+TABLES = ("books", "articles", "reading_sessions", "article_reading_sessions")
+
+FORMATS = {"csv": ".csv", "jsonl": ".jsonl", "columnar": ".okcol"}
+
+# fetchmany başına okunan satır (columnar'da satır grubu boyutu)
+CHUNK_SIZE = 2000
+
+# Yedeklemede adım başına kopyalanan sayfa
+BACKUP_PAGES = 256
+
+COLUMNAR_MAGIC = b"OKCOL1\n"
+
+# json.dumps ensure_ascii=False ile her çağrıda yeni kodlayıcı kurar
+_encode = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def iter_chunks(cursor, chunk_size=CHUNK_SIZE):
+    """İmleç satırlarını `chunk_size`lık listeler halinde üretir"""
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return
+        yield rows
+
+
+def write_csv(stream, columns, chunks):
+    writer = csv.writer(stream)
+    writer.writerow(columns)
+    count = 0
+    for rows in chunks:
+        writer.writerows(rows)
+        count += len(rows)
+    return count
+
+
+def write_jsonl(stream, columns, chunks):
+    count = 0
+    for rows in chunks:
+        stream.writelines(_encode(dict(zip(columns, row))) + "\n"
+                          for row in rows)
+        count += len(rows)
+    return count
+
+
+def write_columnar(stream, columns, chunks):
+    """Parquet benzeri sütunlu dosya yazar.
+
+    Düzen: MAGIC, satır grupları, JSON altbilgi, altbilgi uzunluğu
+    (8 bayt, little-endian), MAGIC. Her satır grubunda her sütun ayrı
+    zlib ile sıkıştırılmış bir JSON dizisidir; altbilgi sütun adlarını ve
+    her grubun satır sayısı ile sütun parçalarının (konum, uzunluk)
+    bilgisini tutar. Okuyucu yalnızca istediği sütunları okuyabilir.
+    """
+    stream.write(COLUMNAR_MAGIC)
+    offset = len(COLUMNAR_MAGIC)
+    groups = []
+    count = 0
+    for rows in chunks:
+        parts = []
+        for values in zip(*rows):
+            data = zlib.compress(_encode(values).encode("utf-8"))
+            stream.write(data)
+            parts.append((offset, len(data)))
+            offset += len(data)
+        groups.append({"rows": len(rows), "chunks": parts})
+        count += len(rows)
+    footer = json.dumps({"columns": list(columns), "row_groups": groups}).encode("utf-8")
+    stream.write(footer)
+    stream.write(struct.pack("<Q", len(footer)))
+    stream.write(COLUMNAR_MAGIC)
+    return count
+
+
+def read_columnar(path, columns=None):
+    """Sütunlu dosyanın satır gruplarını {sütun: değerler} olarak üretir"""
+    with open(path, "rb") as stream:
+        if stream.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"{path}: sütunlu dosya değil")
+        stream.seek(-(8 + len(COLUMNAR_MAGIC)), os.SEEK_END)
+        (length,) = struct.unpack("<Q", stream.read(8))
+        if stream.read() != COLUMNAR_MAGIC:
+            raise ValueError(f"{path}: dosya eksik yazılmış")
+        stream.seek(-(length + 8 + len(COLUMNAR_MAGIC)), os.SEEK_END)
+        footer = json.loads(stream.read(length))
+        names = footer["columns"]
+        wanted = [names.index(name) for name in (columns or names)]
+        for group in footer["row_groups"]:
+            values = {}
+            for index in wanted:
+                offset, size = group["chunks"][index]
+                stream.seek(offset)
+                values[names[index]] = json.loads(zlib.decompress(stream.read(size)))
+            yield values
+
+
+_WRITERS = {"csv": write_csv, "jsonl": write_jsonl, "columnar": write_columnar}
+
+
+def export_table(conn, table, path, fmt="csv", chunk_size=CHUNK_SIZE):
+    """Tabloyu id sırasıyla dosyaya yazar, yazılan satır sayısını döndürür"""
+    # table_info üretilen sütunları (oturumların `day` sütunu) listelemez
+    stored = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+    cursor = conn.execute(f"SELECT {', '.join(stored)} FROM {table} ORDER BY id")
+    columns = [description[0] for description in cursor.description]
+    binary = fmt == "columnar"
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb" if binary else "w", newline=None if binary else "",
+              encoding=None if binary else "utf-8") as stream:
+        count = _WRITERS[fmt](stream, columns, iter_chunks(cursor, chunk_size))
+    os.replace(temp_path, path)
+    return count
+
+
+def export_all(db, directory, fmt="csv", progress=None):
+    """Tüm tabloları `directory/<tablo><uzantı>` dosyalarına yazar.
+
+    Dosyalar aynı anlık görüntüden okunur. `progress(tablo, satır)` her
+    tablo bittiğinde çağrılır. {tablo: satır sayısı} döndürür.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Bilinmeyen biçim: {fmt}")
+    os.makedirs(directory, exist_ok=True)
+    counts = {}
+    with db.snapshot() as conn:
+        for table in TABLES:
+            path = os.path.join(directory, table + FORMATS[fmt])
+            counts[table] = export_table(conn, table, path, fmt)
+            if progress:
+                progress(table, counts[table])
+    return counts
+
+
+def backup(db, path, pages=BACKUP_PAGES, progress=None):
+    """Veritabanının sıcak yedeğini `path`e alır.
+
+    Kopyalama `pages` sayfalık adımlarla yapılır; `progress(kalan, toplam)`
+    her adımdan sonra çağrılır.
+    """
+    temp_path = path + ".tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    target = sqlite3.connect(temp_path)
+    try:
+        db.conn.backup(target, pages=pages,
+                       progress=(lambda status, remaining, total: progress(remaining, total))
+                       if progress else None)
+    finally:
+        target.close()
+    os.replace(temp_path, path)
+
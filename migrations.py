@@ -0,0 +1,676 @@
+"""Veritabanı şema göçleri.
+
+Her göç bir kez çalışır; uygulanan son göçün numarası
+`PRAGMA user_version` içinde tutulur. Yeni bir göç eklemek için
+MIGRATIONS listesinin sonuna bir fonksiyon eklemek yeterlidir;
+listedeki sıra sürüm numarasıdır (ilk göç = sürüm 1).
+
+Uygulanmış göçler değiştirilmez: bir veritabanı göçü bir kez çalıştırır,
+sonradan yapılan değişikliği hiç görmez. Bu yüzden göçler şemayı düz SQL
+ile yazar; uygulama modüllerinin (queries, activity, book_stats, ...)
+değişebilecek sabit ve fonksiyonlarını kullanmaz. Bir göçün sonucunu
+düzeltmek ya da özet tabloları yeniden doldurmak yeni bir göçün işidir.
+"""
+import math
+import operator
+import re
+from datetime import date
+
+
+def create_tables(conn):
+    """Temel tabloları oluşturur (göçlerden önceki şema)"""
+    # Kitaplar tablosu
+    conn.execute('''CREATE TABLE IF NOT EXISTS books
+                    (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    author TEXT,
+                    total_pages INTEGER,
+                    current_page INTEGER DEFAULT 0,
+                    start_date TEXT,
+                    end_date TEXT,
+                    is_currently_reading INTEGER DEFAULT 0,
+                    rating INTEGER,
+                    notes TEXT,
+                    added_date TEXT DEFAULT CURRENT_TIMESTAMP)''')
+    
+    # Makaleler tablosu
+    conn.execute('''CREATE TABLE IF NOT EXISTS articles
+                    (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    author TEXT,
+                    source TEXT,
+                    url TEXT,
+                    read_date TEXT,
+                    is_read INTEGER DEFAULT 0,
+                    rating INTEGER,
+                    notes TEXT,
+                    added_date TEXT DEFAULT CURRENT_TIMESTAMP)''')
+    
+    # Okuma kayıtları tablosu
+    conn.execute('''CREATE TABLE IF NOT EXISTS reading_sessions
+                    (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    book_id INTEGER NOT NULL,
+                    date TEXT NOT NULL,
+                    pages_read INTEGER NOT NULL,
+                    minutes_spent INTEGER,
+                    FOREIGN KEY(book_id) REFERENCES books(id) ON DELETE CASCADE)''')
+    
+    # Makale okuma kayıtları
+    conn.execute('''CREATE TABLE IF NOT EXISTS article_reading_sessions
+                    (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    article_id INTEGER NOT NULL,
+                    date TEXT NOT NULL,
+                    minutes_spent INTEGER NOT NULL,
+                    FOREIGN KEY(article_id) REFERENCES articles(id) ON DELETE CASCADE)''')
+
+
+def _add_hot_query_indexes(conn):
+    """Sık kullanılan sorgular için kapsayan indeksler"""
+    # Kitap okuma geçmişi (book_id'ye göre, tarihe göre sıralı)
+    conn.execute('''CREATE INDEX IF NOT EXISTS idx_reading_sessions_book_date
+                    ON reading_sessions(book_id, date, pages_read, minutes_spent)''')
+    # Aktivite grafikleri (tarih aralığı)
+    conn.execute('''CREATE INDEX IF NOT EXISTS idx_reading_sessions_date
+                    ON reading_sessions(date, pages_read)''')
+    conn.execute('''CREATE INDEX IF NOT EXISTS idx_article_sessions_article_date
+                    ON article_reading_sessions(article_id, date, minutes_spent)''')
+    conn.execute('''CREATE INDEX IF NOT EXISTS idx_article_sessions_date
+                    ON article_reading_sessions(date, minutes_spent)''')
+    # Kitap/makale filtreleri ve istatistikler
+    conn.execute('''CREATE INDEX IF NOT EXISTS idx_books_status
+                    ON books(is_currently_reading, end_date, start_date)''')
+    conn.execute('''CREATE INDEX IF NOT EXISTS idx_articles_status
+                    ON articles(is_read, added_date)''')
+
+
+# Sayaç ifadeleri; update_stats'in eski COUNT(*) koşullarıyla aynıdır.
+# `IS` NULL değerlerde de 0/1 döndürür.
+_BOOK_COUNTERS = {
+    "reading_books": "{row}.is_currently_reading IS 1",
+    "completed_books": "{row}.is_currently_reading IS 0 AND {row}.end_date IS NOT NULL",
+    "unread_books": "{row}.is_currently_reading IS 0 AND {row}.start_date IS NULL",
+}
+_ARTICLE_COUNTERS = {
+    "read_articles": "{row}.is_read IS 1",
+    "unread_articles": "{row}.is_read IS 0",
+}
+
+
+def _counter_updates(counters, *changes):
+    """Tetikleyici gövdesi için `sütun = sütun + (...) - (...)` listesi"""
+    updates = []
+    for column, condition in counters.items():
+        delta = "".join(f" {sign} ({condition.format(row=row)})" for sign, row in changes)
+        updates.append(f"{column} = {column}{delta}")
+    return ",\n                        ".join(updates)
+
+
+def _counter_triggers(conn, table, counters, columns):
+    events = (
+        ("insert", "INSERT", [("+", "NEW")]),
+        ("update", f"UPDATE OF {columns}", [("-", "OLD"), ("+", "NEW")]),
+        ("delete", "DELETE", [("-", "OLD")]),
+    )
+    for name, event, changes in events:
+        conn.execute(f'''CREATE TRIGGER IF NOT EXISTS stats_{table}_{name}
+                        AFTER {event} ON {table}
+                        BEGIN
+                        UPDATE stats_counters SET
+                        {_counter_updates(counters, *changes)}
+                        WHERE id = 1;
+                        END''')
+
+
+def rebuild_stats_counters(conn):
+    """Sayaçları tablolardan yeniden hesaplar; (eski, yeni) değerleri döndürür"""
+    columns = list(_BOOK_COUNTERS) + list(_ARTICLE_COUNTERS)
+    old = conn.execute(f"SELECT {', '.join(columns)} FROM stats_counters WHERE id = 1").fetchone()
+    counts = [f"SUM({condition.format(row='books')})" for condition in _BOOK_COUNTERS.values()]
+    book_counts = conn.execute(f"SELECT {', '.join(counts)} FROM books").fetchone()
+    counts = [f"SUM({condition.format(row='articles')})" for condition in _ARTICLE_COUNTERS.values()]
+    article_counts = conn.execute(f"SELECT {', '.join(counts)} FROM articles").fetchone()
+    new = tuple(value or 0 for value in book_counts + article_counts)
+    conn.execute(f"INSERT OR REPLACE INTO stats_counters (id, {', '.join(columns)}) "
+                 f"VALUES (1, {', '.join('?' * len(columns))})", new)
+    return old, new
+
+
+def _add_stats_counters(conn):
+    """update_stats için tetikleyicilerle güncel tutulan sayaç tablosu"""
+    conn.execute('''CREATE TABLE IF NOT EXISTS stats_counters
+                    (id INTEGER PRIMARY KEY CHECK (id = 1),
+                    reading_books INTEGER NOT NULL DEFAULT 0,
+                    completed_books INTEGER NOT NULL DEFAULT 0,
+                    unread_books INTEGER NOT NULL DEFAULT 0,
+                    read_articles INTEGER NOT NULL DEFAULT 0,
+                    unread_articles INTEGER NOT NULL DEFAULT 0)''')
+    _counter_triggers(conn, "books", _BOOK_COUNTERS,
+                      "is_currently_reading, end_date, start_date")
+    _counter_triggers(conn, "articles", _ARTICLE_COUNTERS, "is_read")
+    rebuild_stats_counters(conn)
+
+
+def _add_daily_activity(conn):
+    """Aktivite grafikleri için günlük özet tablosu"""
+    conn.execute('''CREATE TABLE IF NOT EXISTS daily_activity
+                    (day TEXT PRIMARY KEY,
+                    pages INTEGER NOT NULL DEFAULT 0,
+                    book_minutes INTEGER NOT NULL DEFAULT 0,
+                    article_minutes INTEGER NOT NULL DEFAULT 0,
+                    book_sessions INTEGER NOT NULL DEFAULT 0,
+                    article_sessions INTEGER NOT NULL DEFAULT 0) WITHOUT ROWID''')
+    conn.execute('''INSERT INTO daily_activity (day, pages, book_minutes, book_sessions)
+                    SELECT substr(date, 1, 10), SUM(pages_read),
+                           SUM(COALESCE(minutes_spent, 0)), COUNT(*)
+                    FROM reading_sessions
+                    GROUP BY substr(date, 1, 10)''')
+    conn.execute('''INSERT INTO daily_activity (day, article_minutes, article_sessions)
+                    SELECT substr(date, 1, 10), SUM(minutes_spent), COUNT(*)
+                    FROM article_reading_sessions
+                    WHERE true
+                    GROUP BY substr(date, 1, 10)
+                    ON CONFLICT(day) DO UPDATE SET
+                    article_minutes = excluded.article_minutes,
+                    article_sessions = excluded.article_sessions''')
+
+
+# search.fold'un SQL karşılığı: Türkçe I/ı/İ aynı harf sayılır (tetikleyicilerde)
+_FOLD_SQL = "replace(replace(COALESCE({}, ''), 'İ', 'i'), 'ı', 'i')"
+
+
+def _search_values(row, source):
+    """search_index sütunları için katlanmış değer listesi"""
+    columns = ("title", "author", "source", "url", "notes")
+    return ", ".join(_FOLD_SQL.format(f"{row}.{column}") if column in source else "''"
+                     for column in columns)
+
+
+def _add_search_index(conn):
+    """Kitap ve makaleler için FTS5 tam metin dizini"""
+    conn.execute('''CREATE VIRTUAL TABLE IF NOT EXISTS search_index
+                    USING fts5(title, author, source, url, notes,
+                               tokenize='unicode61 remove_diacritics 2',
+                               prefix='2 3')''')
+    # bm25 ağırlıkları: başlık, yazar, kaynak, url, notlar
+    conn.execute("INSERT INTO search_index(search_index, rank) "
+                 "VALUES('rank', 'bm25(10.0, 5.0, 2.0, 1.0, 1.0)')")
+
+    for table, source, offset in (
+        ("books", ("title", "author", "notes"), 0),
+        ("articles", ("title", "author", "source", "url", "notes"), 1),
+    ):
+        rowid = "{}.id * 2 + " + str(offset)
+        conn.execute(f'''CREATE TRIGGER IF NOT EXISTS search_{table}_insert
+                        AFTER INSERT ON {table}
+                        BEGIN
+                        INSERT INTO search_index(rowid, title, author, source, url, notes)
+                        VALUES ({rowid.format("NEW")}, {_search_values("NEW", source)});
+                        END''')
+        conn.execute(f'''CREATE TRIGGER IF NOT EXISTS search_{table}_update
+                        AFTER UPDATE OF {", ".join(source)} ON {table}
+                        BEGIN
+                        DELETE FROM search_index WHERE rowid = {rowid.format("OLD")};
+                        INSERT INTO search_index(rowid, title, author, source, url, notes)
+                        VALUES ({rowid.format("NEW")}, {_search_values("NEW", source)});
+                        END''')
+        conn.execute(f'''CREATE TRIGGER IF NOT EXISTS search_{table}_delete
+                        AFTER DELETE ON {table}
+                        BEGIN
+                        DELETE FROM search_index WHERE rowid = {rowid.format("OLD")};
+                        END''')
+        conn.execute(f'''INSERT INTO search_index(rowid, title, author, source, url, notes)
+                        SELECT {rowid.format(table)}, {_search_values(table, source)}
+                        FROM {table}''')
+
+
+# Durum sırası (queries.BOOK_STATUS_RANK): Okuyor, Duraklatıldı, Okunacak, Bitirdi
+_BOOK_STATUS_RANK = '''CASE
+                           WHEN is_currently_reading=1 THEN 1
+                           WHEN end_date IS NOT NULL THEN 4
+                           WHEN start_date IS NULL THEN 3
+                           ELSE 2
+                       END'''
+
+
+def _add_list_indexes(conn):
+    """Liste sıralamaları ve sütun filtreleri için indeksler (bkz. queries.py).
+
+    İfade indeksleri sorgudaki sıralama ifadeleriyle birebir aynı olmalıdır.
+    Böylece SQLite sıralamayı indeksten okur ve LIMIT'e ulaşınca durur.
+    Durum filtrelerinin varsayılan sıraları kısmi (WHERE'li) indekslerle,
+    yazar/kaynak önek filtreleri (LIKE 'x%') NOCASE indeksleriyle karşılanır.
+    """
+    for sql in (
+        "idx_books_sort_title ON books(title, id)",
+        "idx_books_sort_author ON books(COALESCE(author, ''), id)",
+        "idx_books_sort_progress ON books(COALESCE(current_page * 100.0 / total_pages, 0), id)",
+        f"idx_books_sort_status ON books({_BOOK_STATUS_RANK}, COALESCE(added_date, '') DESC, id DESC)",
+        "idx_articles_sort_title ON articles(title, id)",
+        "idx_articles_sort_author ON articles(COALESCE(author, ''), id)",
+        "idx_articles_sort_source ON articles(COALESCE(source, ''), id)",
+        "idx_articles_sort_status ON articles(is_read, COALESCE(added_date, '') DESC, id DESC)",
+        """idx_books_filter_completed ON books(end_date DESC, id DESC)
+           WHERE is_currently_reading=0 AND end_date IS NOT NULL""",
+        """idx_books_filter_unread ON books(COALESCE(added_date, '') DESC, id DESC)
+           WHERE is_currently_reading=0 AND start_date IS NULL""",
+        """idx_books_filter_paused ON books(COALESCE(start_date, '') DESC, id DESC)
+           WHERE is_currently_reading=0 AND end_date IS NULL AND start_date IS NOT NULL""",
+        """idx_books_filter_reading ON books(COALESCE(start_date, '') DESC, id DESC)
+           WHERE is_currently_reading=1""",
+        "idx_books_author_nocase ON books(author COLLATE NOCASE)",
+        "idx_articles_author_nocase ON articles(author COLLATE NOCASE)",
+        "idx_articles_source_nocase ON articles(source COLLATE NOCASE)",
+    ):
+        conn.execute("CREATE INDEX IF NOT EXISTS " + sql)
+    # Planlayıcı kısmi indeksleri ancak istatistik varsa tercih eder
+    conn.execute("ANALYZE")
+
+
+def _add_history_indexes(conn):
+    """Okuma geçmişi sayfaları için (kayıt, tarih, id) indeksleri.
+
+    Eski kapsayan indekslerde aynı tarihli satırlar id'ye göre sıralı
+    olmadığından (tarih, id) sayfalaması geçici bir sıralama gerektiriyordu.
+    Yeni indeksler eskilerinin yerini alır; gösterilen sütunları da içerir.
+    """
+    conn.execute("DROP INDEX IF EXISTS idx_reading_sessions_book_date")
+    conn.execute("DROP INDEX IF EXISTS idx_article_sessions_article_date")
+    conn.execute('''CREATE INDEX IF NOT EXISTS idx_reading_sessions_history
+                    ON reading_sessions(book_id, date, id, pages_read, minutes_spent)''')
+    conn.execute('''CREATE INDEX IF NOT EXISTS idx_article_reading_sessions_history
+                    ON article_reading_sessions(article_id, date, id, minutes_spent)''')
+
+
+def _create_book_stats(conn, day_type):
+    conn.execute(f'''CREATE TABLE IF NOT EXISTS book_stats
+                     (book_id INTEGER PRIMARY KEY,
+                     sessions INTEGER NOT NULL DEFAULT 0,
+                     pages INTEGER NOT NULL DEFAULT 0,
+                     minutes INTEGER NOT NULL DEFAULT 0,
+                     timed_pages INTEGER NOT NULL DEFAULT 0,
+                     timed_sessions INTEGER NOT NULL DEFAULT 0,
+                     active_days INTEGER NOT NULL DEFAULT 0,
+                     last_day {day_type},
+                     streak INTEGER NOT NULL DEFAULT 0,
+                     longest_streak INTEGER NOT NULL DEFAULT 0,
+                     recent_pace REAL NOT NULL DEFAULT 0)''')
+    conn.execute('''CREATE TRIGGER IF NOT EXISTS book_stats_delete
+                    AFTER DELETE ON books
+                    BEGIN
+                    DELETE FROM book_stats WHERE book_id = OLD.id;
+                    END''')
+
+
+def _fill_book_stats(conn, day_sql, days_between):
+    """book_stats'ı oturumlardan baştan doldurur.
+
+    Göçler sonradan değişebilecek book_stats.py'ye dayanmasın diye
+    hesaplamanın (bkz. book_stats._apply, tempo sabiti 14 gün) kopyasıdır.
+    `day_sql` oturumun gün ifadesi (okunamayan tarihte NULL, oturum atlanır),
+    `days_between(a, b)` iki gün arası farktır.
+    """
+    stats = {}
+    for book_id, day, pages, minutes in conn.execute(f"""SELECT book_id, {day_sql}, pages_read, minutes_spent
+                                                         FROM reading_sessions WHERE {day_sql} IS NOT NULL
+                                                         ORDER BY book_id, date, id"""):
+        (sessions, total_pages, total_minutes, timed_pages, timed_sessions,
+         active_days, last_day, streak, longest, pace) = stats.get(book_id, (0, 0, 0, 0, 0, 0, None, 0, 0, 0.0))
+        sessions += 1
+        total_pages += pages
+        if minutes:
+            total_minutes += minutes
+            timed_pages += pages
+            timed_sessions += 1
+        if day != last_day:
+            gap = days_between(day, last_day) if last_day is not None else None
+            active_days += 1
+            streak = streak + 1 if gap == 1 else 1
+            longest = max(longest, streak)
+            if gap:
+                pace *= math.exp(-gap / 14)
+            last_day = day
+        pace += pages / 14
+        stats[book_id] = (sessions, total_pages, total_minutes, timed_pages, timed_sessions,
+                          active_days, last_day, streak, longest, pace)
+    conn.execute("DELETE FROM book_stats")
+    conn.executemany("""INSERT INTO book_stats (book_id, sessions, pages, minutes, timed_pages,
+                        timed_sessions, active_days, last_day, streak, longest_streak, recent_pace)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                     ((book_id, *row) for book_id, row in stats.items()))
+
+
+def _days_between_iso(day, previous):
+    return (date.fromisoformat(day) - date.fromisoformat(previous)).days
+
+
+def _add_book_stats(conn):
+    """Kitap başına türetilmiş istatistik önbelleği (bkz. book_stats.py); gün 'YYYY-MM-DD'"""
+    _create_book_stats(conn, "TEXT")
+    _fill_book_stats(conn, "date(date)", _days_between_iso)
+
+
+def _add_item_activity(conn):
+    """Yıllık ve tüm zamanlar analizleri için kitap/makale başına yıllık özet"""
+    conn.execute('''CREATE TABLE IF NOT EXISTS item_activity
+                    (kind TEXT NOT NULL,
+                    item_id INTEGER NOT NULL,
+                    year INTEGER NOT NULL,
+                    pages INTEGER NOT NULL DEFAULT 0,
+                    minutes INTEGER NOT NULL DEFAULT 0,
+                    sessions INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (kind, item_id, year)) WITHOUT ROWID''')
+    conn.execute('''INSERT INTO item_activity (kind, item_id, year, pages, minutes, sessions)
+                    SELECT 'book', book_id, CAST(substr(date, 1, 4) AS INTEGER), SUM(pages_read),
+                           SUM(COALESCE(minutes_spent, 0)), COUNT(*)
+                    FROM reading_sessions
+                    GROUP BY book_id, substr(date, 1, 4)''')
+    conn.execute('''INSERT INTO item_activity (kind, item_id, year, pages, minutes, sessions)
+                    SELECT 'article', article_id, CAST(substr(date, 1, 4) AS INTEGER), 0,
+                           SUM(minutes_spent), COUNT(*)
+                    FROM article_reading_sessions
+                    GROUP BY article_id, substr(date, 1, 4)''')
+
+
+# Saniye olarak saklanan tarih sütunları (bkz. dates.py)
+DATE_COLUMNS = {
+    "books": ("start_date", "end_date", "added_date"),
+    "articles": ("read_date", "added_date"),
+    "reading_sessions": ("date",),
+    "article_reading_sessions": ("date",),
+}
+
+
+def _dependents(conn, table, columns):
+    """Tablonun `columns` sütunlarına değinen indeks ve tetikleyicileri: [(tür, ad, sql)]"""
+    pattern = re.compile(r"\b(" + "|".join(columns) + r")\b")
+    rows = conn.execute("""SELECT type, name, sql FROM sqlite_master
+                           WHERE tbl_name = ? AND type IN ('index', 'trigger')
+                           AND sql IS NOT NULL""", (table,)).fetchall()
+    return [row for row in rows if pattern.search(row[2])]
+
+
+def _fill_summaries(conn):
+    """Gün numaralı özet tabloları (daily_activity, item_activity, book_stats)
+    oturumlardan baştan doldurur; tarihsiz oturumlar atlanır"""
+    conn.execute("DELETE FROM daily_activity")
+    conn.execute('''INSERT INTO daily_activity (day, pages, book_minutes, book_sessions)
+                    SELECT day, SUM(pages_read), SUM(COALESCE(minutes_spent, 0)), COUNT(*)
+                    FROM reading_sessions
+                    WHERE day IS NOT NULL
+                    GROUP BY day''')
+    conn.execute('''INSERT INTO daily_activity (day, article_minutes, article_sessions)
+                    SELECT day, SUM(minutes_spent), COUNT(*)
+                    FROM article_reading_sessions
+                    WHERE day IS NOT NULL
+                    GROUP BY day
+                    ON CONFLICT(day) DO UPDATE SET
+                    article_minutes = excluded.article_minutes,
+                    article_sessions = excluded.article_sessions''')
+    conn.execute("DELETE FROM item_activity")
+    conn.execute('''INSERT INTO item_activity (kind, item_id, year, pages, minutes, sessions)
+                    SELECT 'book', book_id, CAST(strftime('%Y', date, 'unixepoch') AS INTEGER) AS year,
+                           SUM(pages_read), SUM(COALESCE(minutes_spent, 0)), COUNT(*)
+                    FROM reading_sessions
+                    WHERE date IS NOT NULL
+                    GROUP BY book_id, year''')
+    conn.execute('''INSERT INTO item_activity (kind, item_id, year, pages, minutes, sessions)
+                    SELECT 'article', article_id, CAST(strftime('%Y', date, 'unixepoch') AS INTEGER) AS year,
+                           0, SUM(minutes_spent), COUNT(*)
+                    FROM article_reading_sessions
+                    WHERE date IS NOT NULL
+                    GROUP BY article_id, year''')
+    _fill_book_stats(conn, "day", operator.sub)
+
+
+def _store_dates_as_integers(conn):
+    """Tarih sütunlarını metinden saniyeye çevirir (bkz. dates.py).
+
+    SQLite sütun türünü değiştiremediğinden her sütun için yeni bir
+    INTEGER sütun eklenir, doldurulur, eskisi silinir ve yenisi eski adı
+    alır. Sütuna değinen indeks ve tetikleyiciler önce kaldırılıp sonra
+    yeniden kurulur. Oturum tablolarına gün numarasını veren `day`
+    sütunu eklenir; özet tablolar gün numarasıyla yeniden doldurulur.
+    """
+    triggers = []
+    for table, columns in DATE_COLUMNS.items():
+        for kind, name, sql in _dependents(conn, table, columns):
+            conn.execute(f"DROP {kind.upper()} {name}")
+            if kind == "trigger":
+                triggers.append(sql)
+        # Oturum tarihi zorunludur; okunamayan eski değerler 0 (1970-01-01) olur
+        required = " NOT NULL DEFAULT 0" if table.endswith("sessions") else ""
+        for column in columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column}_epoch INTEGER{required}")
+        epoch = "CAST(strftime('%s', {}) AS INTEGER)"
+        values = ", ".join(f"{column}_epoch = " + (f"COALESCE({epoch.format(column)}, 0)"
+                                                   if required else epoch.format(column))
+                           for column in columns)
+        conn.execute(f"UPDATE {table} SET {values}")
+        for column in columns:
+            conn.execute(f"ALTER TABLE {table} DROP COLUMN {column}")
+            conn.execute(f"ALTER TABLE {table} RENAME COLUMN {column}_epoch TO {column}")
+
+    for table, pages in (("reading_sessions", "pages_read, "), ("article_reading_sessions", "")):
+        conn.execute(f'''ALTER TABLE {table} ADD COLUMN day INTEGER
+                        GENERATED ALWAYS AS (date / 86400) VIRTUAL''')
+        # Gün aralığı sorguları ve günlük özetin yeniden oluşturulması için
+        conn.execute(f"CREATE INDEX idx_{table}_day ON {table}(day, {pages}minutes_spent)")
+    for sql in triggers:
+        conn.execute(sql)
+    conn.execute("CREATE INDEX idx_books_status ON books(is_currently_reading, end_date, start_date)")
+    conn.execute("CREATE INDEX idx_articles_status ON articles(is_read, added_date)")
+    _add_history_indexes(conn)
+    # Tarih ifadeleri değişen liste indeksleri (bkz. _add_list_indexes)
+    for sql in (
+        f"idx_books_sort_status ON books({_BOOK_STATUS_RANK}, COALESCE(added_date, 0) DESC, id DESC)",
+        "idx_articles_sort_status ON articles(is_read, COALESCE(added_date, 0) DESC, id DESC)",
+        """idx_books_filter_completed ON books(end_date DESC, id DESC)
+           WHERE is_currently_reading=0 AND end_date IS NOT NULL""",
+        """idx_books_filter_unread ON books(COALESCE(added_date, 0) DESC, id DESC)
+           WHERE is_currently_reading=0 AND start_date IS NULL""",
+        """idx_books_filter_paused ON books(COALESCE(start_date, 0) DESC, id DESC)
+           WHERE is_currently_reading=0 AND end_date IS NULL AND start_date IS NOT NULL""",
+        """idx_books_filter_reading ON books(COALESCE(start_date, 0) DESC, id DESC)
+           WHERE is_currently_reading=1""",
+    ):
+        conn.execute("CREATE INDEX IF NOT EXISTS " + sql)
+
+    conn.execute("DROP TABLE daily_activity")
+    conn.execute("DROP TABLE book_stats")
+    conn.execute('''CREATE TABLE daily_activity
+                    (day INTEGER PRIMARY KEY,
+                    pages INTEGER NOT NULL DEFAULT 0,
+                    book_minutes INTEGER NOT NULL DEFAULT 0,
+                    article_minutes INTEGER NOT NULL DEFAULT 0,
+                    book_sessions INTEGER NOT NULL DEFAULT 0,
+                    article_sessions INTEGER NOT NULL DEFAULT 0) WITHOUT ROWID''')
+    _create_book_stats(conn, "INTEGER")
+    _fill_summaries(conn)
+    conn.execute("ANALYZE")
+
+
+def _add_settings(conn):
+    """Kullanıcı ayarları (örn. seçili tema) için anahtar/değer tablosu"""
+    conn.execute('''CREATE TABLE IF NOT EXISTS settings
+                    (key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL) WITHOUT ROWID''')
+
+
+def _add_filtered_sort_indexes(conn):
+    """Yazar/kaynak önek filtresi için paylaşılan indeksler.
+
+    Önek verilince liste önce o sütuna göre sıralanır (bkz.
+    queries.prefix_order); sütunla (NOCASE) başlayıp tablonun varsayılan
+    durum sırasıyla süren tek bir indeks hem önek aralığını hem varsayılan
+    görünümü sıralı okur, `distinct_values` da bu indeksten okunur. Bunların
+    başı olan eski tek sütunlu NOCASE indeksleri kaldırılır. Önekle başka
+    bir sıralama ya da durum filtresiyle başka bir sıralama gibi seyrek
+    birleşimler indeksle daraltılıp geçici sıralamayla sıralanır.
+
+    Duraklatılanlar artık düz start_date ile sıralandığından varsayılan
+    kısmi indeksleri yeniden kurulur. İlk göçün durum indeksleri kısmi ve
+    sıralama indeksleriyle karşılandığından kaldırılır; planlayıcının onları
+    seçip geçici sıralama yapmasının da önüne geçilir.
+    """
+    conn.execute("DROP INDEX IF EXISTS idx_books_status")
+    conn.execute("DROP INDEX IF EXISTS idx_articles_status")
+    conn.execute("DROP INDEX IF EXISTS idx_books_filter_paused")
+    conn.execute('''CREATE INDEX idx_books_filter_paused ON books(start_date DESC, id DESC)
+                    WHERE is_currently_reading=0 AND end_date IS NULL AND start_date IS NOT NULL''')
+
+    conn.execute("DROP INDEX IF EXISTS idx_books_author_nocase")
+    conn.execute('''CREATE INDEX idx_books_author ON books(
+                        author COLLATE NOCASE,
+                        CASE
+                            WHEN is_currently_reading=1 THEN 1
+                            WHEN end_date IS NOT NULL THEN 4
+                            WHEN start_date IS NULL THEN 3
+                            ELSE 2
+                        END,
+                        COALESCE(added_date, 0) DESC, id DESC)''')
+    for column in ("author", "source"):
+        conn.execute(f"DROP INDEX IF EXISTS idx_articles_{column}_nocase")
+        conn.execute(f'''CREATE INDEX idx_articles_{column} ON articles(
+                            {column} COLLATE NOCASE, is_read, COALESCE(added_date, 0) DESC, id DESC)''')
+    conn.execute("ANALYZE")
+
+
+def _rebuild_table(conn, table, create_sql, columns):
+    """Tabloyu yeni şemayla kurar ve satırları taşır (SQLite'ın önerdiği yöntem).
+
+    ALTER TABLE'ın yapamadığı değişiklikler (ifade varsayılanı, NOT NULL
+    kaldırma) için kullanılır. `create_sql` tablo adı yerine `{table}`
+    içerir; `columns` {yeni sütun: eski tablodaki değer ifadesi}dir. Tablonun
+    indeks ve tetikleyicileri yeniden kurulur, AUTOINCREMENT sayacı korunur.
+    """
+    dependents = conn.execute("""SELECT sql FROM sqlite_master
+                                 WHERE tbl_name = ? AND type IN ('index', 'trigger')
+                                 AND sql IS NOT NULL""", (table,)).fetchall()
+    sequence = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)).fetchone()
+    conn.execute(create_sql.format(table=f"{table}_new"))
+    conn.execute(f"""INSERT INTO {table}_new ({', '.join(columns)})
+                     SELECT {', '.join(columns.values())} FROM {table}""")
+    conn.execute(f"DROP TABLE {table}")
+    conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+    if sequence is not None:
+        conn.execute("DELETE FROM sqlite_sequence WHERE name = ?", (table,))
+        conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (table, sequence[0]))
+    for (sql,) in dependents:
+        conn.execute(sql)
+
+
+def _restore_date_defaults(conn):
+    """Tarih sütunlarının 9. göçte kaybolan anlamlarını geri getirir.
+
+    ADD COLUMN ifade varsayılanına izin vermediğinden `added_date` sütunları
+    varsayılansız kalmıştı; sütunu vermeyen eklemeler (ham SQL, dış
+    yazıcılar) NULL yazıyordu. Kitap ve makale tabloları varsayılanı şimdiki
+    yerel saat olan sütunla yeniden kurulur. Okunamayan oturum tarihleri 0
+    (1970-01-01) yapılmıştı; oturum tabloları NULL'a izin verecek şekilde
+    yeniden kurulur, 0 tarihler NULL olur ve özet tablolar bu oturumları
+    atlayarak yeniden doldurulur.
+    """
+    added = "added_date INTEGER DEFAULT (CAST(strftime('%s', 'now', 'localtime') AS INTEGER))"
+    _rebuild_table(conn, "books", f'''CREATE TABLE {{table}}
+                        (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        title TEXT NOT NULL,
+                        author TEXT,
+                        total_pages INTEGER,
+                        current_page INTEGER DEFAULT 0,
+                        start_date INTEGER,
+                        end_date INTEGER,
+                        is_currently_reading INTEGER DEFAULT 0,
+                        rating INTEGER,
+                        notes TEXT,
+                        {added})''',
+                   {column: column for column in ("id", "title", "author", "total_pages", "current_page",
+                                                  "start_date", "end_date", "is_currently_reading",
+                                                  "rating", "notes", "added_date")})
+    _rebuild_table(conn, "articles", f'''CREATE TABLE {{table}}
+                        (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        title TEXT NOT NULL,
+                        author TEXT,
+                        source TEXT,
+                        url TEXT,
+                        read_date INTEGER,
+                        is_read INTEGER DEFAULT 0,
+                        rating INTEGER,
+                        notes TEXT,
+                        {added})''',
+                   {column: column for column in ("id", "title", "author", "source", "url", "read_date",
+                                                  "is_read", "rating", "notes", "added_date")})
+    _rebuild_table(conn, "reading_sessions", '''CREATE TABLE {table}
+                        (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        book_id INTEGER NOT NULL,
+                        date INTEGER,
+                        pages_read INTEGER NOT NULL,
+                        minutes_spent INTEGER,
+                        day INTEGER GENERATED ALWAYS AS (date / 86400) VIRTUAL,
+                        FOREIGN KEY(book_id) REFERENCES books(id) ON DELETE CASCADE)''',
+                   {"id": "id", "book_id": "book_id", "date": "NULLIF(date, 0)",
+                    "pages_read": "pages_read", "minutes_spent": "minutes_spent"})
+    _rebuild_table(conn, "article_reading_sessions", '''CREATE TABLE {table}
+                        (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        article_id INTEGER NOT NULL,
+                        date INTEGER,
+                        minutes_spent INTEGER NOT NULL,
+                        day INTEGER GENERATED ALWAYS AS (date / 86400) VIRTUAL,
+                        FOREIGN KEY(article_id) REFERENCES articles(id) ON DELETE CASCADE)''',
+                   {"id": "id", "article_id": "article_id", "date": "NULLIF(date, 0)",
+                    "minutes_spent": "minutes_spent"})
+
+    _fill_summaries(conn)
+    # Yeniden kurulan indekslerin istatistikleri tablo silinirken gitmişti
+    conn.execute("ANALYZE")
+
+
+def _delete_orphan_sessions(conn):
+    """Silinmiş kitap ve makalelerin oturumlarını özetlerden çıkarır.
+
+    Yabancı anahtarlar kapalı olduğundan kayıt silmek oturumlarını
+    silmiyordu; bu oturumlar günlük ve yıllık özetlerde sayılmaya devam
+    ediyordu. Sahipsiz oturumlar silinir ve (varsa) özetler yeniden doldurulur.
+    """
+    orphans = conn.execute('''DELETE FROM reading_sessions
+                              WHERE book_id NOT IN (SELECT id FROM books)''').rowcount
+    orphans += conn.execute('''DELETE FROM article_reading_sessions
+                               WHERE article_id NOT IN (SELECT id FROM articles)''').rowcount
+    conn.execute("DELETE FROM book_stats WHERE book_id NOT IN (SELECT id FROM books)")
+    if orphans:
+        _fill_summaries(conn)
+
+
+MIGRATIONS = [
+    _add_hot_query_indexes,
+    _add_stats_counters,
+    _add_daily_activity,
+    _add_search_index,
+    _add_list_indexes,
+    _add_history_indexes,
+    _add_book_stats,
+    _add_item_activity,
+    _store_dates_as_integers,
+    _add_settings,
+    _add_filtered_sort_indexes,
+    _restore_date_defaults,
+    _delete_orphan_sessions,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def migrate(db):
+    """Bekleyen göçleri sırayla uygular, uygulanan göç sayısını döndürür"""
+    version = db.query_one("PRAGMA user_version")[0]
+    for number, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+        with db.transaction() as conn:
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {number}")
+    return max(SCHEMA_VERSION - version, 0)
+
+
+def initialize(db):
+    """Tabloları oluşturur ve bekleyen göçleri uygular"""
+    with db.transaction() as conn:
+        create_tables(conn)
+    return migrate(db)
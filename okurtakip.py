@@ -1,15 +1,24 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
-from datetime import datetime, timedelta
-import sqlite3
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.dates import DateFormatter
-from PIL import Image, ImageTk
+from tkinter import ttk, messagebox, simpledialog, filedialog
+from datetime import datetime
 import os
+import argparse
+
+import core
+from core import DB_NAME
+from database import Database
+from migrations import initialize
+from queries import book_query, article_query, distinct_values
+from widgets import VirtualTreeview
+from worker import QueryService, RefreshScheduler
+from themes import ThemeEngine
+from search import search
+from dates import format_datetime
+import profiler
+import tracing
 
 class ReadingTrackerApp:
-    def __init__(self, root):
+    def __init__(self, root, debug=False):
         self.root = root
         self.root.title("Okur Takip")
         self.root.geometry("1200x750")
@@ -139,12 +148,41 @@ class ReadingTrackerApp:
             }
         }
         
-        # Varsayılan tema
+        # Varsayılan tema; kaydedilmiş bir tema varsa açılışta o uygulanır
         self.current_theme = "Modern Açık"
         
+        # Temalar bir kez ttk temalarına derlenir (bkz. themes.py)
+        self.theme_engine = ThemeEngine(root, self.themes)
+        
         # Veritabanı bağlantısı
-        self.db_name = "reading_tracker.db"
+        self.db_name = DB_NAME
+        self.db = Database(self.db_name)
         self._initialize_database()
+        saved_theme = core.get_setting(self.db, "theme")
+        if saved_theme in self.themes:
+            self.current_theme = saved_theme
+        
+        # Sorgular arka plan thread'lerinde çalışır; uzun bir içe aktarma
+        # sürerken listeler ikinci thread'de yüklenmeye devam eder
+        self.queries = QueryService(root, on_busy=self._set_busy, on_error=self._show_error,
+                                    max_workers=2)
+        
+        # Liste ve istatistik yenilemeleri aynı boşta turunda birleştirilir;
+        # görünümü yenilemek için yükleyicisi yerine `self.refresh.mark` çağrılır
+        self.refresh = RefreshScheduler(root)
+        self.refresh.register("books", self.load_books)
+        self.refresh.register("articles", self.load_articles)
+        self.refresh.register("stats", self.update_stats)
+        
+        # Grafik ve analizlerin okuduğu sütunlu oturum önbelleği (bkz. session_cache.py);
+        # grafik ya da analiz ilk açıldığında oluşturulur (bkz. `_session_cache`)
+        self.sessions = None
+        
+        # Menü
+        self._create_menu()
+        
+        # Filtre değişikliklerinden sonra bekleyen yeniden yüklemeler
+        self._reload_jobs = {}
         
         # Ana çerçeveler
         self._create_main_frames()
@@ -155,17 +193,36 @@ class ReadingTrackerApp:
         # Tema sekmesini ekle
         self._create_theme_tab()
         
-        # Varsayılan temayı uygula
-        self.apply_theme(self.current_theme)
+        # Gizli performans sekmesi
+        self._create_debug_tab()
+        if debug:
+            self.toggle_debug_tab()
+        
+        # Temayı uygula
+        self.apply_theme(self.current_theme, save=False)
         
         # Verileri yükle
-        self.load_books()
-        self.load_articles()
-        self.update_stats()
+        self.refresh.mark("books", "articles", "stats")
         
         # Başlangıçta kitap sekmesini göster
         self.show_books_tab()
 
+    def _create_menu(self):
+        """Dosya menüsü"""
+        menubar = tk.Menu(self.root)
+        file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="İçe Aktar...", command=self.import_dialog)
+        export_menu = tk.Menu(file_menu, tearoff=0)
+        export_menu.add_command(label="CSV...", command=lambda: self.export_dialog("csv"))
+        export_menu.add_command(label="JSON Lines...", command=lambda: self.export_dialog("jsonl"))
+        export_menu.add_command(label="Sütunlu...", command=lambda: self.export_dialog("columnar"))
+        file_menu.add_cascade(label="Dışa Aktar", menu=export_menu)
+        file_menu.add_command(label="Yedekle...", command=self.backup_dialog)
+        file_menu.add_separator()
+        file_menu.add_command(label="Çıkış", command=self.root.destroy)
+        menubar.add_cascade(label="Dosya", menu=file_menu)
+        self.root.config(menu=menubar)
+
     def _create_main_frames(self):
         """Ana çerçeveleri oluştur"""
         # Header frame
@@ -188,9 +245,11 @@ class ReadingTrackerApp:
         self.books_frame = ttk.Frame(self.notebook)
         self.articles_frame = ttk.Frame(self.notebook)
         self.theme_frame = ttk.Frame(self.notebook)
+        self.debug_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.books_frame, text="Kitaplar")
         self.notebook.add(self.articles_frame, text="Makaleler")
         self.notebook.add(self.theme_frame, text="Tema")
+        self.notebook.add(self.debug_frame, text="Performans", state="hidden")
 
     def _create_theme_tab(self):
         """Tema seçimi sekmesini oluştur"""
@@ -246,75 +305,138 @@ class ReadingTrackerApp:
         self.preview_tree_sel = self.preview_canvas.create_rectangle(10, 110, 790, 130, fill="#4a6fa5", outline="")
         self.preview_tree_sel_text = self.preview_canvas.create_text(20, 120, anchor=tk.W, text="Seçili Satır", fill="white", font=("Segoe UI", 10))
 
-    def apply_theme(self, theme_name):
-        """Seçilen temayı uygular"""
+    def _create_debug_tab(self):
+        """İşlem süreleri sekmesi; Ctrl+Shift+D ile gösterilir/gizlenir"""
+        toolbar = ttk.Frame(self.debug_frame)
+        toolbar.pack(fill=tk.X, padx=10, pady=(10, 5))
+        ttk.Button(toolbar, text="Yenile", command=self.refresh_debug_tab).pack(side=tk.LEFT, padx=5)
+        ttk.Button(toolbar, text="Temizle", command=self.clear_traces).pack(side=tk.LEFT, padx=5)
+        ttk.Button(toolbar, text="Chrome İzi Kaydet...",
+                   command=self.export_trace_dialog).pack(side=tk.LEFT, padx=5)
+        self.debug_label = ttk.Label(toolbar, text="")
+        self.debug_label.pack(side=tk.RIGHT, padx=5)
+        
+        tree_frame = ttk.Frame(self.debug_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 5))
+        columns = ("name", "count", "p50", "p90", "p99", "max", "sql", "rows", "items")
+        self.debug_tree = ttk.Treeview(tree_frame, columns=columns, show="headings")
+        headings = ("İşlem", "Sayı", "p50 ms", "p90 ms", "p99 ms", "En Uzun ms",
+                    "SQL", "Satır", "Tk Öğesi")
+        for column, heading in zip(columns, headings):
+            self.debug_tree.heading(column, text=heading)
+            self.debug_tree.column(column, width=90, anchor=tk.E)
+        self.debug_tree.column("name", width=220, anchor=tk.W)
+        
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.debug_tree.yview)
+        self.debug_tree.configure(yscroll=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.debug_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # SQL ifadeleri (toplam süreye göre)
+        sql_frame = ttk.Frame(self.debug_frame)
+        sql_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(5, 10))
+        columns = ("sql", "count", "total", "mean", "max", "rows")
+        self.sql_tree = ttk.Treeview(sql_frame, columns=columns, show="headings")
+        headings = ("SQL İfadesi", "Sayı", "Toplam ms", "Ortalama ms", "En Uzun ms", "Satır")
+        for column, heading in zip(columns, headings):
+            self.sql_tree.heading(column, text=heading)
+            self.sql_tree.column(column, width=90, anchor=tk.E)
+        self.sql_tree.column("sql", width=500, anchor=tk.W)
+        
+        scrollbar = ttk.Scrollbar(sql_frame, orient=tk.VERTICAL, command=self.sql_tree.yview)
+        self.sql_tree.configure(yscroll=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.sql_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        self._debug_job = None
+        self.root.bind("<Control-Shift-D>", lambda e: self.toggle_debug_tab())
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
+
+    def toggle_debug_tab(self):
+        """Performans sekmesini gösterir ya da gizler"""
+        if self.notebook.tab(self.debug_frame, "state") == "hidden":
+            self.notebook.tab(self.debug_frame, state="normal")
+            self.notebook.select(self.debug_frame)
+        else:
+            self.notebook.tab(self.debug_frame, state="hidden")
+            self.show_books_tab()
+
+    def _on_tab_changed(self, event):
+        """Performans sekmesi açıkken tabloyu saniyede bir yeniler"""
+        if self._debug_job is not None:
+            self.root.after_cancel(self._debug_job)
+            self._debug_job = None
+        if self.notebook.select() == str(self.debug_frame):
+            self._debug_tick()
+
+    def _debug_tick(self):
+        self.refresh_debug_tab()
+        self._debug_job = self.root.after(1000, self._debug_tick)
+
+    def refresh_debug_tab(self):
+        """İşlem başına yüzdelikleri tabloya yazar"""
+        rows = tracing.summary()
+        self.debug_tree.delete(*self.debug_tree.get_children())
+        for row in rows:
+            self.debug_tree.insert("", tk.END, values=(
+                row.name, row.count,
+                f"{row.p50:.2f}", f"{row.p90:.2f}", f"{row.p99:.2f}", f"{row.max:.2f}",
+                f"{row.statements:.1f}", f"{row.rows:.0f}", f"{row.items:.0f}"))
+        text = f"{len(tracing.events())}/{tracing.CAPACITY} olay (ortalama SQL, satır ve öğe sayıları)"
+        if not tracing.sql_enabled():
+            text += " - SQL izleme kapalı: --debug ya da OKURTAKIP_TRACE=1 ile başlatın"
+        self.debug_label.config(text=text)
+        
+        self.sql_tree.delete(*self.sql_tree.get_children())
+        for row in profiler.statements():
+            self.sql_tree.insert("", tk.END, values=(
+                " ".join(row.sql.split()), row.count, f"{row.total_ms:.1f}",
+                f"{row.total_ms / row.count:.3f}", f"{row.max_ms:.2f}", row.rows))
+
+    def clear_traces(self):
+        tracing.clear()
+        profiler.clear()
+        self.refresh_debug_tab()
+
+    def export_trace_dialog(self):
+        """Olayları Chrome trace-event JSON dosyasına yazar"""
+        path = filedialog.asksaveasfilename(
+            title="Chrome İzi Kaydet", defaultextension=".json",
+            initialfile=f"okurtakip-trace-{datetime.now():%Y%m%d-%H%M%S}.json",
+            filetypes=[("JSON", "*.json"), ("Tüm dosyalar", "*.*")])
+        if not path:
+            return
+        count = tracing.export_chrome_trace(path)
+        messagebox.showinfo("Performans", f"{count} olay kaydedildi: {path}\n"
+                                          "chrome://tracing ya da ui.perfetto.dev ile açılabilir.")
+
+    @tracing.traced
+    def apply_theme(self, theme_name, save=True):
+        """Seçilen temaya geçer; `save` ise seçim ayarlara kaydedilir.
+
+        Temalar açılışta ttk temalarına derlenmiştir (bkz. themes.py);
+        geçiş stilleri yeniden yapılandırmaz ve listeleri yeniden yüklemez.
+        """
         if theme_name not in self.themes:
             return
             
         self.current_theme = theme_name
         theme = self.themes[theme_name]
         
-        # Ana arka plan rengi
+        # Ana arka plan rengi (ttk dışı)
         self.root.config(bg=theme["bg"])
         
-        # Stilleri güncelle
-        style = ttk.Style()
-        style.theme_use("clam")
-        
-        # Genel stiller
-        style.configure(".", 
-                       background=theme["bg"], 
-                       foreground=theme["fg"],
-                       font=theme["text_font"])
-        
-        style.configure("TFrame", background=theme["bg"])
-        style.configure("TLabel", 
-                       background=theme["bg"], 
-                       foreground=theme["fg"],
-                       font=theme["text_font"])
-        
-        style.configure("Header.TLabel", 
-                       font=theme["header_font"])
-        
-        style.configure("TButton", 
-                       background=theme["button_bg"],
-                       foreground=theme["button_fg"],
-                       font=theme["text_font"], 
-                       padding=5)
-        
-        style.configure("Accent.TButton", 
-                       background=theme["accent"], 
-                       foreground=theme["button_fg"])
-        
-        style.configure("TNotebook", background=theme["bg"])
-        style.configure("TNotebook.Tab", 
-                       background=theme["bg"], 
-                       foreground=theme["fg"], 
-                       font=theme["header_font"], 
-                       padding=[10, 5])
-        
-        # Treeview stilleri
-        style.configure("Treeview", 
-                       background=theme["tree_bg"],
-                       foreground=theme["tree_fg"],
-                       fieldbackground=theme["tree_bg"],
-                       rowheight=25,
-                       font=theme["text_font"])
-        
-        style.configure("Treeview.Heading", 
-                       background=theme["accent"],
-                       foreground="white",
-                       font=theme["header_font"])
-        
-        style.map("Treeview", 
-                 background=[("selected", theme["tree_select"])],
-                 foreground=[("selected", "white")])
+        # Derlenmiş temaya geç
+        self.theme_engine.use(theme_name)
         
         # Önizlemeyi güncelle
         self.update_preview(theme)
         
         # Tüm widget'ları yenile
         self.refresh_widgets()
+        
+        if save:
+            core.set_setting(self.db, "theme", theme_name)
 
     def update_preview(self, theme):
         """Tema önizlemesini günceller"""
@@ -329,16 +451,17 @@ class ReadingTrackerApp:
         self.preview_canvas.itemconfig(self.preview_tree_sel, fill=theme["tree_select"])
         self.preview_canvas.itemconfig(self.preview_tree_sel_text, fill="white", font=theme["text_font"])
 
+    @tracing.traced
     def refresh_widgets(self):
-        """Tüm widget'ları tema değişikliği için yeniler"""
+        """Tüm widget'ları tema değişikliği için yeniler.
+
+        ttk stilleri widget'lara kendiliğinden uygulanır; listeler yeniden
+        yüklenmez, veritabanına sorgu gitmez.
+        """
         # Notebook sekme renklerini güncelle
         for tab in [self.books_frame, self.articles_frame, self.theme_frame]:
             tab_id = self.notebook.index(tab)
             self.notebook.tab(tab_id, text=self.notebook.tab(tab_id, "text"))
-        
-        # Treeview'ları yeniden yükle
-        self.load_books()
-        self.load_articles()
 
     def _create_widgets(self):
         """Tüm widget'ları oluştur"""
@@ -349,9 +472,12 @@ class ReadingTrackerApp:
 
     def _create_header_widgets(self):
         """Başlık çerçevesi widget'ları"""
-        # Logo
+        # Logo (Pillow yalnızca simge dosyası varsa yüklenir)
         try:
-            img = Image.open("book_icon.png") if os.path.exists("book_icon.png") else None
+            img = None
+            if os.path.exists("book_icon.png"):
+                from PIL import Image, ImageTk
+                img = Image.open("book_icon.png")
             if img:
                 img = img.resize((40, 40), Image.LANCZOS)
                 self.logo_img = ImageTk.PhotoImage(img)
@@ -375,40 +501,260 @@ class ReadingTrackerApp:
         self.book_filter = tk.StringVar(value="all")
         ttk.Radiobutton(
             btn_frame, text="Tümü", variable=self.book_filter, value="all",
-            command=self.load_books
+            command=lambda: self.refresh.mark("books")
         ).pack(side=tk.LEFT, padx=5)
         ttk.Radiobutton(
             btn_frame, text="Okuyor", variable=self.book_filter, value="reading",
-            command=self.load_books
+            command=lambda: self.refresh.mark("books")
         ).pack(side=tk.LEFT, padx=5)
         ttk.Radiobutton(
             btn_frame, text="Bitirdi", variable=self.book_filter, value="completed",
-            command=self.load_books
+            command=lambda: self.refresh.mark("books")
         ).pack(side=tk.LEFT, padx=5)
         ttk.Radiobutton(
             btn_frame, text="Okunacak", variable=self.book_filter, value="unread",
-            command=self.load_books
+            command=lambda: self.refresh.mark("books")
+        ).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(
+            btn_frame, text="Duraklatıldı", variable=self.book_filter, value="paused",
+            command=lambda: self.refresh.mark("books")
         ).pack(side=tk.LEFT, padx=5)
+        
+        # Arama kutusu
+        ttk.Label(btn_frame, text="Ara:").pack(side=tk.LEFT, padx=(15, 5))
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(btn_frame, textvariable=self.search_var, width=30)
+        self.search_entry.pack(side=tk.LEFT)
+        self.search_entry.bind("<KeyRelease>", self._schedule_search)
+        self.search_entry.bind("<Down>", lambda e: self._focus_search_results())
+        self.search_entry.bind("<Escape>", lambda e: self._hide_search_results())
+        self._search_job = None
+        self._search_results = []
+        
+        # Arama sonuçları açılır listesi
+        self.search_popup = tk.Toplevel(self.root)
+        self.search_popup.overrideredirect(True)
+        self.search_popup.withdraw()
+        self.search_list = tk.Listbox(self.search_popup, width=60, height=10, activestyle="dotbox")
+        self.search_list.pack(fill=tk.BOTH, expand=True)
+        self.search_list.bind("<Double-1>", lambda e: self._open_search_result())
+        self.search_list.bind("<Return>", lambda e: self._open_search_result())
+        self.search_list.bind("<Escape>", lambda e: self._hide_search_results())
+        
+        # Meşgul göstergesi (arka planda sorgu varken görünür)
+        self.busy_indicator = ttk.Progressbar(self.header_frame, mode="indeterminate", length=80)
+        self.busy_indicator.grid(row=0, column=3, padx=(20, 0))
+        self.busy_indicator.grid_remove()
+        self.status_label = ttk.Label(self.header_frame)
+        self.status_label.grid(row=0, column=4, padx=(10, 0))
+
+    def _set_busy(self, busy):
+        """Meşgul göstergesini açar/kapatır"""
+        if busy:
+            self.busy_indicator.grid()
+            self.busy_indicator.start(15)
+        else:
+            self.busy_indicator.stop()
+            self.busy_indicator.grid_remove()
+
+    # Arama işlemleri
+    def _schedule_search(self, event=None):
+        """Yazma durduktan kısa süre sonra aramayı başlatır"""
+        if event is not None and event.keysym in ("Down", "Escape", "Return"):
+            return
+        if self._search_job is not None:
+            self.root.after_cancel(self._search_job)
+        self._search_job = self.root.after(250, self._run_search)
+
+    @tracing.traced
+    def _run_search(self):
+        """Aramayı arka planda çalıştırır"""
+        self._search_job = None
+        self.queries.submit("search", search, self.db, self.search_var.get(),
+                            callback=self._show_search_results)
+
+    def _show_search_results(self, results):
+        """Arama sonuçlarını arama kutusunun altında listeler"""
+        self._search_results = results
+        self.search_list.delete(0, tk.END)
+        if not results:
+            self._hide_search_results()
+            return
+        for kind, item_id, title, author in results:
+            label = "Kitap" if kind == "book" else "Makale"
+            self.search_list.insert(tk.END, f"[{label}] {title}" + (f" - {author}" if author else ""))
+        x = self.search_entry.winfo_rootx()
+        y = self.search_entry.winfo_rooty() + self.search_entry.winfo_height()
+        self.search_popup.geometry(f"+{x}+{y}")
+        self.search_popup.deiconify()
+        self.search_popup.lift()
+
+    def _hide_search_results(self):
+        self.search_popup.withdraw()
+
+    def _focus_search_results(self):
+        if self._search_results:
+            self.search_list.focus_set()
+            self.search_list.selection_clear(0, tk.END)
+            self.search_list.selection_set(0)
+            self.search_list.activate(0)
+
+    def _open_search_result(self):
+        """Seçilen sonucun detaylarını açar"""
+        selection = self.search_list.curselection()
+        if not selection:
+            return
+        kind, item_id, _, _ = self._search_results[selection[0]]
+        self._hide_search_results()
+        if kind == "book":
+            self.show_book_details(item_id)
+        else:
+            self.show_article_details(item_id)
+
+    # İçe aktarma
+    def import_dialog(self):
+        """Dışa aktarım dosyalarını seçtirip arka planda içe aktarır"""
+        if self.queries.pending("import"):
+            messagebox.showinfo("Bilgi", "Bir içe aktarma zaten sürüyor.")
+            return
+        paths = filedialog.askopenfilenames(
+            title="İçe Aktar",
+            filetypes=[("Goodreads/Calibre/Pocket/Zotero", "*.csv *.json *.jsonl *.bib *.html"),
+                       ("Tüm dosyalar", "*.*")])
+        if not paths:
+            return
+        self.status_label.config(text="İçe aktarılıyor...")
+        self.queries.submit("import", self.import_files, paths,
+                            callback=self._import_finished,
+                            errback=self._import_failed,
+                            progress=self._import_progress)
+
+    def import_files(self, paths, progress=None):
+        """Dosyaları sırayla içe aktarır, toplam sonucu döndürür"""
+        from importer import import_file, ImportResult
+        results = [import_file(self.db, path, progress=progress) for path in paths]
+        return ImportResult(*map(sum, zip(*results)))
+
+    def _import_progress(self, processed):
+        self.status_label.config(text=f"İçe aktarılıyor: {processed} kayıt")
+
+    def _import_finished(self, result):
+        self.status_label.config(text="")
+        self.refresh.mark("books", "articles", "stats")
+        messagebox.showinfo(
+            "İçe Aktarma",
+            f"{result.books} kitap ve {result.articles} makale eklendi.\n"
+            f"{result.duplicates} tekrar eden ve {result.skipped} geçersiz kayıt atlandı.")
+
+    def _import_failed(self, error):
+        self.status_label.config(text="")
+        # Başarılı partiler kaydedilmiş olabilir
+        self.refresh.mark("books", "articles", "stats")
+        messagebox.showerror("Hata", f"İçe aktarma başarısız: {error}")
+
+    # Dışa aktarma ve yedekleme
+    def export_dialog(self, fmt):
+        """Tüm tabloları seçilen klasöre arka planda yazar"""
+        directory = filedialog.askdirectory(title="Dışa Aktarılacak Klasör")
+        if not directory:
+            return
+        import exporter
+        self.status_label.config(text="Dışa aktarılıyor...")
+        self.queries.submit(
+            "export", exporter.export_all, self.db, directory, fmt,
+            callback=lambda counts: self._export_finished(directory, counts),
+            errback=self._background_failed,
+            progress=lambda table, count: self.status_label.config(
+                text=f"Dışa aktarıldı: {table} ({count} satır)"))
+
+    def _export_finished(self, directory, counts):
+        self.status_label.config(text="")
+        messagebox.showinfo("Dışa Aktarma", f"{sum(counts.values())} satır {directory} klasörüne yazıldı.")
+
+    def backup_dialog(self):
+        """Veritabanının sıcak yedeğini arka planda alır"""
+        path = filedialog.asksaveasfilename(
+            title="Yedekle", defaultextension=".db",
+            initialfile=f"reading_tracker_{datetime.now().strftime('%Y%m%d')}.db",
+            filetypes=[("SQLite veritabanı", "*.db"), ("Tüm dosyalar", "*.*")])
+        if not path:
+            return
+        import exporter
+        self.status_label.config(text="Yedekleniyor...")
+        self.queries.submit(
+            "backup", exporter.backup, self.db, path,
+            callback=lambda _: self._backup_finished(path),
+            errback=self._background_failed,
+            progress=lambda remaining, total: self.status_label.config(
+                text=f"Yedekleniyor: %{100 * (total - remaining) // max(total, 1)}"))
+
+    def _backup_finished(self, path):
+        self.status_label.config(text="")
+        messagebox.showinfo("Yedekleme", f"Yedek alındı: {path}")
+
+    def _background_failed(self, error):
+        self.status_label.config(text="")
+        messagebox.showerror("Hata", f"İşlem başarısız: {error}")
+
+    def _show_error(self, error):
+        """Arka plan işinde oluşan hatayı gösterir"""
+        messagebox.showerror("Hata", f"Veritabanı işlemi başarısız: {error}")
 
     def _create_books_tab(self):
         """Kitaplar sekmesi widget'ları"""
+        # Sütun filtreleri (durum filtresi başlıktadır)
+        filter_frame = ttk.Frame(self.books_frame)
+        filter_frame.pack(fill=tk.X, pady=5)
+        
+        self.book_author_filter = tk.StringVar()
+        self.book_min_progress = tk.StringVar()
+        self.book_max_progress = tk.StringVar()
+        
+        ttk.Label(filter_frame, text="Yazar:").pack(side=tk.LEFT, padx=(5, 2))
+        self._filter_combobox(filter_frame, self.book_author_filter, "books", "author")
+        
+        ttk.Label(filter_frame, text="İlerleme (%):").pack(side=tk.LEFT, padx=(15, 2))
+        ttk.Spinbox(filter_frame, from_=0, to=100, increment=10, width=5,
+                    textvariable=self.book_min_progress).pack(side=tk.LEFT)
+        ttk.Label(filter_frame, text="-").pack(side=tk.LEFT, padx=2)
+        ttk.Spinbox(filter_frame, from_=0, to=100, increment=10, width=5,
+                    textvariable=self.book_max_progress).pack(side=tk.LEFT)
+        
+        ttk.Button(
+            filter_frame, text="Filtreleri Temizle",
+            command=lambda: self._clear_filters(
+                (self.book_author_filter, self.book_min_progress, self.book_max_progress))
+        ).pack(side=tk.LEFT, padx=15)
+        
+        # İsteğe bağlı istatistik sütunları (book_stats önbelleğinden okunur)
+        self.show_book_stats = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            filter_frame, text="İstatistik sütunları", variable=self.show_book_stats,
+            command=self.toggle_book_stats_columns
+        ).pack(side=tk.RIGHT, padx=5)
+        
+        for var in (self.book_author_filter, self.book_min_progress, self.book_max_progress):
+            var.trace_add("write", lambda *args: self._schedule_reload("books"))
+        
         # Treeview ve scrollbar
         tree_frame = ttk.Frame(self.books_frame)
         tree_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        self.books_tree = ttk.Treeview(
+        self.books_tree = VirtualTreeview(
             tree_frame, 
-            columns=("id", "title", "author", "progress", "status"), 
+            columns=("id", "title", "author", "progress", "status", *self.book_stats_headings),
+            displaycolumns=("id", "title", "author", "progress", "status"),
             show="headings",
             selectmode="browse"
         )
         
-        # Sütunlar
-        self.books_tree.heading("id", text="ID")
-        self.books_tree.heading("title", text="Kitap Adı")
-        self.books_tree.heading("author", text="Yazar")
-        self.books_tree.heading("progress", text="İlerleme")
-        self.books_tree.heading("status", text="Durum")
+        # Sütunlar; başlığa tıklamak sıralamayı değiştirir
+        self.book_sort = (None, False)
+        self.book_headings = {"id": "ID", "title": "Kitap Adı", "author": "Yazar",
+                              "progress": "İlerleme", "status": "Durum"}
+        for column in self.book_headings:
+            self.books_tree.heading(column, command=lambda c=column: self.sort_books(c))
+        self._show_sort(self.books_tree, self.book_headings, self.book_sort)
         
         # Sütun genişlikleri
         self.books_tree.column("id", width=50, anchor=tk.CENTER)
@@ -416,6 +762,9 @@ class ReadingTrackerApp:
         self.books_tree.column("author", width=200)
         self.books_tree.column("progress", width=100, anchor=tk.CENTER)
         self.books_tree.column("status", width=100, anchor=tk.CENTER)
+        for column, text in self.book_stats_headings.items():
+            self.books_tree.heading(column, text=text)
+            self.books_tree.column(column, width=90, anchor=tk.CENTER)
         
         # Scrollbar
         scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.books_tree.yview)
@@ -457,23 +806,52 @@ class ReadingTrackerApp:
 
     def _create_articles_tab(self):
         """Makaleler sekmesi widget'ları"""
+        # Sütun filtreleri
+        filter_frame = ttk.Frame(self.articles_frame)
+        filter_frame.pack(fill=tk.X, pady=5)
+        
+        self.article_status_filter = tk.StringVar(value="Tümü")
+        self.article_author_filter = tk.StringVar()
+        self.article_source_filter = tk.StringVar()
+        
+        ttk.Label(filter_frame, text="Durum:").pack(side=tk.LEFT, padx=(5, 2))
+        ttk.Combobox(filter_frame, textvariable=self.article_status_filter, width=10,
+                     values=list(self.article_statuses), state="readonly").pack(side=tk.LEFT)
+        
+        ttk.Label(filter_frame, text="Yazar:").pack(side=tk.LEFT, padx=(15, 2))
+        self._filter_combobox(filter_frame, self.article_author_filter, "articles", "author")
+        
+        ttk.Label(filter_frame, text="Kaynak:").pack(side=tk.LEFT, padx=(15, 2))
+        self._filter_combobox(filter_frame, self.article_source_filter, "articles", "source")
+        
+        ttk.Button(
+            filter_frame, text="Filtreleri Temizle",
+            command=lambda: self._clear_filters(
+                (self.article_author_filter, self.article_source_filter),
+                self.article_status_filter)
+        ).pack(side=tk.LEFT, padx=15)
+        
+        for var in (self.article_status_filter, self.article_author_filter, self.article_source_filter):
+            var.trace_add("write", lambda *args: self._schedule_reload("articles"))
+        
         # Treeview ve scrollbar
         tree_frame = ttk.Frame(self.articles_frame)
         tree_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        self.articles_tree = ttk.Treeview(
+        self.articles_tree = VirtualTreeview(
             tree_frame, 
             columns=("id", "title", "author", "source", "status"), 
             show="headings",
             selectmode="browse"
         )
         
-        # Sütunlar
-        self.articles_tree.heading("id", text="ID")
-        self.articles_tree.heading("title", text="Makale Adı")
-        self.articles_tree.heading("author", text="Yazar")
-        self.articles_tree.heading("source", text="Kaynak")
-        self.articles_tree.heading("status", text="Durum")
+        # Sütunlar; başlığa tıklamak sıralamayı değiştirir
+        self.article_sort = (None, False)
+        self.article_headings = {"id": "ID", "title": "Makale Adı", "author": "Yazar",
+                                 "source": "Kaynak", "status": "Durum"}
+        for column in self.article_headings:
+            self.articles_tree.heading(column, command=lambda c=column: self.sort_articles(c))
+        self._show_sort(self.articles_tree, self.article_headings, self.article_sort)
         
         # Sütun genişlikleri
         self.articles_tree.column("id", width=50, anchor=tk.CENTER)
@@ -526,6 +904,9 @@ class ReadingTrackerApp:
         self.graph_frame = ttk.Frame(self.stats_frame)
         self.graph_frame.pack(fill=tk.BOTH, expand=True)
         
+        # Tek Figure/tuval; Matplotlib ilk çizimde yüklenir (bkz. _draw_reading_activity)
+        self.activity_chart = None
+        
         # Hızlı istatistikler
         stats_btn_frame = ttk.Frame(self.stats_frame)
         stats_btn_frame.pack(fill=tk.X, pady=(5, 0))
@@ -545,6 +926,11 @@ class ReadingTrackerApp:
             command=lambda: self.plot_reading_activity(90)
         ).pack(side=tk.LEFT, padx=5)
         
+        ttk.Button(
+            stats_btn_frame, text="Yıllık / Tüm Zamanlar Analizi",
+            command=self.show_analytics
+        ).pack(side=tk.LEFT, padx=5)
+        
         # Hızlı istatistikler
         quick_stats_frame = ttk.Frame(self.stats_frame)
         quick_stats_frame.pack(fill=tk.X, pady=(5, 0))
@@ -564,111 +950,108 @@ class ReadingTrackerApp:
         self.unread_articles_label = ttk.Label(quick_stats_frame, text="Okunacak Makaleler: 0")
         self.unread_articles_label.pack(side=tk.LEFT, padx=10)
 
+    # Sıralama ve filtreler
+    article_statuses = {"Tümü": "all", "Okunacak": "unread", "Okundu": "read"}
+
+    def _filter_combobox(self, master, variable, table, column):
+        """Değerleri açılırken veritabanından okunan filtre kutusu"""
+        box = ttk.Combobox(master, textvariable=variable, width=25)
+        box.configure(postcommand=lambda: box.configure(values=distinct_values(self.db, table, column)))
+        box.pack(side=tk.LEFT)
+        return box
+
+    def _clear_filters(self, variables, status=None):
+        for variable in variables:
+            variable.set("")
+        if status is not None:
+            status.set("Tümü")
+
+    def _schedule_reload(self, key):
+        """Filtre yazımı durduktan kısa süre sonra listeyi yeniden yükler"""
+        job = self._reload_jobs.pop(key, None)
+        if job is not None:
+            self.root.after_cancel(job)
+        self._reload_jobs[key] = self.root.after(300, self._run_reload, key)
+
+    def _run_reload(self, key):
+        del self._reload_jobs[key]
+        self.refresh.mark(key)
+
+    @staticmethod
+    def _next_sort(current, column):
+        """Aynı başlığa tıklamak: artan -> azalan -> varsayılan sıra"""
+        sort, descending = current
+        if sort != column:
+            return column, False
+        if not descending:
+            return column, True
+        return None, False
+
+    @staticmethod
+    def _show_sort(tree, headings, current):
+        """Sıralanan sütunun başlığına yön oku ekler"""
+        sort, descending = current
+        for column, text in headings.items():
+            if column == sort:
+                text += " ▼" if descending else " ▲"
+            tree.heading(column, text=text)
+
+    @staticmethod
+    def _progress_bound(text):
+        try:
+            return float(text.replace(",", ".")) if text.strip() else None
+        except ValueError:
+            return None
+
+    # Kitap listesinin isteğe bağlı sütunları (queries.book_query(with_stats=True) sırasıyla)
+    book_stats_headings = {"pace": "Sayfa/Saat", "finish": "Tahmini Bitiş",
+                           "streak": "En Uzun Seri", "days": "Aktif Gün"}
+
+    def toggle_book_stats_columns(self):
+        """İstatistik sütunlarını gösterir/gizler; gösterilirken sorgu önbelleği de okur"""
+        columns = ["id", "title", "author", "progress", "status"]
+        if self.show_book_stats.get():
+            columns += list(self.book_stats_headings)
+        self.books_tree.configure(displaycolumns=columns)
+        self.refresh.mark("books")
+
+    def sort_books(self, column):
+        self.book_sort = self._next_sort(self.book_sort, column)
+        self._show_sort(self.books_tree, self.book_headings, self.book_sort)
+        self.refresh.mark("books")
+
+    def sort_articles(self, column):
+        self.article_sort = self._next_sort(self.article_sort, column)
+        self._show_sort(self.articles_tree, self.article_headings, self.article_sort)
+        self.refresh.mark("articles")
+
     def _initialize_database(self):
-        """Veritabanı tablolarını oluşturur"""
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            
-            # Kitaplar tablosu
-            c.execute('''CREATE TABLE IF NOT EXISTS books
-                         (id INTEGER PRIMARY KEY AUTOINCREMENT,
-                         title TEXT NOT NULL,
-                         author TEXT,
-                         total_pages INTEGER,
-                         current_page INTEGER DEFAULT 0,
-                         start_date TEXT,
-                         end_date TEXT,
-                         is_currently_reading INTEGER DEFAULT 0,
-                         rating INTEGER,
-                         notes TEXT,
-                         added_date TEXT DEFAULT CURRENT_TIMESTAMP)''')
-            
-            # Makaleler tablosu
-            c.execute('''CREATE TABLE IF NOT EXISTS articles
-                         (id INTEGER PRIMARY KEY AUTOINCREMENT,
-                         title TEXT NOT NULL,
-                         author TEXT,
-                         source TEXT,
-                         url TEXT,
-                         read_date TEXT,
-                         is_read INTEGER DEFAULT 0,
-                         rating INTEGER,
-                         notes TEXT,
-                         added_date TEXT DEFAULT CURRENT_TIMESTAMP)''')
-            
-            # Okuma kayıtları tablosu
-            c.execute('''CREATE TABLE IF NOT EXISTS reading_sessions
-                         (id INTEGER PRIMARY KEY AUTOINCREMENT,
-                         book_id INTEGER NOT NULL,
-                         date TEXT NOT NULL,
-                         pages_read INTEGER NOT NULL,
-                         minutes_spent INTEGER,
-                         FOREIGN KEY(book_id) REFERENCES books(id) ON DELETE CASCADE)''')
-            
-            # Makale okuma kayıtları
-            c.execute('''CREATE TABLE IF NOT EXISTS article_reading_sessions
-                         (id INTEGER PRIMARY KEY AUTOINCREMENT,
-                         article_id INTEGER NOT NULL,
-                         date TEXT NOT NULL,
-                         minutes_spent INTEGER NOT NULL,
-                         FOREIGN KEY(article_id) REFERENCES articles(id) ON DELETE CASCADE)''')
-            
-            conn.commit()
+        """Veritabanı tablolarını oluşturur ve bekleyen göçleri uygular"""
+        initialize(self.db)
 
     # Kitap işlemleri
+    @tracing.traced
     def load_books(self):
-        """Kitapları veritabanından yükler ve treeview'da gösterir"""
-        filter_by = self.book_filter.get()
-        
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            
-            if filter_by == 'completed':
-                c.execute('''SELECT id, title, author, current_page, total_pages, 
-                            ROUND((current_page * 100.0 / total_pages), 1) as progress
-                            FROM books WHERE is_currently_reading=0 AND end_date IS NOT NULL
-                            ORDER BY end_date DESC''')
-            elif filter_by == 'unread':
-                c.execute('''SELECT id, title, author, current_page, total_pages, 
-                            ROUND((current_page * 100.0 / total_pages), 1) as progress
-                            FROM books WHERE is_currently_reading=0 AND start_date IS NULL
-                            ORDER BY added_date DESC''')
-            elif filter_by == 'reading':
-                c.execute('''SELECT id, title, author, current_page, total_pages, 
-                            ROUND((current_page * 100.0 / total_pages), 1) as progress
-                            FROM books WHERE is_currently_reading=1
-                            ORDER BY start_date DESC''')
-            else:
-                c.execute('''SELECT id, title, author, current_page, total_pages, is_currently_reading,
-                            CASE 
-                                WHEN is_currently_reading=1 THEN 'Okuyor'
-                                WHEN end_date IS NOT NULL THEN 'Bitirdi'
-                                WHEN start_date IS NULL THEN 'Okunacak'
-                                ELSE 'Duraklatıldı'
-                            END as status,
-                            ROUND((current_page * 100.0 / total_pages), 1) as progress
-                            FROM books
-                            ORDER BY 
-                                CASE status
-                                    WHEN 'Okuyor' THEN 1
-                                    WHEN 'Duraklatıldı' THEN 2
-                                    WHEN 'Okunacak' THEN 3
-                                    ELSE 4
-                                END, added_date DESC''')
-            
-            books = c.fetchall()
-        
-        # Treeview'ı temizle
-        self.books_tree.delete(*self.books_tree.get_children())
-        
-        # Yeni verileri ekle
-        for book in books:
-            status = book[6] if len(book) > 6 else ''
-            progress = f"{book[5]}%" if len(book) > 5 else '0%'
-            
-            self.books_tree.insert("", tk.END, values=(
-                book[0], book[1], book[2], progress, status
-            ))
+        """Kitapları durum, sütun filtreleri ve seçili sıralamayla yükler"""
+        sort, descending = self.book_sort
+        query = book_query(
+            self.book_filter.get(), sort, descending,
+            author=self.book_author_filter.get().strip() or None,
+            min_progress=self._progress_bound(self.book_min_progress.get()),
+            max_progress=self._progress_bound(self.book_max_progress.get()),
+            with_stats=self.show_book_stats.get())
+        self.queries.submit(
+            "books", self.books_tree.fetch_first_page, self.db, query,
+            callback=lambda result: self.books_tree.load(self.db, query, result)
+        )
+
+    @tracing.traced
+    def _refresh_books(self, book_ids):
+        """Değişen kitap satırlarını günceller; yükleme sürüyorsa yeniden yükler"""
+        if self.queries.pending("books"):
+            self.refresh.mark("books")
+        else:
+            self.books_tree.refresh_rows(book_ids)
 
     def add_book_dialog(self):
         """Yeni kitap ekleme dialog penceresi"""
@@ -721,39 +1104,32 @@ class ReadingTrackerApp:
 
     def save_new_book(self, title, author, pages, start_reading, dialog):
         """Yeni kitabı veritabanına kaydeder"""
-        if not title:
-            messagebox.showerror("Hata", "Kitap adı boş olamaz!")
-            return
-            
         try:
             total_pages = int(pages) if pages else None
         except ValueError:
             messagebox.showerror("Hata", "Sayfa sayısı geçerli bir sayı olmalıdır!")
             return
             
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            current_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            c.execute('''INSERT INTO books (title, author, total_pages, start_date, is_currently_reading)
-                         VALUES (?, ?, ?, ?, ?)''',
-                         (title, author, total_pages, current_date if start_reading else None, 
-                          1 if start_reading else 0))
-            conn.commit()
+        try:
+            book_id = core.add_book(self.db, title, author, total_pages, start_reading)
+        except ValueError as e:
+            messagebox.showerror("Hata", str(e))
+            return
             
         dialog.destroy()
-        self.load_books()
-        self.update_stats()
+        self._refresh_books([book_id])
+        self.refresh.mark("stats")
         messagebox.showinfo("Başarılı", "Kitap başarıyla eklendi!")
 
     def edit_book_dialog(self):
         """Kitap düzenleme dialog penceresi"""
-        selected = self.books_tree.focus()
+        selected = self.books_tree.selected_values()
         if not selected:
             messagebox.showwarning("Uyarı", "Lütfen düzenlemek için bir kitap seçin!")
             return
             
-        book_id = self.books_tree.item(selected)['values'][0]
-        book = self.get_book_details(book_id)
+        book_id = selected[0]
+        book = core.book_details(self.db, book_id)
         
         if not book:
             messagebox.showerror("Hata", "Kitap bilgileri alınamadı!")
@@ -811,10 +1187,6 @@ class ReadingTrackerApp:
 
     def update_book(self, book_id, title, author, total_pages, current_page, dialog):
         """Kitap bilgilerini günceller"""
-        if not title:
-            messagebox.showerror("Hata", "Kitap adı boş olamaz!")
-            return
-            
         try:
             total_pages = int(total_pages) if total_pages else None
             current_page = int(current_page) if current_page else 0
@@ -822,48 +1194,44 @@ class ReadingTrackerApp:
             messagebox.showerror("Hata", "Sayfa sayıları geçerli sayılar olmalıdır!")
             return
             
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            c.execute('''UPDATE books SET title=?, author=?, total_pages=?, current_page=?
-                         WHERE id=?''', 
-                         (title, author, total_pages, current_page, book_id))
-            conn.commit()
+        try:
+            core.update_book(self.db, book_id, title, author, total_pages, current_page)
+        except ValueError as e:
+            messagebox.showerror("Hata", str(e))
+            return
             
         dialog.destroy()
-        self.load_books()
+        self._refresh_books([book_id])
         messagebox.showinfo("Başarılı", "Kitap bilgileri güncellendi!")
 
     def delete_book(self):
         """Seçili kitabı siler"""
-        selected = self.books_tree.focus()
+        selected = self.books_tree.selected_values()
         if not selected:
             messagebox.showwarning("Uyarı", "Lütfen silmek için bir kitap seçin!")
             return
             
-        book_id = self.books_tree.item(selected)['values'][0]
-        book_title = self.books_tree.item(selected)['values'][1]
+        book_id = selected[0]
+        book_title = selected[1]
         
         if not messagebox.askyesno("Onay", f"'{book_title}' adlı kitabı silmek istediğinize emin misiniz?"):
             return
             
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            c.execute("DELETE FROM books WHERE id=?", (book_id,))
-            conn.commit()
+        core.delete_book(self.db, book_id)
             
-        self.load_books()
-        self.update_stats()
+        self._refresh_books([book_id])
+        self.refresh.mark("stats")
         messagebox.showinfo("Başarılı", "Kitap başarıyla silindi!")
 
     def record_progress_dialog(self):
         """Kitap okuma ilerlemesi kaydetme dialogu"""
-        selected = self.books_tree.focus()
+        selected = self.books_tree.selected_values()
         if not selected:
             messagebox.showwarning("Uyarı", "Lütfen ilerleme kaydetmek için bir kitap seçin!")
             return
             
-        book_id = self.books_tree.item(selected)['values'][0]
-        book_title = self.books_tree.item(selected)['values'][1]
+        book_id = selected[0]
+        book_title = selected[1]
         
         dialog = tk.Toplevel(self.root)
         dialog.title(f"İlerleme Kaydet - {book_title}")
@@ -906,46 +1274,29 @@ class ReadingTrackerApp:
         try:
             pages_read = int(pages_read) if pages_read else 0
             minutes_spent = int(minutes_spent) if minutes_spent else None
-            
-            if pages_read <= 0:
-                raise ValueError("Okunan sayfa sayısı pozitif olmalıdır")
-                
-            if minutes_spent is not None and minutes_spent <= 0:
-                raise ValueError("Harcanan süre pozitif olmalıdır")
-                
+            core.log_reading(self.db, book_id, pages_read, minutes_spent)
+            if self.sessions is not None:
+                self.sessions.note_write(self.db)
         except ValueError as e:
             messagebox.showerror("Hata", str(e))
             return
             
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            current_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Okuma oturumunu kaydet
-            c.execute('''INSERT INTO reading_sessions (book_id, date, pages_read, minutes_spent)
-                         VALUES (?, ?, ?, ?)''', (book_id, current_date, pages_read, minutes_spent))
-            
-            # Kitabın mevcut sayfasını güncelle
-            c.execute('''UPDATE books SET current_page = current_page + ?, 
-                         is_currently_reading=1
-                         WHERE id=?''', (pages_read, book_id))
-            
-            conn.commit()
-            
         dialog.destroy()
-        self.load_books()
-        self.update_stats()
+        self._refresh_books([book_id])
+        self.refresh.mark("stats")
         messagebox.showinfo("Başarılı", "Okuma ilerlemesi kaydedildi!")
 
-    def show_book_details(self):
-        """Kitap detaylarını gösterir"""
-        selected = self.books_tree.focus()
-        if not selected:
-            messagebox.showwarning("Uyarı", "Lütfen detaylarını görmek için bir kitap seçin!")
-            return
+    @tracing.traced
+    def show_book_details(self, book_id=None):
+        """Kitap detaylarını gösterir (id verilmezse seçili kitabın)"""
+        if book_id is None:
+            selected = self.books_tree.selected_values()
+            if not selected:
+                messagebox.showwarning("Uyarı", "Lütfen detaylarını görmek için bir kitap seçin!")
+                return
+            book_id = selected[0]
             
-        book_id = self.books_tree.item(selected)['values'][0]
-        book = self.get_book_details(book_id)
+        book = core.book_details(self.db, book_id)
         
         if not book:
             messagebox.showerror("Hata", "Kitap bilgileri alınamadı!")
@@ -955,7 +1306,7 @@ class ReadingTrackerApp:
         dialog.title(f"Kitap Detayları - {book[1]}")
         dialog.transient(self.root)
         dialog.grab_set()
-        dialog.geometry("600x400")
+        dialog.geometry("600x560")
         
         # Notebook (tabbed interface)
         notebook = ttk.Notebook(dialog)
@@ -987,14 +1338,28 @@ class ReadingTrackerApp:
         ttk.Label(general_frame, text=status).grid(row=5, column=1, sticky=tk.W, padx=5, pady=5)
         
         ttk.Label(general_frame, text="Başlama Tarihi:", font=("Segoe UI", 10, "bold")).grid(row=6, column=0, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(general_frame, text=book[5] if book[5] else "-").grid(row=6, column=1, sticky=tk.W, padx=5, pady=5)
+        ttk.Label(general_frame, text=format_datetime(book[5]) or "-").grid(row=6, column=1, sticky=tk.W, padx=5, pady=5)
         
         ttk.Label(general_frame, text="Bitiş Tarihi:", font=("Segoe UI", 10, "bold")).grid(row=7, column=0, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(general_frame, text=book[6] if book[6] else "-").grid(row=7, column=1, sticky=tk.W, padx=5, pady=5)
+        ttk.Label(general_frame, text=format_datetime(book[6]) or "-").grid(row=7, column=1, sticky=tk.W, padx=5, pady=5)
         
         ttk.Label(general_frame, text="Puan:", font=("Segoe UI", 10, "bold")).grid(row=8, column=0, sticky=tk.W, padx=5, pady=5)
         ttk.Label(general_frame, text=book[8] if book[8] is not None else "-").grid(row=8, column=1, sticky=tk.W, padx=5, pady=5)
         
+        # Okuma istatistikleri (book_stats önbelleğinden, oturumlar taranmaz)
+        stats = core.book_stats(self.db, book_id)
+        if stats:
+            rows = [
+                ("Okuma Hızı:", f"{stats.pages_per_hour:.1f} sayfa/saat" if stats.pages_per_hour else "-"),
+                ("Ortalama Oturum:", f"{stats.average_session:.0f} dakika" if stats.average_session else "-"),
+                ("Tahmini Bitiş:", stats.finish_date.isoformat() if stats.finish_date else "-"),
+                ("En Uzun Seri:", f"{stats.longest_streak} gün (şu an {stats.current_streak})"),
+                ("Aktif Gün:", f"{stats.active_days} gün, {stats.sessions} oturum"),
+            ]
+            for row, (label, value) in enumerate(rows, start=9):
+                ttk.Label(general_frame, text=label, font=("Segoe UI", 10, "bold")).grid(row=row, column=0, sticky=tk.W, padx=5, pady=5)
+                ttk.Label(general_frame, text=value).grid(row=row, column=1, sticky=tk.W, padx=5, pady=5)
+        
         # Notlar sekmesi
         notes_frame = ttk.Frame(notebook)
         notebook.add(notes_frame, text="Notlar")
@@ -1023,65 +1388,73 @@ class ReadingTrackerApp:
         tree.column("minutes", width=100, anchor=tk.CENTER)
         
         scrollbar = ttk.Scrollbar(history_frame, orient=tk.VERTICAL, command=tree.yview)
-        tree.configure(yscroll=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # Geçmiş verilerini yükle
-        history = self.get_book_reading_history(book_id)
-        for session in history:
-            tree.insert("", tk.END, values=(
-                session[0], 
-                session[1], 
-                session[2] if session[2] else "-"
-            ))
-
-    def get_book_details(self, book_id):
-        """Kitap detaylarını veritabanından alır"""
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            c.execute('''SELECT id, title, author, total_pages, current_page, 
-                        start_date, end_date, is_currently_reading, rating, notes
-                        FROM books WHERE id=?''', (book_id,))
-            return c.fetchone()
-
-    def get_book_reading_history(self, book_id):
-        """Kitap okuma geçmişini getirir"""
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            c.execute('''SELECT date, pages_read, minutes_spent
-                         FROM reading_sessions
-                         WHERE book_id=?
-                         ORDER BY date DESC''', (book_id,))
-            return c.fetchall()
+        # Geçmiş verilerini arka planda, kaydırıldıkça sayfa sayfa yükle
+        self._load_history(tree, scrollbar, ("book_history", book_id), core.book_history, book_id,
+                           lambda session: (format_datetime(session[0]), session[1],
+                                            session[2] if session[2] else "-"))
+
+    # Geçmiş listesinde bu orana kaydırılınca sonraki sayfa istenir
+    HISTORY_PREFETCH = 0.9
+
+    def _load_history(self, tree, scrollbar, key, fetch, item_id, values):
+        """Okuma geçmişini `fetch` ile sayfa sayfa doldurur.
+
+        `values` bir oturumu satır değerlerine çevirir; tarihler yalnızca
+        burada metne çevrilir.
+
+        İlk sayfa hemen, sonrakiler liste sonuna yaklaşıldıkça arka planda
+        istenir; bir sayfa gelmeden yenisi istenmez.
+        """
+        state = {"after": None, "done": False}
+
+        def request_more(last):
+            if (not state["done"] and float(last) >= self.HISTORY_PREFETCH
+                    and not self.queries.pending(key)):
+                self.queries.submit(key, fetch, self.db, item_id, state["after"],
+                                    callback=fill_history)
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            request_more(last)
+
+        def fill_history(page):
+            if not tree.winfo_exists():
+                return
+            for session in page.rows:
+                tree.insert("", tk.END, values=values(session))
+            tracing.count_items(len(page.rows))
+            state["after"] = page.next
+            state["done"] = page.next is None
+            # Sayfa görünür alanı doldurmadıysa kaydırma olmaz; sonrakini hemen iste
+            tree.after_idle(lambda: tree.winfo_exists() and request_more(tree.yview()[1]))
+
+        tree.configure(yscrollcommand=on_scroll)
+        self.queries.submit(key, fetch, self.db, item_id, callback=fill_history)
 
     # Makale işlemleri
+    @tracing.traced
     def load_articles(self):
-        """Makaleleri veritabanından yükler ve treeview'da gösterir"""
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            c.execute('''SELECT id, title, author, source,
-                        CASE 
-                            WHEN is_read=1 THEN 'Okundu'
-                            ELSE 'Okunacak'
-                        END as status
-                        FROM articles
-                        ORDER BY 
-                            CASE status
-                                WHEN 'Okunacak' THEN 1
-                                ELSE 2
-                            END, added_date DESC''')
-            
-            articles = c.fetchall()
-        
-        # Treeview'ı temizle
-        self.articles_tree.delete(*self.articles_tree.get_children())
-        
-        # Yeni verileri ekle
-        for article in articles:
-            self.articles_tree.insert("", tk.END, values=(
-                article[0], article[1], article[2], article[3], article[4]
-            ))
+        """Makaleleri sütun filtreleri ve seçili sıralamayla yükler"""
+        sort, descending = self.article_sort
+        query = article_query(
+            self.article_statuses.get(self.article_status_filter.get(), "all"), sort, descending,
+            author=self.article_author_filter.get().strip() or None,
+            source=self.article_source_filter.get().strip() or None)
+        self.queries.submit(
+            "articles", self.articles_tree.fetch_first_page, self.db, query,
+            callback=lambda result: self.articles_tree.load(self.db, query, result)
+        )
+
+    @tracing.traced
+    def _refresh_articles(self, article_ids):
+        """Değişen makale satırlarını günceller; yükleme sürüyorsa yeniden yükler"""
+        if self.queries.pending("articles"):
+            self.refresh.mark("articles")
+        else:
+            self.articles_tree.refresh_rows(article_ids)
 
     def add_article_dialog(self):
         """Yeni makale ekleme dialog penceresi"""
@@ -1132,30 +1505,26 @@ class ReadingTrackerApp:
 
     def save_new_article(self, title, author, source, url, dialog):
         """Yeni makaleyi veritabanına kaydeder"""
-        if not title:
-            messagebox.showerror("Hata", "Makale adı boş olamaz!")
+        try:
+            article_id = core.add_article(self.db, title, author, source, url)
+        except ValueError as e:
+            messagebox.showerror("Hata", str(e))
             return
             
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            c.execute('''INSERT INTO articles (title, author, source, url)
-                         VALUES (?, ?, ?, ?)''', (title, author, source, url))
-            conn.commit()
-            
         dialog.destroy()
-        self.load_articles()
-        self.update_stats()
+        self._refresh_articles([article_id])
+        self.refresh.mark("stats")
         messagebox.showinfo("Başarılı", "Makale başarıyla eklendi!")
 
     def edit_article_dialog(self):
         """Makale düzenleme dialog penceresi"""
-        selected = self.articles_tree.focus()
+        selected = self.articles_tree.selected_values()
         if not selected:
             messagebox.showwarning("Uyarı", "Lütfen düzenlemek için bir makale seçin!")
             return
             
-        article_id = self.articles_tree.item(selected)['values'][0]
-        article = self.get_article_details(article_id)
+        article_id = selected[0]
+        article = core.article_details(self.db, article_id)
         
         if not article:
             messagebox.showerror("Hata", "Makale bilgileri alınamadı!")
@@ -1213,52 +1582,44 @@ class ReadingTrackerApp:
 
     def update_article(self, article_id, title, author, source, url, dialog):
         """Makale bilgilerini günceller"""
-        if not title:
-            messagebox.showerror("Hata", "Makale adı boş olamaz!")
+        try:
+            core.update_article(self.db, article_id, title, author, source, url)
+        except ValueError as e:
+            messagebox.showerror("Hata", str(e))
             return
             
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            c.execute('''UPDATE articles SET title=?, author=?, source=?, url=?
-                         WHERE id=?''', 
-                         (title, author, source, url, article_id))
-            conn.commit()
-            
         dialog.destroy()
-        self.load_articles()
+        self._refresh_articles([article_id])
         messagebox.showinfo("Başarılı", "Makale bilgileri güncellendi!")
 
     def delete_article(self):
         """Seçili makaleyi siler"""
-        selected = self.articles_tree.focus()
+        selected = self.articles_tree.selected_values()
         if not selected:
             messagebox.showwarning("Uyarı", "Lütfen silmek için bir makale seçin!")
             return
             
-        article_id = self.articles_tree.item(selected)['values'][0]
-        article_title = self.articles_tree.item(selected)['values'][1]
+        article_id = selected[0]
+        article_title = selected[1]
         
         if not messagebox.askyesno("Onay", f"'{article_title}' adlı makaleyi silmek istediğinize emin misiniz?"):
             return
             
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            c.execute("DELETE FROM articles WHERE id=?", (article_id,))
-            conn.commit()
+        core.delete_article(self.db, article_id)
             
-        self.load_articles()
-        self.update_stats()
+        self._refresh_articles([article_id])
+        self.refresh.mark("stats")
         messagebox.showinfo("Başarılı", "Makale başarıyla silindi!")
 
     def mark_article_as_read(self):
         """Makaleyi okundu olarak işaretler"""
-        selected = self.articles_tree.focus()
+        selected = self.articles_tree.selected_values()
         if not selected:
             messagebox.showwarning("Uyarı", "Lütfen okundu olarak işaretlemek için bir makale seçin!")
             return
             
-        article_id = self.articles_tree.item(selected)['values'][0]
-        article_title = self.articles_tree.item(selected)['values'][1]
+        article_id = selected[0]
+        article_title = selected[1]
         
         # Puan ve notlar için dialog
         dialog = tk.Toplevel(self.root)
@@ -1303,49 +1664,30 @@ class ReadingTrackerApp:
         """Makalenin okundu bilgisini kaydeder"""
         try:
             rating = int(rating) if rating else None
-            if rating is not None and (rating < 0 or rating > 5):
-                raise ValueError("Puan 0-5 arasında olmalıdır")
-                
             minutes = int(minutes) if minutes else 0
-            if minutes < 0:
-                raise ValueError("Süre pozitif olmalıdır")
-                
+            core.mark_article_read(self.db, article_id, rating, notes, minutes)
+            if self.sessions is not None:
+                self.sessions.note_write(self.db)
         except ValueError as e:
             messagebox.showerror("Hata", str(e))
             return
             
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            current_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Makaleyi okundu olarak işaretle
-            c.execute('''UPDATE articles 
-                         SET is_read=1, read_date=?, rating=?, notes=?
-                         WHERE id=?''', 
-                         (current_date, rating, notes, article_id))
-            
-            # Okuma oturumunu kaydet
-            if minutes > 0:
-                c.execute('''INSERT INTO article_reading_sessions (article_id, date, minutes_spent)
-                             VALUES (?, ?, ?)''', 
-                             (article_id, current_date, minutes))
-            
-            conn.commit()
-            
         dialog.destroy()
-        self.load_articles()
-        self.update_stats()
+        self._refresh_articles([article_id])
+        self.refresh.mark("stats")
         messagebox.showinfo("Başarılı", "Makale okundu olarak işaretlendi!")
 
-    def show_article_details(self):
-        """Makale detaylarını gösterir"""
-        selected = self.articles_tree.focus()
-        if not selected:
-            messagebox.showwarning("Uyarı", "Lütfen detaylarını görmek için bir makale seçin!")
-            return
+    @tracing.traced
+    def show_article_details(self, article_id=None):
+        """Makale detaylarını gösterir (id verilmezse seçili makalenin)"""
+        if article_id is None:
+            selected = self.articles_tree.selected_values()
+            if not selected:
+                messagebox.showwarning("Uyarı", "Lütfen detaylarını görmek için bir makale seçin!")
+                return
+            article_id = selected[0]
             
-        article_id = self.articles_tree.item(selected)['values'][0]
-        article = self.get_article_details(article_id)
+        article = core.article_details(self.db, article_id)
         
         if not article:
             messagebox.showerror("Hata", "Makale bilgileri alınamadı!")
@@ -1384,7 +1726,7 @@ class ReadingTrackerApp:
         ttk.Label(general_frame, text=status).grid(row=4, column=1, sticky=tk.W, padx=5, pady=5)
         
         ttk.Label(general_frame, text="Okuma Tarihi:", font=("Segoe UI", 10, "bold")).grid(row=5, column=0, sticky=tk.W, padx=5, pady=5)
-        ttk.Label(general_frame, text=article[5] if article[5] else "-").grid(row=5, column=1, sticky=tk.W, padx=5, pady=5)
+        ttk.Label(general_frame, text=format_datetime(article[5]) or "-").grid(row=5, column=1, sticky=tk.W, padx=5, pady=5)
         
         ttk.Label(general_frame, text="Puan:", font=("Segoe UI", 10, "bold")).grid(row=6, column=0, sticky=tk.W, padx=5, pady=5)
         ttk.Label(general_frame, text=article[7] if article[7] is not None else "-").grid(row=6, column=1, sticky=tk.W, padx=5, pady=5)
@@ -1416,133 +1758,90 @@ class ReadingTrackerApp:
             tree.column("minutes", width=100, anchor=tk.CENTER)
             
             scrollbar = ttk.Scrollbar(history_frame, orient=tk.VERTICAL, command=tree.yview)
-            tree.configure(yscroll=scrollbar.set)
             scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
             tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             
-            # Geçmiş verilerini yükle
-            history = self.get_article_reading_history(article_id)
-            for session in history:
-                tree.insert("", tk.END, values=(session[0], session[1]))
-
-    def get_article_details(self, article_id):
-        """Makale detaylarını veritabanından alır"""
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            c.execute('''SELECT id, title, author, source, url, read_date, 
-                        is_read, rating, notes FROM articles WHERE id=?''', (article_id,))
-            return c.fetchone()
-
-    def get_article_reading_history(self, article_id):
-        """Makale okuma geçmişini getirir"""
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            c.execute('''SELECT date, minutes_spent
-                         FROM article_reading_sessions
-                         WHERE article_id=?
-                         ORDER BY date DESC''', (article_id,))
-            return c.fetchall()
+            # Geçmiş verilerini arka planda, kaydırıldıkça sayfa sayfa yükle
+            self._load_history(tree, scrollbar, ("article_history", article_id),
+                               core.article_history, article_id,
+                               lambda session: (format_datetime(session[0]), session[1]))
 
     # İstatistik işlemleri
+    @tracing.traced
     def update_stats(self):
-        """Hızlı istatistikleri günceller"""
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            
-            # Kitap istatistikleri
-            c.execute("SELECT COUNT(*) FROM books WHERE is_currently_reading=1")
-            current_books = c.fetchone()[0]
-            
-            c.execute("SELECT COUNT(*) FROM books WHERE is_currently_reading=0 AND end_date IS NOT NULL")
-            completed_books = c.fetchone()[0]
-            
-            c.execute("SELECT COUNT(*) FROM books WHERE is_currently_reading=0 AND start_date IS NULL")
-            unread_books = c.fetchone()[0]
-            
-            # Makale istatistikleri
-            c.execute("SELECT COUNT(*) FROM articles WHERE is_read=1")
-            read_articles = c.fetchone()[0]
-            
-            c.execute("SELECT COUNT(*) FROM articles WHERE is_read=0")
-            unread_articles = c.fetchone()[0]
-            
-        # Etiketleri güncelle
+        """Hızlı istatistikleri arka planda okuyup günceller"""
+        self.queries.submit("stats", core.get_stats, self.db, callback=self._show_stats)
+
+    def _show_stats(self, stats):
+        """İstatistik etiketlerini günceller"""
+        current_books, completed_books, unread_books, read_articles, unread_articles = stats
+        
         self.current_books_label.config(text=f"Okuyor: {current_books}")
         self.completed_books_label.config(text=f"Bitirdi: {completed_books}")
         self.unread_books_label.config(text=f"Okunacak: {unread_books}")
         self.read_articles_label.config(text=f"Okunan Makaleler: {read_articles}")
         self.unread_articles_label.config(text=f"Okunacak Makaleler: {unread_articles}")
 
+    @tracing.traced
     def plot_reading_activity(self, days=30):
-        """Okuma aktivitesini görselleştirir"""
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
-        with sqlite3.connect(self.db_name) as conn:
-            c = conn.cursor()
-            
-            # Kitap okuma aktivitesi
-            c.execute('''SELECT date, SUM(pages_read) as pages
-                         FROM reading_sessions
-                         WHERE date BETWEEN ? AND ?
-                         GROUP BY date
-                         ORDER BY date''', 
-                         (start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')))
-            
-            book_data = c.fetchall()
-            
-            # Makale okuma aktivitesi
-            c.execute('''SELECT date, SUM(minutes_spent) as minutes
-                         FROM article_reading_sessions
-                         WHERE date BETWEEN ? AND ?
-                         GROUP BY date
-                         ORDER BY date''', 
-                         (start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')))
-            
-            article_data = c.fetchall()
-        
-        # Grafik çerçevesini temizle
-        for widget in self.graph_frame.winfo_children():
-            widget.destroy()
-        
-        # Verileri işle
-        book_dates = [datetime.strptime(row[0], '%Y-%m-%d') for row in book_data]
-        book_pages = [row[1] for row in book_data]
-        
-        article_dates = [datetime.strptime(row[0], '%Y-%m-%d') for row in article_data]
-        article_minutes = [row[1] for row in article_data]
-        
-        # Grafik oluştur
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 6))
-        
-        # Kitap okuma grafiği
-        if book_dates:
-            ax1.bar(book_dates, book_pages, color='skyblue', label='Okunan Sayfalar')
-            ax1.set_title(f'Son {days} Günlük Kitap Okuma Aktivitesi')
-            ax1.set_ylabel('Sayfa Sayısı')
-            ax1.xaxis.set_major_formatter(DateFormatter('%Y-%m-%d'))
-            ax1.legend()
-        else:
-            ax1.text(0.5, 0.5, 'Veri yok', ha='center', va='center')
-            ax1.set_title(f'Son {days} Günlük Kitap Okuma Aktivitesi')
-        
-        # Makale okuma grafiği
-        if article_dates:
-            ax2.bar(article_dates, article_minutes, color='lightgreen', label='Harcanan Dakikalar')
-            ax2.set_title(f'Son {days} Günlük Makale Okuma Aktivitesi')
-            ax2.set_ylabel('Dakika')
-            ax2.xaxis.set_major_formatter(DateFormatter('%Y-%m-%d'))
-            ax2.legend()
-        else:
-            ax2.text(0.5, 0.5, 'Veri yok', ha='center', va='center')
-            ax2.set_title(f'Son {days} Günlük Makale Okuma Aktivitesi')
-        
-        plt.tight_layout()
-        
-        # Grafiği TKinter'a göm
-        canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        """Okuma aktivitesini arka planda okuyup görselleştirir"""
+        self.queries.submit("activity", core.reading_activity, self.db, days, self._session_cache(),
+                            callback=lambda data: self._draw_reading_activity(days, *data))
+
+    def _session_cache(self):
+        """Oturum önbelleği; NumPy açılışı yavaşlatmasın diye ilk kullanımda oluşturulur.
+        İlk `sync` onu kullanan sorgunun içinde, arka planda yapılır."""
+        if self.sessions is None:
+            from session_cache import SessionCache
+            self.sessions = SessionCache()
+        return self.sessions
+
+    def _draw_reading_activity(self, days, dates, pages, minutes):
+        """Aktivite grafiklerini günceller"""
+        if self.activity_chart is None:
+            # Matplotlib açılışı yavaşlatmasın diye ilk kullanımda içe aktarılır
+            from charts import ActivityChart
+            self.activity_chart = ActivityChart(self.graph_frame)
+        self.activity_chart.update(days, dates, pages, minutes)
+
+    ALL_TIME = "Tüm Zamanlar"
+
+    def show_analytics(self):
+        """Yıllık ve tüm zamanlar analiz penceresini açar (açıksa öne getirir)"""
+        window = getattr(self, "analytics_window", None)
+        if window is not None and window.winfo_exists():
+            window.lift()
+            return
+        import analytics
+        from charts import AnalyticsChart
+        
+        window = self.analytics_window = tk.Toplevel(self.root)
+        window.title("Okuma Analizi")
+        window.geometry("1100x850")
+        
+        top_frame = ttk.Frame(window)
+        top_frame.pack(fill=tk.X, padx=5, pady=5)
+        ttk.Label(top_frame, text="Dönem:").pack(side=tk.LEFT, padx=(0, 5))
+        years = [str(year) for year in reversed(analytics.years(self.db))]
+        period = tk.StringVar(value=years[0] if years else self.ALL_TIME)
+        ttk.Combobox(top_frame, textvariable=period, values=years + [self.ALL_TIME],
+                     state="readonly", width=15).pack(side=tk.LEFT)
+        
+        chart_frame = ttk.Frame(window)
+        chart_frame.pack(fill=tk.BOTH, expand=True)
+        chart = AnalyticsChart(chart_frame)
+        
+        def draw(data):
+            if window.winfo_exists() and data is not None:
+                chart.update(data)
+        
+        def load(*args):
+            year = None if period.get() == self.ALL_TIME else int(period.get())
+            self.queries.submit("analytics", analytics.reading_analytics, self.db, year,
+                                analytics.TOP, self._session_cache(), callback=draw)
+        
+        period.trace_add("write", load)
+        load()
 
     # Yardımcı fonksiyonlar
     def show_books_tab(self):
@@ -1554,9 +1853,34 @@ class ReadingTrackerApp:
         self.notebook.select(self.articles_frame)
 
 def main():
+    parser = argparse.ArgumentParser(description="Okur Takip")
+    parser.add_argument("--check-stats", action="store_true",
+                        help="istatistik sayaçlarını yeniden hesaplayıp doğrular")
+    parser.add_argument("--debug", action="store_true",
+                        help="performans sekmesini açık başlatır")
+    parser.add_argument("--slow-log",
+                        help="yavaş sorgu günlüğü; SQL izlemeyi açar "
+                             "(--debug ile varsayılanı slow_queries.log)")
+    parser.add_argument("--slow-ms", type=float, default=profiler.SLOW_QUERY_MS,
+                        help="yavaş sorgu eşiği (ms)")
+    args = parser.parse_args()
+    if args.check_stats:
+        from cli import main as cli_main
+        cli_main(["check-stats"])
+        return
+    
+    # SQL izleme ifade başına maliyet ekler; yalnızca istenirse açılır (bkz. tracing.py)
+    if args.debug or args.slow_log:
+        tracing.enable_sql()
+    if tracing.sql_enabled():
+        profiler.configure(args.slow_log or "slow_queries.log", args.slow_ms)
     root = tk.Tk()
-    app = ReadingTrackerApp(root)
-    root.mainloop()
+    app = ReadingTrackerApp(root, debug=args.debug)
+    try:
+        root.mainloop()
+    finally:
+        app.queries.shutdown()
+        app.db.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,118 @@
+"""SQL ifadesi profilleyicisi ve yavaş sorgu günlüğü.
+
+Her ifadenin süresi TracedCursor tarafından ölçülür (bkz. tracing.py):
+SELECT'lerde çalıştırma ile satırların okunması birlikte sayılır ve ölçüm
+imleç tükendiğinde, yeniden kullanıldığında ya da kapandığında biter.
+Süreler ifade metnine göre toplanır (`statements`).
+
+`configure` ile yavaş sorgu günlüğü açılırsa eşiği aşan ifadeler
+parametreleri ve EXPLAIN QUERY PLAN çıktısıyla birlikte dönen (rotating)
+bir dosyaya JSON satırları olarak yazılır.
+"""
+import json
+import re
+import sqlite3
+import threading
+from collections import namedtuple
+from datetime import datetime
+
+# Varsayılan yavaş sorgu eşiği (ms)
+SLOW_QUERY_MS = 50
+
+# Toplanan en fazla farklı ifade; sonrakiler tek satırda birleşir
+MAX_STATEMENTS = 500
+OTHER = "(diğer ifadeler)"
+
+StatementStats = namedtuple("StatementStats", "sql count total_ms max_ms rows")
+
+_EXPLAINABLE = re.compile(r"\s*(SELECT|WITH|INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+_SPACES = re.compile(r"\s+")
+
+_lock = threading.Lock()
+_statements = {}
+_logger = None
+_threshold = SLOW_QUERY_MS / 1000
+
+
+def configure(path, threshold_ms=SLOW_QUERY_MS, max_bytes=1024 * 1024, backups=3):
+    """Yavaş sorgu günlüğünü `path` dosyasına açar; `path` None ise kapatır"""
+    global _logger, _threshold
+    # logging yalnızca günlük açılırken gerekir; içe aktarması açılışta ~10 ms sürer
+    import logging
+    import logging.handlers
+    logger = logging.getLogger("okurtakip.slow_queries")
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
+    _threshold = threshold_ms / 1000
+    if path is None:
+        _logger = None
+        return
+    handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups,
+                                                   encoding="utf-8", delay=True)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    _logger = logger
+
+
+def record(conn, sql, params, elapsed, rows):
+    """Bir ifadenin süresini (sn) kaydeder; eşiği aşarsa günlüğe yazar"""
+    with _lock:
+        entry = _statements.get(sql)
+        if entry is None:
+            key = sql if len(_statements) < MAX_STATEMENTS else OTHER
+            entry = _statements.get(key)
+            if entry is None:
+                entry = _statements[key] = [0, 0.0, 0.0, 0]
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] = max(entry[2], elapsed)
+        entry[3] += rows
+    if _logger is not None and elapsed >= _threshold:
+        _log_slow(conn, sql, params, elapsed, rows)
+
+
+def statements(limit=50):
+    """Toplam süresi en yüksek ifadeler"""
+    with _lock:
+        items = [(sql, *entry) for sql, entry in _statements.items()]
+    items.sort(key=lambda item: item[2], reverse=True)
+    return [StatementStats(sql, count, total * 1000, longest * 1000, rows)
+            for sql, count, total, longest, rows in items[:limit]]
+
+
+def clear():
+    with _lock:
+        _statements.clear()
+
+
+def explain(conn, sql, params):
+    """EXPLAIN QUERY PLAN çıktısını girintili satırlar olarak döndürür"""
+    if params is None or not _EXPLAINABLE.match(sql):
+        return None
+    try:
+        # Temel imleç: profilleyiciye yeniden girmez
+        plan = sqlite3.Cursor(conn).execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+    except sqlite3.Error as e:
+        return [f"(plan alınamadı: {e})"]
+    depth = {0: -1}
+    lines = []
+    for node, parent, _, detail in plan:
+        depth[node] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node] + detail)
+    return lines
+
+
+def _log_slow(conn, sql, params, elapsed, rows):
+    entry = {
+        "time": datetime.now().isoformat(timespec="milliseconds"),
+        "ms": round(elapsed * 1000, 3),
+        "rows": rows,
+        "thread": threading.current_thread().name,
+        "sql": _SPACES.sub(" ", sql).strip(),
+        "params": list(params) if isinstance(params, (list, tuple)) else params,
+        "plan": explain(conn, sql, params),
+    }
+    _logger.info(json.dumps(entry, ensure_ascii=False, default=repr))
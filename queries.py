@@ -0,0 +1,296 @@
+"""Liste görünümlerinin sorguları.
+
+Sorgular OFFSET yerine anahtar kümesi (keyset) ile sayfalanır: bir sonraki
+sayfa, önceki sayfanın son satırının sıralama anahtarından sonra başlar.
+Bu yüzden her sıralama tekil bir sütunla (id) bitmelidir ve sıralama
+ifadeleri NULL döndürmemelidir.
+"""
+import string
+
+from book_stats import LIST_COLUMNS as STATS_COLUMNS
+
+NOCASE = " COLLATE NOCASE"
+
+# SQLite'ın NOCASE harmanlaması yalnızca ASCII harfleri eşler
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+class KeysetQuery:
+    """Sıralama anahtarına göre sayfalanan SELECT sorgusu"""
+
+    def __init__(self, table, columns, order_by, where=None, params=(), join=None):
+        self.table = table
+        # Sütunlar için eklenen LEFT JOIN (birebir olmalı; satır sayısını değiştirmez)
+        self.join = join
+        self.columns = list(columns)
+        # (ifade, azalan_mı) çiftleri
+        self.order_by = list(order_by)
+        self.where = where
+        self.params = tuple(params)
+
+    def _after(self, key):
+        """`key` anahtarından sonra gelen satırlar için koşul"""
+        directions = {desc for _, desc in self.order_by}
+        exprs = [expr for expr, _ in self.order_by]
+        if len(directions) == 1:
+            # Tüm yönler aynıysa satır değeri karşılaştırması indeks kullanabilir
+            op = "<" if directions.pop() else ">"
+            placeholders = ", ".join("?" * len(exprs))
+            return f"({', '.join(exprs)}) {op} ({placeholders})", list(key)
+
+        clauses = []
+        params = []
+        for i, (expr, desc) in enumerate(self.order_by):
+            parts = [f"{prev} = ?" for prev in exprs[:i]]
+            parts.append(f"{expr} {'<' if desc else '>'} ?")
+            clauses.append("(" + " AND ".join(parts) + ")")
+            params.extend(key[:i + 1])
+        return "(" + " OR ".join(clauses) + ")", params
+
+    def _where(self, extra=None, extra_params=()):
+        conditions = [c for c in (self.where, extra) if c]
+        params = list(self.params) + list(extra_params)
+        if not conditions:
+            return "", params
+        return " WHERE " + " AND ".join(f"({c})" for c in conditions), params
+
+    def _source(self):
+        return f"{self.table} {self.join}" if self.join else self.table
+
+    def page(self, db, after=None, limit=100, offset=0):
+        """En fazla `limit` satırı (değerler, anahtar) çiftleri olarak döndürür.
+
+        `offset` anahtarı bilinmeyen bir sıraya doğrudan atlamak içindir
+        (örn. kaydırma çubuğuyla); SQLite atlanan satırları indeks üzerinde
+        sayar, Python'a taşımaz. Ardışık sayfalar için `after` kullanılır.
+        """
+        extra, extra_params = self._after(after) if after is not None else (None, ())
+        where, params = self._where(extra, extra_params)
+        select = ", ".join(self.columns + [expr for expr, _ in self.order_by])
+        order = ", ".join(f"{expr} {'DESC' if desc else 'ASC'}" for expr, desc in self.order_by)
+        rows = db.query(f"""SELECT {select} FROM {self._source()}{where} ORDER BY {order}
+                            LIMIT ? OFFSET ?""", params + [limit, offset])
+        n = len(self.columns)
+        return [(row[:n], row[n:]) for row in rows]
+
+    def page_before(self, db, before, limit=100):
+        """`before` anahtarından hemen önceki en fazla `limit` satır, sorgu sırasıyla"""
+        reverse = KeysetQuery(self.table, self.columns, [(expr, not desc) for expr, desc in self.order_by],
+                              self.where, self.params, self.join)
+        return reverse.page(db, before, limit)[::-1]
+
+    def rows_by_id(self, db, row_ids):
+        """Sorguya uyan satırlardan id'si verilenleri {id: (değerler, anahtar)} olarak döndürür"""
+        row_ids = list(row_ids)
+        if not row_ids:
+            return {}
+        placeholders = ", ".join("?" * len(row_ids))
+        where, params = self._where(f"id IN ({placeholders})", row_ids)
+        select = ", ".join(self.columns + [expr for expr, _ in self.order_by])
+        rows = db.query(f"SELECT {select} FROM {self._source()}{where}", params)
+        n = len(self.columns)
+        return {row[0]: (row[:n], row[n:]) for row in rows}
+
+    def compare(self, key_a, key_b):
+        """İki sıralama anahtarını sorgu sırasına göre karşılaştırır (-1, 0, 1).
+
+        `COLLATE NOCASE` ile sıralanan anahtarlar SQLite'taki gibi yalnızca
+        ASCII harflerde büyük/küçük harf farkı gözetmeden karşılaştırılır.
+        """
+        for a, b, (expr, desc) in zip(key_a, key_b, self.order_by):
+            if expr.endswith(NOCASE) and isinstance(a, str) and isinstance(b, str):
+                a, b = a.translate(_ASCII_LOWER), b.translate(_ASCII_LOWER)
+            if a != b:
+                return (-1 if a < b else 1) * (-1 if desc else 1)
+        return 0
+
+    def count(self, db):
+        """Sorgunun toplam satır sayısı"""
+        where, params = self._where()
+        return db.query_one(f"SELECT COUNT(*) FROM {self.table}{where}", params)[0]
+
+
+BOOK_STATUS = '''CASE
+                     WHEN is_currently_reading=1 THEN 'Okuyor'
+                     WHEN end_date IS NOT NULL THEN 'Bitirdi'
+                     WHEN start_date IS NULL THEN 'Okunacak'
+                     ELSE 'Duraklatıldı'
+                 END'''
+
+# Tümü görünümünde durum sırası: Okuyor, Duraklatıldı, Okunacak, Bitirdi
+BOOK_STATUS_RANK = '''CASE
+                          WHEN is_currently_reading=1 THEN 1
+                          WHEN end_date IS NOT NULL THEN 4
+                          WHEN start_date IS NULL THEN 3
+                          ELSE 2
+                      END'''
+
+# Sıralama ve aralık filtresi için sayısal ilerleme (yüzde)
+BOOK_PROGRESS = "COALESCE(current_page * 100.0 / total_pages, 0)"
+
+BOOK_COLUMNS = [
+    "id", "title", "author",
+    "COALESCE(ROUND(current_page * 100.0 / total_pages, 1), 0) || '%'",
+    BOOK_STATUS,
+]
+
+# Durum filtresi: (koşul, varsayılan sıralama)
+BOOK_FILTERS = {
+    'completed': ("is_currently_reading=0 AND end_date IS NOT NULL",
+                  [("end_date", True), ("id", True)]),
+    'unread': ("is_currently_reading=0 AND start_date IS NULL",
+               [("COALESCE(added_date, 0)", True), ("id", True)]),
+    # start_date burada boş olamaz; COALESCE gerekmez
+    'paused': ("is_currently_reading=0 AND end_date IS NULL AND start_date IS NOT NULL",
+               [("start_date", True), ("id", True)]),
+    'reading': ("is_currently_reading=1",
+                [("COALESCE(start_date, 0)", True), ("id", True)]),
+    'all': (None,
+            [(BOOK_STATUS_RANK, False), ("COALESCE(added_date, 0)", True), ("id", True)]),
+}
+
+# Başlığa tıklanarak seçilen sıralamalar (artan yön); son anahtar hep id
+BOOK_SORTS = {
+    'id': [("id", False)],
+    'title': [("title", False), ("id", False)],
+    'author': [("COALESCE(author, '')", False), ("id", False)],
+    'progress': [(BOOK_PROGRESS, False), ("id", False)],
+    'status': BOOK_FILTERS['all'][1],
+}
+
+ARTICLE_COLUMNS = [
+    "id", "title", "author", "source",
+    "CASE WHEN is_read=1 THEN 'Okundu' ELSE 'Okunacak' END",
+]
+
+ARTICLE_SORTS = {
+    'id': [("id", False)],
+    'title': [("title", False), ("id", False)],
+    'author': [("COALESCE(author, '')", False), ("id", False)],
+    'source': [("COALESCE(source, '')", False), ("id", False)],
+    'status': [("is_read", False), ("COALESCE(added_date, 0)", True), ("id", True)],
+}
+
+# Durum filtresi: (koşul, varsayılan sıralama); filtrede is_read sabit olduğundan sıraya girmez
+ARTICLE_FILTERS = {
+    'read': ("is_read=1", [("COALESCE(added_date, 0)", True), ("id", True)]),
+    'unread': ("is_read=0", [("COALESCE(added_date, 0)", True), ("id", True)]),
+    'all': (None, ARTICLE_SORTS['status']),
+}
+
+# Filtre sütunları; `distinct_values` yalnızca bunları kabul eder
+FILTER_COLUMNS = {"books": ("author",), "articles": ("author", "source")}
+
+
+def _order(sorts, sort, descending, default):
+    """Seçilen sıralama; azalan istenirse tüm yönler çevrilir"""
+    if sort is None:
+        return default
+    if sort not in sorts:
+        raise ValueError(f"Geçersiz sıralama: {sort}")
+    return [(expr, desc != descending) for expr, desc in sorts[sort]]
+
+
+def _prefix(column, text):
+    """Büyük/küçük harf duyarsız önek koşulu (NOCASE indeksini kullanır)"""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{column} LIKE ? ESCAPE '\\'", escaped + "%"
+
+
+def prefix_order(column, order_by):
+    """Önek filtresi varken sıra önce filtre sütununa (NOCASE) göredir.
+
+    Böylece varsayılan sıra (sütun NOCASE, durum sırası...) indeksindeki
+    önek aralığından sıralı okunur (bkz. migrations._add_filtered_sort_indexes);
+    diğer sıralamalarda yalnızca aralık sıralanır. Sütunun yönü sıralamanın
+    ilk anahtarını izler; tüm yönler birlikte döner.
+    """
+    return [(column + NOCASE, order_by[0][1])] + list(order_by)
+
+
+def _compile(conditions):
+    """[(koşul, parametreler), ...] listesini tek WHERE ifadesine çevirir"""
+    conditions = [(sql, params) for sql, params in conditions if sql]
+    if not conditions:
+        return None, ()
+    where = " AND ".join(f"({sql})" for sql, _ in conditions)
+    return where, tuple(param for _, params in conditions for param in params)
+
+
+def book_query(status="all", sort=None, descending=False, author=None,
+               min_progress=None, max_progress=None, with_stats=False):
+    """Kitap listesi sorgusu (id, başlık, yazar, ilerleme, durum).
+
+    `status` durum filtresi (bkz. BOOK_FILTERS), `sort` BOOK_SORTS
+    anahtarlarından biridir; verilmezse durumun varsayılan sırası kullanılır.
+    `author` yazar önekidir; verilirse liste önce yazara göre gruplanır
+    (bkz. `prefix_order`). İlerleme sınırları yüzde cinsindendir.
+    `with_stats` ile önbellekteki istatistik sütunları da eklenir
+    (sayfa/saat, tahmini bitiş, en uzun seri, aktif gün; bkz. book_stats.py).
+    """
+    if status not in BOOK_FILTERS:
+        raise ValueError(f"Geçersiz durum: {status}")
+    status_where, default_order = BOOK_FILTERS[status]
+    conditions = [(status_where, ())]
+    if author:
+        sql, param = _prefix("author", author)
+        conditions.append((sql, (param,)))
+    if min_progress is not None:
+        conditions.append((f"{BOOK_PROGRESS} >= ?", (min_progress,)))
+    if max_progress is not None:
+        conditions.append((f"{BOOK_PROGRESS} <= ?", (max_progress,)))
+    where, params = _compile(conditions)
+    order_by = _order(BOOK_SORTS, sort, descending, default_order)
+    if author:
+        order_by = prefix_order("author", order_by)
+    if with_stats:
+        return KeysetQuery("books", BOOK_COLUMNS + STATS_COLUMNS, order_by, where, params,
+                           join="LEFT JOIN book_stats ON book_stats.book_id = books.id")
+    return KeysetQuery("books", BOOK_COLUMNS, order_by, where, params)
+
+
+def article_query(status="all", sort=None, descending=False, author=None, source=None):
+    """Makale listesi sorgusu; varsayılan sıra önce okunmamışlar, sonra en yeniler.
+
+    Önek filtresi varken liste önce ilk filtre sütununa göre gruplanır
+    (yazar, yoksa kaynak; bkz. `prefix_order`).
+    """
+    if status not in ARTICLE_FILTERS:
+        raise ValueError(f"Geçersiz durum: {status}")
+    status_where, default_order = ARTICLE_FILTERS[status]
+    conditions = [(status_where, ())]
+    # Durum filtresinde is_read sabittir: durum sıralaması filtrenin varsayılan sırasıdır
+    order_by = _order(dict(ARTICLE_SORTS, status=default_order), sort, descending, default_order)
+    grouped = False
+    for column, text in (("author", author), ("source", source)):
+        if text:
+            sql, param = _prefix(column, text)
+            conditions.append((sql, (param,)))
+            if not grouped:
+                order_by = prefix_order(column, order_by)
+                grouped = True
+    where, params = _compile(conditions)
+    return KeysetQuery("articles", ARTICLE_COLUMNS, order_by, where, params)
+
+
+# Okuma geçmişi: (tablo, kayıt sütunu, gösterilen sütunlar); yeniden eskiye, (tarih, id) ile sayfalanır
+HISTORY_TABLES = {
+    "book": ("reading_sessions", "book_id", ["date", "pages_read", "minutes_spent"]),
+    "article": ("article_reading_sessions", "article_id", ["date", "minutes_spent"]),
+}
+
+
+def history_query(kind, item_id):
+    """Kitabın ya da makalenin okuma oturumları"""
+    table, column, columns = HISTORY_TABLES[kind]
+    return KeysetQuery(table, columns, [("date", True), ("id", True)], f"{column} = ?", [item_id])
+
+
+def distinct_values(db, table, column, limit=500):
+    """Filtre kutuları için sütunun farklı değerleri, alfabetik"""
+    if column not in FILTER_COLUMNS.get(table, ()):
+        raise ValueError(f"Filtrelenemeyen sütun: {table}.{column}")
+    rows = db.query(f"""SELECT DISTINCT {column} COLLATE NOCASE FROM {table}
+                        WHERE {column} IS NOT NULL AND {column} != ''
+                        ORDER BY 1 LIMIT ?""", (limit,))
+    return [row[0] for row in rows]
@@ -0,0 +1,48 @@
+"""Kitap ve makalelerde tam metin arama (SQLite FTS5).
+
+`search_index` tablosu her kitap ve makale için bir satır tutar; satır
+numarası kitaplar için `id * 2`, makaleler için `id * 2 + 1`'dir. Tablo
+tetikleyicilerle güncel tutulur (bkz. migrations.py).
+
+Türkçe büyük/küçük harf: FTS5'in unicode61 ayırıcısı I'yı i'ye indirir
+ama ı ve İ'yi tanımaz. Bu yüzden hem dizine yazılan metinde hem sorguda
+I, ı ve İ aynı harf (i) sayılır; böylece "ışık", "IŞIK" ve "isik"
+aramaları birbirini bulur.
+"""
+import re
+
+MIN_QUERY_LENGTH = 2
+
+_FOLD_TABLE = str.maketrans({"İ": "i", "I": "i", "ı": "i"})
+_TOKEN = re.compile(r"\w+")
+
+
+def fold(text):
+    """Türkçe I/ı/İ farkını kaldırıp küçük harfe çevirir"""
+    return text.translate(_FOLD_TABLE).lower()
+
+
+def match_expression(text):
+    """Kullanıcı metnini önek (prefix) aramalı bir MATCH ifadesine çevirir"""
+    return " ".join(f'"{token}"*' for token in _TOKEN.findall(fold(text)))
+
+
+def search(db, text, limit=20):
+    """En iyi eşleşmeleri (tür, id, başlık, yazar) olarak döndürür.
+
+    Sıralama bm25 ile yapılır; başlık ve yazar eşleşmeleri daha ağırdır.
+    """
+    if len(text.strip()) < MIN_QUERY_LENGTH:
+        return []
+    match = match_expression(text)
+    if not match:
+        return []
+    rows = db.query('''SELECT hit.rowid, COALESCE(b.title, a.title), COALESCE(b.author, a.author)
+                       FROM (SELECT rowid, rank FROM search_index
+                             WHERE search_index MATCH ?
+                             ORDER BY rank LIMIT ?) AS hit
+                       LEFT JOIN books b ON hit.rowid % 2 = 0 AND b.id = hit.rowid / 2
+                       LEFT JOIN articles a ON hit.rowid % 2 = 1 AND a.id = hit.rowid / 2
+                       ORDER BY hit.rank''', (match, limit))
+    return [("book" if rowid % 2 == 0 else "article", rowid // 2, title, author)
+            for rowid, title, author in rows]
@@ -0,0 +1,450 @@
+"""Yerel ağ için HTTP/JSON API sunucusu.
+
+    python cli.py serve --host 0.0.0.0 --port 8765 --token GİZLİ
+
+E-okuyucu, tarayıcı eklentisi ya da telefon gibi istemcilerin okuma
+oturumu kaydedebilmesi için core.py işlemlerini JSON uç noktaları olarak
+sunar. Yalnızca standart kütüphane (asyncio) kullanılır.
+
+Eşzamanlılık:
+
+* Okumalar `READERS` thread'lik bir havuzda çalışır. `Database` her
+  thread'e kendi bağlantısını verdiği için havuz aynı zamanda bir
+  bağlantı havuzudur; WAL kipinde okumalar birbirini beklemez.
+* Yazmalar tek bir kuyruktan tek yazar thread'inde yapılır. Kuyrukta
+  biriken yazmalar tek işlemde (her biri kendi SAVEPOINT'i ile) commit
+  edilir; böylece yoğun yükte commit sayısı azalır ve bir isteğin hatası
+  diğerlerini geri almaz.
+
+Uç noktalar (tümü /api altında):
+
+    GET    /stats
+    GET    /activity?days=30
+    GET    /search?q=...
+    GET    /books?filter=all|reading|completed|unread|paused&sort=title&desc=1
+                 &author=...&min_progress=0&max_progress=100&limit=100&after=...
+    POST   /books                    {"title", "author", "total_pages", "start_reading"}
+    GET    /books/<id>
+    PUT    /books/<id>               {"title", "author", "total_pages", "current_page"}
+    DELETE /books/<id>
+    GET    /books/<id>/sessions?limit=100&after=...   (yeniden eskiye)
+    POST   /books/<id>/sessions      {"pages", "minutes", "date"}
+    GET    /articles?status=all|read|unread&sort=source&desc=1&author=...&source=...
+                 &limit=100&after=...
+    POST   /articles                 {"title", "author", "source", "url"}
+    GET    /articles/<id>
+    PUT    /articles/<id>            {"title", "author", "source", "url"}
+    DELETE /articles/<id>
+    GET    /articles/<id>/sessions?limit=100&after=...
+    POST   /articles/<id>/read       {"rating", "notes", "minutes", "date"}
+
+Tarihler 'YYYY-MM-DD HH:MM:SS' biçimindedir. Listelerde ve oturum geçmişlerinde `next` değeri bir sonraki sayfa için `after` parametresine
+olduğu gibi verilir.
+"""
+import asyncio
+import hmac
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+
+import core
+from dates import format_datetime, format_day
+from queries import book_query, article_query, history_query
+from search import search
+
+READERS = 4
+
+# Tek işlemde commit edilen en fazla yazma sayısı
+WRITE_BATCH = 64
+
+MAX_BODY = 1 << 20
+
+# /activity?days= için üst sınır (on yıl)
+MAX_ACTIVITY_DAYS = 3650
+
+BOOK_FIELDS = ("id", "title", "author", "total_pages", "current_page", "start_date",
+               "end_date", "is_currently_reading", "rating", "notes")
+ARTICLE_FIELDS = ("id", "title", "author", "source", "url", "read_date", "is_read",
+                  "rating", "notes")
+
+_REASONS = {200: "OK", 201: "Created", 204: "No Content", 400: "Bad Request",
+            401: "Unauthorized", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message=None):
+        super().__init__(message or _REASONS[status])
+        self.status = status
+
+
+def _int_field(body, name, default=None):
+    value = body.get(name, default)
+    if value is None or isinstance(value, int) and not isinstance(value, bool):
+        return value
+    # Yalnızca tam sayı ya da metin; 2.5 gibi değerler sessizce kırpılmaz
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    raise ValueError(f"'{name}' bir tam sayı olmalıdır")
+
+
+def _date_field(body, name):
+    """'YYYY-MM-DD[ HH:MM:SS]' metni ya da saniye (bkz. dates.to_epoch)"""
+    value = body.get(name)
+    if value is None or isinstance(value, str) or isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise ValueError(f"'{name}' bir tarih metni ya da saniye olmalıdır")
+
+
+# Saniye olarak saklanan alanlar; yanıtta 'YYYY-MM-DD HH:MM:SS' olarak verilir (bkz. dates.py)
+DATE_FIELDS = {"start_date", "end_date", "read_date", "date"}
+
+
+def _fields(fields, values):
+    return {field: format_datetime(value) if field in DATE_FIELDS else value
+            for field, value in zip(fields, values)}
+
+
+def _record(fields, row):
+    if row is None:
+        raise HTTPError(404)
+    return _fields(fields, row)
+
+
+def _flag(params, name):
+    return params.get(name, "").lower() in ("1", "true", "yes")
+
+
+def _float_param(params, name):
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"'{name}' sayı olmalıdır") from None
+
+
+def _int_param(params, name, default, low, high):
+    """Tam sayı parametresi; [low, high] aralığına sıkıştırılır"""
+    try:
+        value = int(params.get(name, default))
+    except ValueError:
+        raise HTTPError(400, f"'{name}' bir tam sayı olmalıdır") from None
+    return max(low, min(value, high))
+
+
+def _after_param(params, query):
+    """JSON kodlanmış sıralama anahtarı; her sıralama sütunu için bir değer"""
+    if not params.get("after"):
+        return None
+    try:
+        after = json.loads(params["after"])
+    except ValueError:
+        raise HTTPError(400, "'after' geçerli JSON olmalıdır") from None
+    if (not isinstance(after, list) or len(after) != len(query.order_by)
+            or not all(value is None or isinstance(value, (int, float, str)) for value in after)):
+        raise HTTPError(400, "'after' bir önceki yanıtın 'next' değeri olmalıdır")
+    return after
+
+
+def _page(db, query, params, fields):
+    """Anahtar kümesi sayfası; `after` JSON kodlanmış sıralama anahtarıdır"""
+    limit = _int_param(params, "limit", 100, 1, 1000)
+    rows = query.page(db, _after_param(params, query), limit)
+    return {"items": [_fields(fields, values) for values, _ in rows],
+            "next": json.dumps(list(rows[-1][1])) if len(rows) == limit else None}
+
+
+class Writer:
+    """Tek yazar thread'i ve önündeki kuyruk"""
+
+    def __init__(self, db):
+        self.db = db
+        self.queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="okurtakip-writer")
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, func, *args):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((func, args, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < WRITE_BATCH and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                results = await loop.run_in_executor(self._executor, self._write, batch)
+            except Exception as e:
+                # İşlem başlatılamadı ya da commit edilemedi: partideki herkes hata alır
+                results = [(False, e)] * len(batch)
+            for (_, _, future), (ok, value) in zip(batch, results):
+                if future.cancelled():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
+
+    def _write(self, batch):
+        results = []
+        with self.db.transaction() as conn:
+            for func, args, _ in batch:
+                conn.execute("SAVEPOINT request")
+                try:
+                    value = func(self.db, *args)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO request")
+                    results.append((False, e))
+                else:
+                    results.append((True, value))
+                conn.execute("RELEASE request")
+        return results
+
+    async def close(self):
+        if self._task:
+            self._task.cancel()
+        self._executor.shutdown(wait=True)
+
+
+class APIServer:
+    """asyncio üzerinde HTTP/1.1 (keep-alive) JSON sunucusu"""
+
+    def __init__(self, db, token=None, readers=READERS):
+        self.db = db
+        self.token = token
+        self.readers = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="okurtakip-reader")
+        self.writer = Writer(db)
+        self.routes = [
+            ("GET", r"/api/stats", self.stats),
+            ("GET", r"/api/activity", self.activity),
+            ("GET", r"/api/search", self.search),
+            ("GET", r"/api/books", self.list_books),
+            ("POST", r"/api/books", self.add_book),
+            ("GET", r"/api/books/(\d+)", self.get_book),
+            ("PUT", r"/api/books/(\d+)", self.update_book),
+            ("DELETE", r"/api/books/(\d+)", self.delete_book),
+            ("GET", r"/api/books/(\d+)/sessions", self.book_sessions),
+            ("POST", r"/api/books/(\d+)/sessions", self.log_reading),
+            ("GET", r"/api/articles", self.list_articles),
+            ("POST", r"/api/articles", self.add_article),
+            ("GET", r"/api/articles/(\d+)", self.get_article),
+            ("PUT", r"/api/articles/(\d+)", self.update_article),
+            ("DELETE", r"/api/articles/(\d+)", self.delete_article),
+            ("GET", r"/api/articles/(\d+)/sessions", self.article_sessions),
+            ("POST", r"/api/articles/(\d+)/read", self.mark_article_read),
+        ]
+        self.routes = [(method, re.compile(pattern + "$"), handler)
+                       for method, pattern, handler in self.routes]
+
+    async def read(self, func, *args):
+        """Okuma havuzunda `func(db, *args)` çalıştırır"""
+        return await asyncio.get_running_loop().run_in_executor(self.readers, func, self.db, *args)
+
+    # Uç noktalar
+    async def stats(self, params, body):
+        return (await self.read(core.get_stats))._asdict()
+
+    async def activity(self, params, body):
+        days = _int_param(params, "days", 30, 1, MAX_ACTIVITY_DAYS)
+        dates, pages, minutes = await self.read(core.reading_activity, days)
+        return [{"date": format_day(d), "pages": p, "article_minutes": m}
+                for d, p, m in zip(dates, pages, minutes)]
+
+    async def search(self, params, body):
+        results = await self.read(search, params.get("q", ""), _int_param(params, "limit", 20, 1, 100))
+        return [{"kind": kind, "id": item_id, "title": title, "author": author}
+                for kind, item_id, title, author in results]
+
+    async def list_books(self, params, body):
+        query = book_query(params.get("filter", "all"), params.get("sort"), _flag(params, "desc"),
+                           author=params.get("author"),
+                           min_progress=_float_param(params, "min_progress"),
+                           max_progress=_float_param(params, "max_progress"))
+        return await self.read(_page, query, params, ("id", "title", "author", "progress", "status"))
+
+    async def get_book(self, params, body, book_id):
+        return _record(BOOK_FIELDS, await self.read(core.book_details, int(book_id)))
+
+    async def book_sessions(self, params, body, book_id):
+        return await self.read(_page, history_query("book", int(book_id)), params,
+                               ("date", "pages", "minutes"))
+
+    async def add_book(self, params, body):
+        book_id = await self.writer.submit(
+            core.add_book, body.get("title"), body.get("author"),
+            _int_field(body, "total_pages"), bool(body.get("start_reading")))
+        return 201, {"id": book_id}
+
+    async def update_book(self, params, body, book_id):
+        book = await self.get_book(params, body, book_id)
+        await self.writer.submit(
+            core.update_book, int(book_id), body.get("title", book["title"]),
+            body.get("author", book["author"]), _int_field(body, "total_pages", book["total_pages"]),
+            _int_field(body, "current_page", book["current_page"]))
+        return await self.get_book(params, body, book_id)
+
+    async def delete_book(self, params, body, book_id):
+        await self.writer.submit(core.delete_book, int(book_id))
+        return 204, None
+
+    async def log_reading(self, params, body, book_id):
+        await self.writer.submit(core.log_reading, int(book_id), _int_field(body, "pages", 0),
+                                 _int_field(body, "minutes"), _date_field(body, "date"))
+        return 201, await self.get_book(params, body, book_id)
+
+    async def list_articles(self, params, body):
+        query = article_query(params.get("status", "all"), params.get("sort"), _flag(params, "desc"),
+                              author=params.get("author"), source=params.get("source"))
+        return await self.read(_page, query, params,
+                               ("id", "title", "author", "source", "status"))
+
+    async def get_article(self, params, body, article_id):
+        return _record(ARTICLE_FIELDS, await self.read(core.article_details, int(article_id)))
+
+    async def article_sessions(self, params, body, article_id):
+        return await self.read(_page, history_query("article", int(article_id)), params,
+                               ("date", "minutes"))
+
+    async def add_article(self, params, body):
+        article_id = await self.writer.submit(
+            core.add_article, body.get("title"), body.get("author"),
+            body.get("source"), body.get("url"))
+        return 201, {"id": article_id}
+
+    async def update_article(self, params, body, article_id):
+        article = await self.get_article(params, body, article_id)
+        await self.writer.submit(
+            core.update_article, int(article_id), body.get("title", article["title"]),
+            body.get("author", article["author"]), body.get("source", article["source"]),
+            body.get("url", article["url"]))
+        return await self.get_article(params, body, article_id)
+
+    async def delete_article(self, params, body, article_id):
+        await self.writer.submit(core.delete_article, int(article_id))
+        return 204, None
+
+    async def mark_article_read(self, params, body, article_id):
+        await self.writer.submit(core.mark_article_read, int(article_id),
+                                 _int_field(body, "rating"), body.get("notes"),
+                                 _int_field(body, "minutes", 0), _date_field(body, "date"))
+        return await self.get_article(params, body, article_id)
+
+    # HTTP
+    async def dispatch(self, method, target, headers, body):
+        # Sabit süreli karşılaştırma: yanıt süresi jetonun ne kadarının tuttuğunu ele vermez
+        if self.token and not hmac.compare_digest(
+                headers.get("authorization", "").encode("latin-1"),
+                f"Bearer {self.token}".encode("utf-8")):
+            raise HTTPError(401)
+        url = urlsplit(target)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        allowed = False
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(url.path)
+            if match:
+                if route_method != method:
+                    allowed = True
+                    continue
+                if body:
+                    try:
+                        body = json.loads(body)
+                    except ValueError:
+                        raise HTTPError(400, "Geçersiz JSON")
+                    if not isinstance(body, dict):
+                        raise HTTPError(400, "Gövde bir JSON nesnesi olmalıdır")
+                result = await handler(params, body or {}, *match.groups())
+                return result if isinstance(result, tuple) else (200, result)
+        raise HTTPError(405 if allowed else 404)
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                # Gövde okunamazsa (geçersiz uzunluk, 413) akış sonraki istek için
+                # güvenilmez; yanıttan sonra bağlantı kapatılır
+                framed = False
+                try:
+                    try:
+                        length = int(headers.get("content-length", 0) or 0)
+                    except ValueError:
+                        raise HTTPError(400, "Geçersiz Content-Length") from None
+                    if length < 0:
+                        raise HTTPError(400, "Geçersiz Content-Length")
+                    if length > MAX_BODY:
+                        raise HTTPError(413)
+                    body = await reader.readexactly(length) if length else b""
+                    framed = True
+                    status, payload = await self.dispatch(method.upper(), target, headers, body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except core.NotFoundError as e:
+                    status, payload = 404, {"error": str(e)}
+                except (ValueError, KeyError, OverflowError) as e:
+                    # OverflowError: SQLite'a ya da tarihe sığmayan tam sayı
+                    status, payload = 400, {"error": str(e)}
+                except Exception as e:
+                    status, payload = 500, {"error": str(e)}
+
+                keep_alive = (framed and headers.get("connection", "").lower() != "close"
+                              and version.upper() == "HTTP/1.1")
+                data = b"" if payload is None else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                head = (f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                        f"Content-Type: application/json; charset=utf-8\r\n"
+                        f"Content-Length: {len(data)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+                writer.write(head.encode("latin-1") + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host="127.0.0.1", port=8765, ready=None):
+        self.writer.start()
+        server = await asyncio.start_server(self.handle, host, port)
+        if ready:
+            ready(server)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.writer.close()
+            self.readers.shutdown(wait=True)
+
+
+def run(db, host="127.0.0.1", port=8765, token=None):
+    """Sunucuyu Ctrl+C'ye kadar çalıştırır"""
+    api = APIServer(db, token)
+    try:
+        asyncio.run(api.serve(host, port, ready=lambda server: print(
+            "Dinleniyor: " + ", ".join(f"http://{s.getsockname()[0]}:{s.getsockname()[1]}"
+                                       for s in server.sockets), flush=True)))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,161 @@
+"""Okuma oturumlarının bellekte sütunlu (NumPy) kopyası.
+
+Kitap ve makale oturumları bir kez okunur ve her biri için üç int32
+dizisi tutulur: gün numarası (bkz. dates.py), sayfa ve dakika. Gün
+aralığındaki günlük toplamlar bu diziler üzerinde vektörel olarak
+hesaplanır; SQL'e ve satır satır Python döngüsüne gerek kalmaz.
+
+Oturumlar yalnızca eklendiği için önbellek artımlı güncellenir: yalnızca
+son okunan id'den sonraki satırlar okunur. Aynı bağlantıdan yazan kod
+`note_write` ile yeni satırları hemen ekletir; başka bir bağlantının
+yazdığı `PRAGMA data_version` ile (önbelleği okuyan her bağlantı için
+ayrı) anlaşılır. Satır sayısı günlük özetteki oturum sayısını tutmazsa
+(örn. silinen oturum) önbellek baştan okunur; sayım özetten okunduğu için
+oturum tablolarını taramaz.
+
+Kayıt (yazar/kaynak) başına toplamlar burada tutulmaz: adlar her seferinde
+veritabanından okunmak zorunda olduğundan yıllık kayıt özeti üzerindeki
+SQL daha hızlıdır (bkz. analytics.py).
+
+NumPy, arayüzün açılışını yavaşlatmasın diye ilk kullanımda içe aktarılır.
+"""
+import threading
+
+# (tablo, sayfa ifadesi)
+TABLES = {
+    "book": ("reading_sessions", "pages_read"),
+    "article": ("article_reading_sessions", "0"),
+}
+
+# Tarihli oturumların sayısı, TABLES sırasıyla (günlük özette tutulur, bkz. activity.py)
+COUNTS_SQL = '''SELECT COALESCE(SUM(book_sessions), 0), COALESCE(SUM(article_sessions), 0)
+                FROM daily_activity'''
+
+FIELDS = ("day", "pages", "minutes")
+
+
+class _Columns:
+    """Büyüyebilen int32 sütunları; kapasite doldukça iki katına çıkar.
+
+    Güne göre tüm zamanların toplamları ilk istendiğinde hesaplanır,
+    sonraki eklemelerde yerinde güncellenir.
+    """
+
+    def __init__(self):
+        import numpy as np
+        self.size = 0
+        self.last_id = 0
+        self._data = np.zeros((len(FIELDS), 0), dtype=np.int32)
+        self._first_day = self._day_count = 0
+        self._by_day = {}
+
+    def __getattr__(self, name):
+        try:
+            return self._data[FIELDS.index(name), :self.size]
+        except ValueError:
+            raise AttributeError(name) from None
+
+    def append(self, rows):
+        """(id, gün, sayfa, dakika) satırlarını ekler"""
+        import numpy as np
+        if not rows:
+            return
+        block = np.array(rows, dtype=np.int64)
+        needed = self.size + len(block)
+        if needed > self._data.shape[1]:
+            grown = np.zeros((len(FIELDS), max(needed, 2 * self._data.shape[1])), dtype=np.int32)
+            grown[:, :self.size] = self._data[:, :self.size]
+            self._data = grown
+        self._data[:, self.size:needed] = block[:, 1:].T
+        start, self.size = self.size, needed
+        self.last_id = int(block[-1, 0])
+        self._update_totals(start)
+
+    def _update_totals(self, start):
+        """Hesaplanmış toplamlara `start`tan sonraki satırları ekler.
+
+        `_Columns` kendi başına iş parçacığı güvenli değildir; tüm çağrılar
+        SessionCache'in kilidi altında yapılır.
+        """
+        import numpy as np
+        days = self.day[start:]
+        if self._by_day and (days.min() < self._first_day
+                             or days.max() >= self._first_day + self._day_count):
+            self._by_day = {}
+        for field, totals in self._by_day.items():
+            np.add.at(totals, days - self._first_day, getattr(self, field)[start:])
+
+    def by_day(self, field):
+        """(ilk gün, gün başına toplam dizisi)"""
+        import numpy as np
+        if field not in self._by_day:
+            days = self.day
+            if not self._by_day:
+                self._first_day = int(days.min()) if self.size else 0
+                # Gelecek eklemeler için bir yıllık pay
+                self._day_count = (int(days.max()) - self._first_day + 1 if self.size else 0) + 366
+            self._by_day[field] = np.bincount(days - self._first_day, weights=getattr(self, field),
+                                              minlength=self._day_count).astype(np.int64)
+        return self._first_day, self._by_day[field]
+
+
+class SessionCache:
+    """Kitap ve makale oturumlarının sütunlu önbelleği (bkz. modül açıklaması)"""
+
+    def __init__(self):
+        # Eşitleme ve toplamlar aynı kilitle yapılır: toplam sözlükleri eklemeyle
+        # birlikte güncellenir, okuyan iş parçacığı yarım güncelleme görmez
+        self._lock = threading.RLock()
+        self._columns = None
+        # data_version bağlantıya özeldir: her bağlantının son gördüğü değer
+        self._versions = {}
+
+    def note_write(self, db):
+        """`db`nin bu thread'deki bağlantısından oturum yazıldı; yeni satırları ekler.
+
+        Önbellek henüz doldurulmadıysa bir şey yapmaz (ilk `sync` hepsini okur).
+        """
+        with self._lock:
+            if self._columns is not None:
+                self._update(db)
+
+    def sync(self, db):
+        """Önbelleği veritabanıyla eşitler, {tür: sütunlar} döndürür"""
+        with self._lock:
+            conn = db.conn
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if self._columns is not None and version == self._versions.get(conn):
+                return self._columns
+            self._versions[conn] = version
+            self._update(db)
+            return self._columns
+
+    def _update(self, db):
+        """Yeni satırları ekler; sayım tutmazsa önbelleği baştan okur"""
+        with db.snapshot():
+            if self._columns is None or not self._append_new(db):
+                self._columns = {kind: _Columns() for kind in TABLES}
+                self._append_new(db)
+
+    def _append_new(self, db):
+        """Son id'den sonraki satırları ekler; satır sayısı tutmazsa False"""
+        for kind, (table, pages) in TABLES.items():
+            columns = self._columns[kind]
+            columns.append(db.query(f'''SELECT id, day, {pages}, COALESCE(minutes_spent, 0)
+                                       FROM {table} WHERE id > ? AND day IS NOT NULL ORDER BY id''',
+                                    (columns.last_id,)))
+        counts = db.query_one(COUNTS_SQL)
+        return all(count == columns.size for count, columns in zip(counts, self._columns.values()))
+
+    # Vektörel toplamlar
+    def daily(self, db, kind, field, first_day, last_day):
+        """[first_day, last_day] gün numarası aralığındaki her gün için `field` toplamı"""
+        import numpy as np
+        with self._lock:
+            offset, totals = self.sync(db)[kind].by_day(field)
+            first, last = first_day - offset, last_day - offset
+            result = np.zeros(last - first + 1, dtype=np.int64)
+            low, high = max(first, 0), min(last + 1, len(totals))
+            if low < high:
+                result[low - first:high - first] = totals[low:high]
+            return result
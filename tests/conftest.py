@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Testler depo kökündeki modülleri (core, queries, ...) doğrudan içe aktarır
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
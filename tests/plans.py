@@ -0,0 +1,50 @@
+"""EXPLAIN QUERY PLAN yardımcıları (test_query_plans.py ve test_queries.py).
+
+Bir plan geçerlidir, eğer:
+
+* beklenen indeksi kullanıyorsa (ad plan metninde geçer),
+* indekssiz tablo taraması (`SCAN tablo`) yoksa; indeks sırasıyla
+  okunan `SCAN tablo USING INDEX ...` kabul edilir, LIMIT'te durur,
+* geçici sıralama (`USE TEMP B-TREE`) yoksa.
+"""
+import core
+from benchmarks.generate import generate
+
+# Sayfa boyutu; ikinci sayfa `after` koşulunun planını da denetler
+PAGE = 20
+
+
+def library(path):
+    """Göçlerle kurulmuş, ANALYZE edilmiş sentetik kütüphane (bkz. benchmarks/generate.py)"""
+    generate(path, books=2000, articles=1000, sessions=20000, article_sessions=5000)
+    return core.open_database(path)
+
+
+def plans(db, func, *args):
+    """`func(db, *args)` çalışırken yürütülen SELECT'lerin planları"""
+    statements = []
+    conn = db.conn
+    conn.set_trace_callback(statements.append)
+    try:
+        func(db, *args)
+    finally:
+        conn.set_trace_callback(None)
+    result = [[row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql)]
+              for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    assert result, "sorgu çalışmadı"
+    return result
+
+
+def check(plans, index):
+    for plan in plans:
+        text = " | ".join(plan)
+        assert index in text, text
+        assert "USE TEMP B-TREE" not in text, text
+        for step in plan:
+            assert not step.startswith("SCAN ") or " USING " in step, text
+
+
+def two_pages(db, query):
+    rows = query.page(db, None, PAGE)
+    assert rows
+    query.page(db, rows[-1][1], PAGE)
@@ -0,0 +1,83 @@
+"""Oturum kaydı ve silme: özet tabloların baştan hesaplamayla tutarlılığı"""
+import pytest
+
+import analytics
+import core
+from activity import backfill_daily_activity, backfill_item_activity
+from book_stats import backfill_book_stats
+from session_cache import SessionCache
+
+SUMMARIES = {
+    "daily_activity": "day",
+    "item_activity": "kind, item_id, year",
+    "book_stats": "book_id",
+}
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = core.open_database(str(tmp_path / "core.db"))
+    yield db
+    db.close()
+
+
+def _summaries(db):
+    return {table: db.query(f"SELECT * FROM {table} ORDER BY {order}")
+            for table, order in SUMMARIES.items()}
+
+
+def _check_summaries(db):
+    """Artımlı güncellenen özetler, oturumlardan baştan hesaplananlarla aynı mı"""
+    incremental = _summaries(db)
+    with db.transaction() as conn:
+        backfill_daily_activity(conn)
+        backfill_item_activity(conn)
+        backfill_book_stats(conn)
+    assert incremental == _summaries(db)
+
+
+def test_backdated_sessions(db):
+    book = core.add_book(db, "Kitap", total_pages=400)
+    # Sırasız tarihler: seri ve tempo kitabın oturumları yeniden okunarak hesaplanır
+    for day, pages, minutes in ((10, 20, 30), (12, 15, None), (11, 10, 20), (3, 5, 10),
+                                (12, 8, 12), (14, 30, 45), (13, 7, None)):
+        core.log_reading(db, book, pages, minutes, date=f"2024-05-{day:02d} 20:00:00")
+    stats = core.book_stats(db, book)
+    assert (stats.sessions, stats.active_days, stats.longest_streak) == (7, 6, 5)
+    _check_summaries(db)
+
+
+def test_delete_book(db):
+    kept = core.add_book(db, "Kalan", total_pages=300)
+    deleted = core.add_book(db, "Silinen", total_pages=300)
+    core.log_reading(db, kept, 10, 15, date="2024-01-02 10:00:00")
+    core.log_reading(db, deleted, 20, 25, date="2024-01-02 21:00:00")
+    core.log_reading(db, deleted, 30, None, date="2023-12-30 21:00:00")
+    cache = SessionCache()
+    cache.sync(db)
+
+    core.delete_book(db, deleted)
+    assert db.query("SELECT book_id FROM reading_sessions") == [(kept,)]
+    assert db.query("SELECT book_id FROM book_stats") == [(kept,)]
+    # Yalnızca silinen kitabın okunduğu gün ve yıl özetlerden çıkar
+    assert analytics.years(db) == [2024]
+    _check_summaries(db)
+
+    cache.note_write(db)
+    assert cache.sync(db)["book"].size == 1
+
+
+def test_delete_article(db):
+    kept = core.add_article(db, "Kalan")
+    deleted = core.add_article(db, "Silinen")
+    book = core.add_book(db, "Kitap")
+    core.mark_article_read(db, kept, minutes=5, date="2024-01-02 10:00:00")
+    core.mark_article_read(db, deleted, minutes=7, date="2024-01-02 11:00:00")
+    core.log_reading(db, book, 10, 10, date="2024-01-03 11:00:00")
+    core.mark_article_read(db, deleted, minutes=9, date="2024-01-03 12:00:00")
+
+    core.delete_article(db, deleted)
+    assert db.query("SELECT article_id FROM article_reading_sessions") == [(kept,)]
+    assert db.query("SELECT day - MIN(day) OVER (), article_minutes, article_sessions, pages "
+                    "FROM daily_activity ORDER BY day") == [(0, 5, 1, 0), (1, 0, 0, 10)]
+    _check_summaries(db)
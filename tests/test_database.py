@@ -0,0 +1,31 @@
+"""Bağlantı katmanı: iç içe işlemler ve başarısız COMMIT"""
+import sqlite3
+
+import pytest
+
+from database import Database
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / "database.db"))
+    db.execute("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+    db.execute("CREATE TABLE child (parent_id INTEGER REFERENCES parent(id))")
+    yield db
+    db.close()
+
+
+def test_failed_commit_rolls_back(db):
+    # Ertelenmiş yabancı anahtar ihlali COMMIT'te hata verir ve işlemi açık bırakır
+    db.execute("PRAGMA foreign_keys = ON")
+    db.execute("PRAGMA defer_foreign_keys = ON")
+    with pytest.raises(sqlite3.IntegrityError):
+        with db.transaction() as conn:
+            with db.transaction():
+                conn.execute("INSERT INTO child VALUES (1)")
+    assert not db.conn.in_transaction
+    assert db.query("SELECT * FROM child") == []
+    # Bağlantı yeni işlemler için kullanılabilir
+    with db.transaction() as conn:
+        conn.execute("INSERT INTO parent VALUES (1)")
+    assert db.query("SELECT id FROM parent") == [(1,)]
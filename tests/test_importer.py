@@ -0,0 +1,130 @@
+"""İçe aktarma: biçimler, tekrarlar ve atlanan kayıtlar"""
+import pytest
+
+import core
+import dates
+import importer
+from search import search
+
+GOODREADS = """\
+Title,Author,Number of Pages,Date Read,Date Added,Exclusive Shelf,My Rating,My Review
+Tutunamayanlar,Oğuz Atay,724,2024/03/10,2024/01/05,read,5,
+Kürk Mantolu Madonna,Sabahattin Ali,160,,2024/02/01,currently-reading,0,
+"  kürk mantolu madonna!",SABAHATTİN ALİ,160,,2024/02/02,to-read,0,
+,Başlıksız,100,,,to-read,0,
+Tutunamayanlar,Oğuz Atay,724,,geçersiz tarih,to-read,0,
+"""
+
+CSL_JSON = """[
+  {"type": "book", "title": "Dune", "author": [{"given": "Frank", "family": "Herbert"}],
+   "number-of-pages": "412", "accessed": {"date-parts": [[2023, 5]]}},
+  {"type": "article-journal", "title": "Bir makale", "URL": "https://www.example.com/a/?utm_source=x",
+   "container-title": "Dergi"},
+  {"type": "article-journal", "title": "Aynı makale", "URL": "http://example.com/a"},
+  {"type": "book"},
+  "metin"
+]"""
+
+POCKET_JSON = """{"list": {
+  "1": {"item_id": "1", "resolved_title": "Okunan", "resolved_url": "https://pocket.example/1",
+        "status": "1", "time_added": "1700000000", "time_read": "1700086400"},
+  "2": {"item_id": "2", "given_url": "https://pocket.example/2", "status": "0"}
+}}"""
+
+BIBTEX = """
+@comment{yok sayılır}
+@book{atay1972,
+  title = {Tutunamayanlar},
+  author = {Atay, Oğuz},
+  pagetotal = 724,
+}
+@article{knuth1974,
+  title = "Structured Programming with {go to} Statements",
+  author = {Knuth, Donald E.},
+  journal = {ACM Computing Surveys},
+}
+@misc{eksik, author = {Adsız}}
+"""
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = core.open_database(str(tmp_path / "import.db"))
+    yield db
+    db.close()
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_goodreads_csv(db, tmp_path):
+    result = importer.import_file(db, _write(tmp_path, "goodreads.csv", GOODREADS))
+    # Başlıksız satır atlanır; aksan/büyük harf/noktalama farkı ve aynı kitap tekrardır
+    assert result == importer.ImportResult(books=2, articles=0, duplicates=2, skipped=1)
+    rows = db.query('''SELECT title, author, total_pages, current_page, start_date, end_date,
+                              is_currently_reading, rating FROM books ORDER BY id''')
+    finished = dates.to_epoch("2024-03-10")
+    assert rows == [
+        ("Tutunamayanlar", "Oğuz Atay", 724, 724, finished, finished, 0, 5),
+        ("Kürk Mantolu Madonna", "Sabahattin Ali", 160, 0, dates.to_epoch("2024-02-01"), None, 1, None),
+    ]
+    # Tetikleyiciler içe aktarılan her satır için çalışmıştır
+    stats = core.get_stats(db)
+    assert (stats.reading_books, stats.completed_books, stats.unread_books) == (1, 1, 0)
+    assert [hit[1:3] for hit in search(db, "madonna")] == [(2, "Kürk Mantolu Madonna")]
+
+
+def test_existing_records_are_duplicates(db, tmp_path):
+    core.add_book(db, "TUTUNAMAYANLAR", "oğuz atay")
+    result = importer.import_file(db, _write(tmp_path, "goodreads.csv", GOODREADS))
+    assert result == importer.ImportResult(books=1, articles=0, duplicates=3, skipped=1)
+    # İkinci kez içe aktarmak bir şey eklemez
+    again = importer.import_file(db, _write(tmp_path, "goodreads.csv", GOODREADS))
+    assert again == importer.ImportResult(books=0, articles=0, duplicates=4, skipped=1)
+    assert db.query_one("SELECT COUNT(*) FROM books") == (2,)
+
+
+def test_csl_json(db, tmp_path):
+    result = importer.import_file(db, _write(tmp_path, "zotero.json", CSL_JSON))
+    # URL'si aynı makale tekrardır; başlıksız öğe atlanır, nesne olmayan değer kayıt değildir
+    assert result == importer.ImportResult(books=1, articles=1, duplicates=1, skipped=1)
+    assert db.query("SELECT title, author, total_pages, added_date FROM books") == [
+        ("Dune", "Frank Herbert", 412, dates.to_epoch("2023-05-01"))]
+    assert db.query("SELECT title, source, is_read FROM articles") == [("Bir makale", "Dergi", 0)]
+
+
+def test_pocket_json(db, tmp_path):
+    result = importer.import_file(db, _write(tmp_path, "pocket.json", POCKET_JSON))
+    assert result == importer.ImportResult(books=0, articles=2, duplicates=0, skipped=0)
+    assert db.query("SELECT title, url, is_read, read_date IS NOT NULL FROM articles ORDER BY id") == [
+        ("Okunan", "https://pocket.example/1", 1, 1),
+        ("https://pocket.example/2", "https://pocket.example/2", 0, 0),
+    ]
+
+
+def test_bibtex(db, tmp_path):
+    result = importer.import_file(db, _write(tmp_path, "refs.bib", BIBTEX))
+    # @comment kayıt değildir; başlıksız @misc atlanır
+    assert result == importer.ImportResult(books=1, articles=1, duplicates=0, skipped=1)
+    assert db.query("SELECT title, author, total_pages FROM books") == [
+        ("Tutunamayanlar", "Oğuz Atay", 724)]
+    assert db.query("SELECT title, author, source FROM articles") == [
+        ("Structured Programming with go to Statements", "Donald E. Knuth", "ACM Computing Surveys")]
+
+
+def test_skipped_records(db):
+    records = [importer._book("  ", "Boşluk"), importer._article(None, url="https://example.com"),
+               importer._book("Var")]
+    assert importer.import_records(db, records) == importer.ImportResult(1, 0, 0, 2)
+
+
+def test_batches(db):
+    records = [importer._book(f"Kitap {i}") for i in range(25)]
+    progress = []
+    result = importer.import_records(db, records, progress.append, batch_size=10)
+    assert result == importer.ImportResult(25, 0, 0, 0)
+    assert progress == [10, 20, 25]
+    assert core.get_stats(db).unread_books == 25
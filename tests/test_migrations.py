@@ -0,0 +1,79 @@
+"""Göçlerden önceki (metin tarihli) şemadan güncel şemaya yükseltme"""
+import sqlite3
+from datetime import date
+
+import pytest
+
+import analytics
+import core
+import dates
+from migrations import SCHEMA_VERSION, create_tables
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "baseline.db")
+    conn = sqlite3.connect(path)
+    create_tables(conn)
+    conn.executescript("""
+        INSERT INTO books (id, title, author, total_pages, current_page, start_date,
+                           is_currently_reading, added_date)
+        VALUES (1, 'Tutunamayanlar', 'Oğuz Atay', 724, 120, '2024-03-01', 1, '2024-02-28 10:00:00'),
+               (2, 'Silinen', NULL, NULL, 0, NULL, 0, '2024-02-28 11:00:00');
+        DELETE FROM books WHERE id = 2;
+        INSERT INTO articles (title, url, is_read, read_date)
+        VALUES ('Bir makale', 'https://example.com/a', 1, '2024-03-02 09:30:00');
+        INSERT INTO reading_sessions (book_id, date, pages_read, minutes_spent)
+        VALUES (1, '2024-03-01 21:00:00', 40, 30),
+               (1, '2024-03-02 22:15:00', 80, 60),
+               (1, 'dün akşam', 10, NULL),
+               -- Silinen kayıtların sahipsiz oturumları
+               (2, '2023-06-01 10:00:00', 5, 5);
+        INSERT INTO article_reading_sessions (article_id, date, minutes_spent)
+        VALUES (1, '2024-03-02 09:30:00', 15), (1, '', 5), (7, '2024-03-01 08:00:00', 9);
+    """)
+    conn.commit()
+    conn.close()
+    db = core.open_database(path)
+    yield db
+    db.close()
+
+
+def test_upgrade_from_baseline(db):
+    assert db.query_one("PRAGMA user_version")[0] == SCHEMA_VERSION
+    day = dates.date_to_day(date(2024, 3, 1))
+    assert db.query("SELECT date, day FROM reading_sessions ORDER BY id") == [
+        (dates.to_epoch("2024-03-01 21:00:00"), day),
+        (dates.to_epoch("2024-03-02 22:15:00"), day + 1),
+        # Okunamayan tarih 0 (1970-01-01) değil, boş olur
+        (None, None),
+    ]
+    assert db.query("SELECT date FROM article_reading_sessions ORDER BY id") == [
+        (dates.to_epoch("2024-03-02 09:30:00"),), (None,)]
+
+    # Özetler tarihsiz ve sahipsiz oturumları saymaz
+    assert db.query("SELECT day, pages, book_minutes, article_minutes FROM daily_activity ORDER BY day") == [
+        (day, 40, 30, 0), (day + 1, 80, 60, 15)]
+    assert db.query("SELECT kind, year, sessions FROM item_activity ORDER BY kind") == [
+        ("article", 2024, 1), ("book", 2024, 2)]
+    assert analytics.years(db) == [2024]
+    stats = core.book_stats(db, 1)
+    assert (stats.sessions, stats.active_days, stats.longest_streak) == (2, 2, 2)
+
+    # Sayaç ve arama tetikleyicileri yeniden kurulmuştur
+    assert core.get_stats(db).reading_books == 1
+    assert db.query_one("SELECT rowid FROM search_index WHERE search_index MATCH 'tutunamayanlar'") == (2,)
+
+
+def test_added_date_default(db):
+    before = dates.now()
+    db.execute("INSERT INTO books (title) VALUES ('Ham SQL')")
+    db.execute("INSERT INTO articles (title) VALUES ('Ham SQL')")
+    for table in ("books", "articles"):
+        added = db.query_one(f"SELECT added_date FROM {table} WHERE title = 'Ham SQL'")[0]
+        assert before <= added <= dates.now()
+
+
+def test_autoincrement_kept(db):
+    # Silinen en büyük id yeniden kullanılmaz
+    assert core.add_book(db, "Yeni") == 3
@@ -0,0 +1,86 @@
+"""Liste sorguları: sıralama/önek planları, anahtar karşılaştırması ve
+yerinde güncellenen satırlar"""
+import pytest
+
+import core
+from benchmarks.headless import HeadlessVirtualTreeview
+from plans import check, library, plans, two_pages
+from queries import article_query, book_query, distinct_values
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = core.open_database(str(tmp_path / "queries.db"))
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="module")
+def plan_db(tmp_path_factory):
+    db = library(str(tmp_path_factory.mktemp("plans") / "plans.db"))
+    yield db
+    db.close()
+
+
+# Her sütunun sıralaması kendi indeksiyle okunur. Seyrek birleşimler (durum ya da
+# önek filtresiyle başka bir sıralama) indeksle daraltılıp geçici sıralamayla
+# sıralanır; denetlenmez.
+@pytest.mark.parametrize("sort", ["title", "author", "progress", "status"])
+@pytest.mark.parametrize("descending", [False, True])
+def test_book_sorts(plan_db, sort, descending):
+    check(plans(plan_db, two_pages, book_query("all", sort, descending)), f"idx_books_sort_{sort}")
+
+
+@pytest.mark.parametrize("sort", ["title", "author", "source", "status"])
+@pytest.mark.parametrize("descending", [False, True])
+def test_article_sorts(plan_db, sort, descending):
+    check(plans(plan_db, two_pages, article_query("all", sort, descending)), f"idx_articles_sort_{sort}")
+
+
+# Önek filtresinde varsayılan sıra sütunla başlar (bkz. queries.prefix_order)
+@pytest.mark.parametrize("descending", [False, True])
+def test_book_author_prefix(plan_db, descending):
+    check(plans(plan_db, two_pages, book_query(descending=descending, author="a")), "idx_books_author")
+
+
+@pytest.mark.parametrize("column", ["author", "source"])
+@pytest.mark.parametrize("descending", [False, True])
+def test_article_prefix(plan_db, column, descending):
+    query = article_query(descending=descending, **{column: "a"})
+    check(plans(plan_db, two_pages, query), f"idx_articles_{column}")
+
+
+@pytest.mark.parametrize("table, column", [("books", "author"), ("articles", "author"),
+                                           ("articles", "source")])
+def test_distinct_values(plan_db, table, column):
+    # Önek indeksi (sütun COLLATE NOCASE, ...) ile başlar
+    check(plans(plan_db, distinct_values, table, column), f"idx_{table}_{column}")
+
+
+def _ids(db, query):
+    return [values[0] for values, _ in query.page(db, None, 1000)]
+
+
+def test_compare_nocase():
+    query = book_query(author="a")
+    # (yazar NOCASE, durum sırası, eklenme, id)
+    assert query.compare(("ahmet", 1, 0, 1), ("Ali", 1, 0, 2)) < 0
+    assert query.compare(("Ahmet", 1, 0, 1), ("ahmet", 1, 0, 2)) > 0  # eşit; id azalan
+    # NOCASE yalnızca ASCII harfleri eşler
+    assert query.compare(("ç", 1, 0, 1), ("Ç", 1, 0, 1)) > 0
+
+
+def test_refresh_rows_under_prefix_filter(db):
+    ids = {author: core.add_book(db, f"Kitap {author}", author)
+           for author in ("Ali", "Ayşe", "aziz", "Mehmet", "Ahmet")}
+    query = book_query(author="a")
+    tree = HeadlessVirtualTreeview(page_size=2, buffer=1)
+    tree.load(db, query)
+    assert tree._rows and [values[0] for values, _ in tree._rows] == _ids(db, query)[:len(tree._rows)]
+
+    # Filtreye yeni giren, yeri büyük/küçük harfe bağlı satırlar
+    for book_id, author in ((ids["Mehmet"], "ahmet"), (ids["Ali"], "azra"), (ids["aziz"], "AAA")):
+        core.update_book(db, book_id, f"Kitap {author}", author, None, 0)
+        tree.refresh_rows([book_id])
+        tree._load_range(0, tree._total)
+        assert [values[0] for values, _ in tree._rows] == _ids(db, query)
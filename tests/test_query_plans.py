@@ -0,0 +1,60 @@
+"""Sıcak sorguların EXPLAIN QUERY PLAN denetimi (bkz. migrations.py).
+
+Denetlenen sorgular: kitap listesinin durum filtreleri, makale listesinin
+okundu filtreleri, kitap/makale okuma geçmişi ve aktivite grafiğinin gün
+aralığı. Her sorgu uygulamanın kullandığı fonksiyonla çalıştırılır;
+çalışan SELECT'ler yakalanıp planları incelenir (bkz. plans.py).
+Sıralama ve önek filtrelerinin planları test_queries.py'dedir.
+"""
+import pytest
+
+import core
+from activity import activity_range
+from plans import check, library, plans, two_pages
+from queries import article_query, book_query
+
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory):
+    db = library(str(tmp_path_factory.mktemp("plans") / "plans.db"))
+    yield db
+    db.close()
+
+
+@pytest.mark.parametrize("status, index", [
+    ("all", "idx_books_sort_status"),
+    ("reading", "idx_books_filter_reading"),
+    ("completed", "idx_books_filter_completed"),
+    ("unread", "idx_books_filter_unread"),
+    ("paused", "idx_books_filter_paused"),
+])
+@pytest.mark.parametrize("descending", [False, True])
+def test_book_filters(db, status, index, descending):
+    check(plans(db, two_pages, book_query(status, descending=descending)), index)
+
+
+@pytest.mark.parametrize("status", ["all", "read", "unread"])
+def test_article_filters(db, status):
+    check(plans(db, two_pages, article_query(status)), "idx_articles_sort_status")
+
+
+def _history(db, func, item_id):
+    page = func(db, item_id, limit=5)
+    assert page.next is not None
+    func(db, item_id, page.next, 5)
+
+
+@pytest.mark.parametrize("func, table, column, index", [
+    (core.book_history, "reading_sessions", "book_id", "idx_reading_sessions_history"),
+    (core.article_history, "article_reading_sessions", "article_id",
+     "idx_article_reading_sessions_history"),
+])
+def test_history(db, func, table, column, index):
+    # En çok oturumu olan kayıt; ikinci sayfa `after` koşulunu da çalıştırır
+    item_id = db.query_one(f"""SELECT {column} FROM {table}
+                               GROUP BY {column} ORDER BY COUNT(*) DESC LIMIT 1""")[0]
+    check(plans(db, _history, func, item_id), index)
+
+
+def test_activity_range(db):
+    check(plans(db, activity_range, 0, 1 << 20), "USING PRIMARY KEY")
@@ -0,0 +1,79 @@
+"""HTTP sunucusu: kimlik doğrulama ve hatalı isteklerin 4xx yanıtları"""
+import asyncio
+import json
+
+import pytest
+
+import core
+from server import APIServer
+
+TOKEN = "GİZLİ"
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = core.open_database(str(tmp_path / "server.db"))
+    core.add_book(db, "Kitap", total_pages=300)
+    yield db
+    db.close()
+
+
+def _exchange(db, *requests):
+    """İstekleri ayrı bağlantılarla gönderir, (durum, gövde) listesi döndürür"""
+    async def main():
+        api = APIServer(db, TOKEN, readers=1)
+        ready = asyncio.get_running_loop().create_future()
+        task = asyncio.create_task(api.serve("127.0.0.1", 0, ready=ready.set_result))
+        port = (await ready).sockets[0].getsockname()[1]
+        responses = []
+        try:
+            for request in requests:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(request)
+                data = await reader.read()
+                writer.close()
+                head, _, body = data.partition(b"\r\n\r\n")
+                responses.append((int(head.split()[1]), json.loads(body) if body else None))
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        return responses
+    return asyncio.run(main())
+
+
+def _request(method, path, body=None, token=TOKEN, length=None):
+    data = b"" if body is None else json.dumps(body).encode("utf-8")
+    head = f"{method} {path} HTTP/1.1\r\nConnection: close\r\nContent-Length: "
+    head += f"{len(data) if length is None else length}\r\n"
+    if token is not None:
+        head += f"Authorization: Bearer {token}\r\n"
+    # İstemci başlıkları UTF-8 gönderir; sunucu ham baytları karşılaştırır
+    return head.encode("utf-8") + b"\r\n" + data
+
+
+def test_token(db):
+    responses = _exchange(db, _request("GET", "/api/stats"),
+                          _request("GET", "/api/stats", token="GİZLİ2"),
+                          _request("GET", "/api/stats", token=None))
+    assert [status for status, _ in responses] == [200, 401, 401]
+
+
+def test_bad_content_length(db):
+    (status, _), = _exchange(db, _request("GET", "/api/stats", length="abc"))
+    assert status == 400
+
+
+@pytest.mark.parametrize("body", [
+    {"pages": 2.5}, {"pages": [1]}, {"pages": "on"}, {"pages": 2 ** 70},
+    {"pages": 5, "date": 3.5}, {"pages": 5, "date": ["2024-01-01"]}, {"pages": 5, "date": "dün"},
+])
+def test_bad_session_fields(db, body):
+    (status, payload), = _exchange(db, _request("POST", "/api/books/1/sessions", body))
+    assert status == 400, payload
+    assert db.query("SELECT COUNT(*) FROM reading_sessions") == [(0,)]
+
+
+def test_log_reading(db):
+    (status, payload), = _exchange(db, _request("POST", "/api/books/1/sessions",
+                                                {"pages": "12", "date": "2024-03-01 10:00:00"}))
+    assert status == 201 and payload["current_page"] == 12
@@ -0,0 +1,55 @@
+"""Oturum önbelleği: artımlı ekleme ve özet tabloyla tutarlılık"""
+import pytest
+
+import core
+import dates
+from activity import activity_range
+from session_cache import SessionCache
+
+FIRST, LAST = "2024-03-01 10:00:00", "2024-03-10 10:00:00"
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = core.open_database(str(tmp_path / "sessions.db"))
+    book = core.add_book(db, "Kitap", total_pages=500)
+    article = core.add_article(db, "Makale")
+    core.log_reading(db, book, 20, 30, date=FIRST)
+    core.log_reading(db, book, 10, None, date="2024-03-03 22:00:00")
+    core.mark_article_read(db, article, minutes=15, date="2024-03-03 09:00:00")
+    yield db
+    db.close()
+
+
+def _check(db, cache):
+    """Önbellekteki günlük seriler özet tabloyla aynı mı"""
+    first, last = dates.day_number(dates.to_epoch(FIRST)), dates.day_number(dates.to_epoch(LAST))
+    expected = {day: (pages, book_minutes, article_minutes)
+                for day, pages, article_minutes, _, _, book_minutes in activity_range(db, first, last)}
+    series = [cache.daily(db, kind, field, first, last).tolist()
+              for kind, field in (("book", "pages"), ("book", "minutes"), ("article", "minutes"))]
+    assert [tuple(values) for values in zip(*series)] == [expected.get(day, (0, 0, 0))
+                                                          for day in range(first, last + 1)]
+
+
+def test_note_write_appends(db):
+    cache = SessionCache()
+    _check(db, cache)
+    columns = cache.sync(db)["book"]
+    core.log_reading(db, 1, 5, 10, date="2024-03-05 08:00:00")
+    cache.note_write(db)
+    # Baştan okunmaz; yeni satır mevcut sütunlara eklenir
+    assert cache.sync(db)["book"] is columns and columns.size == 3
+    _check(db, cache)
+
+
+def test_write_from_other_connection(db):
+    cache = SessionCache()
+    _check(db, cache)
+    other = core.open_database(db.path)
+    try:
+        core.log_reading(other, 1, 7, 5, date="2024-03-09 20:00:00")
+        core.mark_article_read(other, 1, minutes=4, date="2024-03-09 21:00:00")
+    finally:
+        other.close()
+    _check(db, cache)
@@ -0,0 +1,61 @@
+"""ttk tema motoru.
+
+Uygulamanın renk ve yazı tipi temaları açılışta bir kez adlandırılmış
+ttk temalarına (`ttk.Style.theme_create`) derlenir. Tema değiştirmek
+derlenmiş temaya `theme_use` ile geçmektir: stiller tek tek yeniden
+yapılandırılmaz, widget'lar yeniden oluşturulmaz ve listeler yeniden
+yüklenmez.
+"""
+from tkinter import ttk
+
+# Derlenen temaların türetildiği ttk teması
+PARENT = "clam"
+
+
+def style_settings(theme):
+    """Uygulama temasını `theme_create` ayarlarına çevirir"""
+    return {
+        ".": {"configure": {"background": theme["bg"], "foreground": theme["fg"],
+                            "font": theme["text_font"]}},
+        "TFrame": {"configure": {"background": theme["bg"]}},
+        "TLabel": {"configure": {"background": theme["bg"], "foreground": theme["fg"],
+                                 "font": theme["text_font"]}},
+        "Header.TLabel": {"configure": {"font": theme["header_font"]}},
+        "TButton": {"configure": {"background": theme["button_bg"], "foreground": theme["button_fg"],
+                                  "font": theme["text_font"], "padding": 5}},
+        "Accent.TButton": {"configure": {"background": theme["accent"],
+                                         "foreground": theme["button_fg"]}},
+        "TNotebook": {"configure": {"background": theme["bg"]}},
+        "TNotebook.Tab": {"configure": {"background": theme["bg"], "foreground": theme["fg"],
+                                        "font": theme["header_font"], "padding": [10, 5]}},
+        "Treeview": {
+            "configure": {"background": theme["tree_bg"], "foreground": theme["tree_fg"],
+                          "fieldbackground": theme["tree_bg"], "rowheight": 25,
+                          "font": theme["text_font"]},
+            "map": {"background": [("selected", theme["tree_select"])],
+                    "foreground": [("selected", "white")]},
+        },
+        "Treeview.Heading": {"configure": {"background": theme["accent"], "foreground": "white",
+                                           "font": theme["header_font"]}},
+    }
+
+
+class ThemeEngine:
+    """Temaları bir kez derler, adlarıyla değiştirir"""
+
+    def __init__(self, root, themes):
+        self.style = ttk.Style(root)
+        existing = set(self.style.theme_names())
+        # Uygulama tema adı -> ttk tema adı
+        self._names = {}
+        for index, (name, theme) in enumerate(themes.items()):
+            ttk_name = f"okurtakip{index}"
+            if ttk_name in existing:
+                # Aynı yorumlayıcıda ikinci kez açılış: ayarları güncelle
+                self.style.theme_settings(ttk_name, style_settings(theme))
+            else:
+                self.style.theme_create(ttk_name, parent=PARENT, settings=style_settings(theme))
+            self._names[name] = ttk_name
+
+    def use(self, name):
+        self.style.theme_use(self._names[name])
@@ -0,0 +1,299 @@
+"""Sıcak yollar için hafif izleme.
+
+`span` bağlam yöneticisi ve `traced` dekoratörü bir işlemin süresini,
+çalıştırdığı SQL ifadesi sayısını, okuduğu satır sayısını ve güncellediği
+Tk öğesi sayısını ölçer; sonuçlar sabit boyutlu bir halka tampona yazılır.
+İç içe ölçümlerde dıştaki ölçüm içtekilerin sayılarını da içerir.
+
+SQL ve satır sayıları `TracedConnection` üzerinden (bkz. database.py),
+ifade süreleri ise aynı imleçten profiler.py'ye aktarılır;
+Tk öğeleri de çizim kodunun çağırdığı `count_items` ile toplanır. Açık
+ölçüm yokken sayaçlar hiçbir şey yapmaz.
+
+İmleç her satır okumasına süre ölçümü eklediğinden SQL izleme varsayılan
+olarak kapalıdır ve bağlantılar düz `sqlite3.Connection` olarak açılır.
+`enable_sql` (arayüzde `--debug` ya da `--slow-log`) veya OKURTAKIP_TRACE=1
+ortam değişkeniyle açılır; yalnızca sonradan açılan bağlantıları etkiler.
+
+    with tracing.span("kitap yükleme"):
+        ...
+
+    @tracing.traced
+    def load_books(self): ...
+"""
+import functools
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque, namedtuple
+
+# Tampondaki en fazla olay sayısı; eskiler düşer
+CAPACITY = 5000
+
+Event = namedtuple("Event", "name thread start duration statements rows items")
+
+Summary = namedtuple("Summary", "name count p50 p90 p99 max statements rows items")
+
+_events = deque(maxlen=CAPACITY)
+_local = threading.local()
+_origin = time.perf_counter()
+_sql_enabled = os.environ.get("OKURTAKIP_TRACE", "") not in ("", "0")
+
+
+def enable_sql(enabled=True):
+    """Bundan sonra açılan bağlantılarda SQL izlemeyi açar ya da kapatır"""
+    global _sql_enabled
+    _sql_enabled = enabled
+
+
+def sql_enabled():
+    return _sql_enabled
+
+
+class _Span:
+    __slots__ = ("statements", "rows", "items")
+
+    def __init__(self):
+        self.statements = self.rows = self.items = 0
+
+
+def _current():
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if stack else None
+
+
+def count_statement():
+    span = _current()
+    if span is not None:
+        span.statements += 1
+
+
+def count_rows(count):
+    span = _current()
+    if span is not None:
+        span.rows += count
+
+
+def count_items(count):
+    """Tk öğesi oluşturan/güncelleyen kod, dokunduğu öğe sayısını bildirir"""
+    span = _current()
+    if span is not None:
+        span.items += count
+
+
+class span:
+    """Bir işlemi ölçüp tampona yazan bağlam yöneticisi"""
+
+    __slots__ = ("name", "_span", "_start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self._span = _Span()
+        stack.append(self._span)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        stack = _local.stack
+        stack.pop()
+        current = self._span
+        if stack:
+            parent = stack[-1]
+            parent.statements += current.statements
+            parent.rows += current.rows
+            parent.items += current.items
+        _events.append(Event(self.name, threading.current_thread().name, self._start - _origin,
+                             end - self._start, current.statements, current.rows, current.items))
+        return False
+
+
+def traced(func=None, name=None):
+    """Fonksiyonu `span` içinde çalıştıran dekoratör (ad verilmezse fonksiyon adı)"""
+    if func is None:
+        return lambda func: traced(func, name)
+    label = name or func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with span(label):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def events():
+    """Tampondaki olaylar, eskiden yeniye"""
+    return list(_events)
+
+
+def clear():
+    _events.clear()
+
+
+def _percentile(values, fraction):
+    """Sıralı listede en yakın sıra yöntemiyle yüzdelik"""
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def summary():
+    """İşlem başına süre yüzdelikleri (ms) ve ortalama sayılar, en yavaş toplamdan başlayarak"""
+    groups = {}
+    for event in events():
+        groups.setdefault(event.name, []).append(event)
+    result = []
+    for name, group in groups.items():
+        durations = sorted(event.duration * 1000 for event in group)
+        count = len(group)
+        result.append(Summary(
+            name, count,
+            _percentile(durations, 0.5), _percentile(durations, 0.9), _percentile(durations, 0.99),
+            durations[-1],
+            sum(event.statements for event in group) / count,
+            sum(event.rows for event in group) / count,
+            sum(event.items for event in group) / count))
+    result.sort(key=lambda row: row.p50 * row.count, reverse=True)
+    return result
+
+
+def export_chrome_trace(path):
+    """Olayları Chrome trace-event JSON biçiminde yazar (chrome://tracing, Perfetto)"""
+    pid = os.getpid()
+    threads = {}
+    trace = []
+    for event in events():
+        tid = threads.setdefault(event.thread, len(threads) + 1)
+        trace.append({
+            "name": event.name, "cat": "okurtakip", "ph": "X", "pid": pid, "tid": tid,
+            "ts": round(event.start * 1e6, 1), "dur": round(event.duration * 1e6, 1),
+            "args": {"sql": event.statements, "rows": event.rows, "tk_items": event.items},
+        })
+    for thread, tid in threads.items():
+        trace.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                      "args": {"name": thread}})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+    return len(trace) - len(threads)
+
+
+class TracedCursor(sqlite3.Cursor):
+    """İfadeleri ve okunan satırları açık ölçüme sayan, sürelerini
+    profilleyiciye bildiren imleç (bkz. profiler.py).
+
+    Bir ifadenin süresi çalıştırma ile satır okumalarının toplamıdır;
+    imleç tükenince, yeniden çalıştırılınca ya da kapanınca kaydedilir.
+    """
+
+    _sql = None
+
+    def _begin(self, sql, params, elapsed):
+        self._sql = sql
+        self._params = params
+        self._elapsed = elapsed
+        self._rows = 0
+        if self.description is None:
+            # Satır döndürmeyen ifade: ölçüm bitti
+            self._finish()
+
+    def _fetched(self, elapsed, rows, done):
+        count_rows(rows)
+        if self._sql is not None:
+            self._elapsed += elapsed
+            self._rows += rows
+            if done:
+                self._finish()
+
+    def _finish(self):
+        sql = self._sql
+        if sql is not None:
+            self._sql = None
+            # İzleme kapalıyken profiler (ve logging) içe aktarılmaz; açılışı yavaşlatır
+            import profiler
+            profiler.record(self.connection, sql, self._params, self._elapsed, self._rows)
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        count_statement()
+        started = time.perf_counter()
+        super().execute(sql, parameters)
+        self._begin(sql, parameters, time.perf_counter() - started)
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        count_statement()
+        started = time.perf_counter()
+        super().executemany(sql, seq_of_parameters)
+        self._begin(sql, None, time.perf_counter() - started)
+        return self
+
+    def executescript(self, sql_script):
+        self._finish()
+        count_statement()
+        started = time.perf_counter()
+        super().executescript(sql_script)
+        self._begin(sql_script, None, time.perf_counter() - started)
+        return self
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(time.perf_counter() - started, row is not None, row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        started = time.perf_counter()
+        rows = super().fetchmany(size)
+        self._fetched(time.perf_counter() - started, len(rows), len(rows) < size)
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(time.perf_counter() - started, len(rows), True)
+        return rows
+
+    def __next__(self):
+        started = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._fetched(time.perf_counter() - started, 0, True)
+            raise
+        self._fetched(time.perf_counter() - started, 1, False)
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        self._finish()
+
+
+class TracedConnection(sqlite3.Connection):
+    """`execute` kısayollarını TracedCursor ile çalıştıran bağlantı"""
+
+    def cursor(self, factory=TracedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+
+def connection_factory():
+    """Yeni bağlantılar için sınıf: izleme açıksa TracedConnection"""
+    return TracedConnection if _sql_enabled else sqlite3.Connection
@@ -0,0 +1,309 @@
+import tkinter as tk
+from tkinter import ttk
+
+import tracing
+
+
+class VirtualTreeview(ttk.Treeview):
+    """Yalnızca görünen satırlar için Tk öğesi oluşturan Treeview.
+
+    Satırlar bir KeysetQuery'den sayfa sayfa, kaydırıldıkça çekilir. Bellekte
+    sonuçların ardışık bir bölümü tutulur; yakına kaydırınca bu bölüm
+    anahtarla ileri ya da geri genişletilir, uzağa atlanınca (kaydırma
+    çubuğunu sürükleme, End) aradaki satırlar okunmadan hedef sayfa OFFSET
+    ile doğrudan okunur. Ekrana sığan satır sayısı kadar öğe ("yuva")
+    oluşturulur; kaydırma, yuvaların değerlerini değiştirerek yapılır. Seçim satır id'si (ilk sütun) ile
+    tutulur, bu yüzden kaydırma ve yeniden yüklemeden sonra korunur.
+
+    Sütun, başlık ve olay bağlama işlemleri normal Treeview gibidir; seçili
+    satırın değerleri `selected_values` ile alınır.
+    """
+
+    def __init__(self, master=None, page_size=200, buffer=50, **kw):
+        yscrollcommand = kw.pop("yscrollcommand", kw.pop("yscroll", None))
+        super().__init__(master, **kw)
+        self.page_size = page_size
+        self.buffer = buffer
+        self._yscrollcommand = yscrollcommand
+        self._db = None
+        self._query = None
+        self._rows = []          # [(değerler, sıralama anahtarı), ...]
+        self._base = 0           # _rows[0]'ın sonuçlar içindeki sırası
+        self._complete = True    # _rows sonuçların sonuna kadar yüklü mü
+        self._total = 0
+        self._offset = 0         # görünen ilk satırın _rows içindeki yeri
+        self._visible = int(self.cget("height"))
+        self._slots = []
+        self._slot_values = []
+        self._selected_id = None
+
+        self.bind("<Configure>", self._on_configure, add="+")
+        self.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind(sequence, self._on_wheel)
+        self.bind("<Up>", lambda e: self._move_selection(-1))
+        self.bind("<Down>", lambda e: self._move_selection(1))
+        self.bind("<Prior>", lambda e: self._move_selection(-self._visible))
+        self.bind("<Next>", lambda e: self._move_selection(self._visible))
+        self.bind("<Home>", lambda e: self._move_selection(-self._total))
+        self.bind("<End>", lambda e: self._move_selection(self._total))
+
+    # Veri
+    def fetch_first_page(self, db, query):
+        """Toplam satır sayısını ve ilk sayfayı okur; Tk'ye dokunmaz,
+        arka plan thread'inden çağrılabilir"""
+        return query.count(db), query.page(db, None, self.page_size)
+
+    def load(self, db, query, prefetched=None):
+        """Görünümü verilen sorguyla baştan yükler.
+
+        `prefetched`, `fetch_first_page` sonucudur; verilmezse burada okunur.
+        """
+        total, page = prefetched if prefetched is not None else self.fetch_first_page(db, query)
+        self._db = db
+        self._query = query
+        self._rows = list(page)
+        self._base = 0
+        self._complete = len(page) < self.page_size
+        self._total = len(page) if self._complete else total
+        self._offset = 0
+        self._scroll_to(0)
+
+    def refresh_rows(self, row_ids):
+        """Yalnızca verilen satırları yeniden okuyup yerinde günceller.
+
+        Silinen ya da artık filtreye uymayan satırlar çıkarılır, sıralama
+        anahtarı değişenler yeni yerlerine taşınır. Görünen pencere,
+        üstüne eklenen/çıkarılan satırlar yüzünden kaymaz.
+        """
+        if self._query is None:
+            return
+        fresh = self._query.rows_by_id(self._db, row_ids)
+        for row_id in row_ids:
+            index = self._row_index(row_id)
+            if index is not None:
+                del self._rows[index]
+                if index < self._offset:
+                    self._offset -= 1
+            row = fresh.get(row_id)
+            if row is not None:
+                index = self._insert_position(row[1])
+                # Yüklü bölümün dışına düşen satır, o bölge okununca görünür
+                if (index < len(self._rows) or self._complete) and (index > 0 or self._base == 0):
+                    self._rows.insert(index, row)
+                    if index < self._offset:
+                        self._offset += 1
+        # Yüklenmemiş bölgedeki değişiklikler sayımı etkileyebilir
+        self._total = self._base + len(self._rows) if self._complete else self._query.count(self._db)
+        self._scroll_to(self._base + self._offset)
+
+    def _insert_position(self, key):
+        """Anahtarın yüklü satırlar arasındaki sıralı yeri (ikili arama)"""
+        low, high = 0, len(self._rows)
+        while low < high:
+            middle = (low + high) // 2
+            if self._query.compare(self._rows[middle][1], key) <= 0:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _load_range(self, start, end):
+        """[start, end) sıralarındaki satırların bellekte olmasını sağlar.
+
+        Yüklü bölüme yakın aralıklar için bölüm anahtarla genişletilir;
+        uzak bir aralıkta bölüm, OFFSET ile okunan hedef sayfayla değiştirilir.
+        """
+        start = max(0, start)
+        loaded_end = self._base + len(self._rows)
+        if (start > loaded_end + self.page_size or end < self._base - self.page_size
+                or not self._rows and self._base):
+            self._jump(start, end)
+            return
+        if start < self._base:
+            limit = max(self._base - start, self.page_size)
+            page = self._query.page_before(self._db, self._rows[0][1], limit)
+            self._rows[:0] = page
+            self._offset += len(page)
+            self._base = 0 if len(page) < limit else max(0, self._base - len(page))
+        missing = end - (self._base + len(self._rows))
+        if self._complete or missing <= 0:
+            return
+        limit = max(missing, self.page_size)
+        after = self._rows[-1][1] if self._rows else None
+        page = self._query.page(self._db, after, limit)
+        self._rows.extend(page)
+        if len(page) < limit:
+            self._complete = True
+            self._total = self._base + len(self._rows)
+
+    def _jump(self, start, end):
+        """Yüklü bölümü `start` sırasından başlayan sayfayla değiştirir"""
+        position = self._base + self._offset
+        limit = max(end - start, self.page_size)
+        page = self._query.page(self._db, None, limit, offset=start)
+        if not page and start > 0:
+            # Sonuçlar sayımdan sonra azalmış: son sayfaya atla
+            self._total = self._query.count(self._db)
+            self._jump(max(0, min(start, self._total - limit)), self._total)
+            return
+        self._rows = list(page)
+        self._base = start
+        self._offset = max(0, position - start)
+        self._complete = len(page) < limit
+        if self._complete:
+            self._total = start + len(page)
+
+    def _row_index(self, row_id):
+        """Satır id'sinin yüklü satırlar içindeki sırası"""
+        window = range(self._offset, min(self._offset + self._visible, len(self._rows)))
+        for index in window:
+            if self._rows[index][0][0] == row_id:
+                return index
+        for index, (values, _) in enumerate(self._rows):
+            if values[0] == row_id:
+                return index
+        return None
+
+    def selected_values(self):
+        """Seçili satırın değerlerini döndürür, seçim yoksa None"""
+        selection = self.selection()
+        if selection and selection[0] in self._slots:
+            index = self._offset + self._slots.index(selection[0])
+            if index < len(self._rows):
+                return self._rows[index][0]
+        if self._selected_id is None:
+            return None
+        index = self._row_index(self._selected_id)
+        return self._rows[index][0] if index is not None else None
+
+    # Çizim
+    def _render(self):
+        """Görünen pencereyi yuvalara yazar"""
+        rows = self._rows[self._offset:self._offset + self._visible]
+        touched = abs(len(self._slots) - len(rows))
+        while len(self._slots) < len(rows):
+            self._slots.append(super().insert("", tk.END))
+            self._slot_values.append(None)
+        while len(self._slots) > len(rows):
+            self.delete(self._slots.pop())
+            self._slot_values.pop()
+
+        selected_slot = None
+        for slot, (values, _) in enumerate(rows):
+            if self._slot_values[slot] != values:
+                self.item(self._slots[slot], values=values)
+                self._slot_values[slot] = values
+                touched += 1
+            if values[0] == self._selected_id:
+                selected_slot = self._slots[slot]
+
+        selection = self.selection()
+        if selected_slot is not None:
+            if selection != (selected_slot,):
+                self.selection_set(selected_slot)
+            self.focus(selected_slot)
+        elif selection:
+            self.selection_remove(*selection)
+        tracing.count_items(touched)
+        self._update_scrollbar()
+
+    def _scroll_to(self, position):
+        """Pencereyi sonuçların `position` sırasındaki satırından başlatır"""
+        position = max(0, min(position, self._total - self._visible))
+        self._load_range(position - self.buffer, position + self._visible + self.buffer)
+        self._offset = max(0, min(position - self._base, len(self._rows) - self._visible))
+        self._render()
+
+    def _fractions(self):
+        if not self._total:
+            return 0.0, 1.0
+        position = self._base + self._offset
+        first = position / self._total
+        last = min(1.0, (position + self._visible) / self._total)
+        return first, last
+
+    def _update_scrollbar(self):
+        if self._yscrollcommand:
+            self._yscrollcommand(*self._fractions())
+
+    # Treeview arayüzü
+    def configure(self, cnf=None, **kw):
+        if isinstance(cnf, dict):
+            kw = dict(cnf, **kw)
+            cnf = None
+        command = kw.pop("yscrollcommand", kw.pop("yscroll", None))
+        if command is not None:
+            self._yscrollcommand = command
+            self._update_scrollbar()
+            if not kw and cnf is None:
+                return None
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def yview(self, *args):
+        """Kaydırma çubuğu komutlarını sanal pencereye uygular"""
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * self._total))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self._visible
+            self._scroll_to(self._base + self._offset + amount)
+
+    def yview_moveto(self, fraction):
+        self.yview("moveto", fraction)
+
+    def yview_scroll(self, number, what):
+        self.yview("scroll", number, what)
+
+    # Olaylar
+    def _on_configure(self, event):
+        bbox = self.bbox(self._slots[0]) if self._slots else None
+        if bbox:
+            heading, rowheight = bbox[1], bbox[3]
+        else:
+            rowheight = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+            heading = rowheight
+        visible = max(1, (event.height - heading) // rowheight)
+        if visible != self._visible:
+            self._visible = visible
+            self._scroll_to(self._base + self._offset)
+
+    def _on_select(self, event):
+        selection = self.selection()
+        if selection and selection[0] in self._slots:
+            index = self._offset + self._slots.index(selection[0])
+            if index < len(self._rows):
+                self._selected_id = self._rows[index][0][0]
+
+    def _on_wheel(self, event):
+        position = self._base + self._offset
+        if event.num == 4 or event.delta > 0:
+            self._scroll_to(position - 3)
+        else:
+            self._scroll_to(position + 3)
+        return "break"
+
+    def _move_selection(self, delta):
+        position = self._base + self._offset
+        index = self._row_index(self._selected_id) if self._selected_id is not None else None
+        if index is None:
+            index = self._offset - 1 if delta > 0 else self._offset + self._visible
+        target = max(0, min(self._base + index + delta, self._total - 1))
+        self._load_range(target, target + 1)
+        if not self._rows:
+            return "break"
+        target = max(self._base, min(target, self._base + len(self._rows) - 1))
+        self._selected_id = self._rows[target - self._base][0][0]
+        if target < position:
+            self._scroll_to(target)
+        elif target >= position + self._visible:
+            self._scroll_to(target - self._visible + 1)
+        else:
+            self._render()
+        self.event_generate("<<TreeviewSelect>>")
+        return "break"
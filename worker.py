@@ -0,0 +1,159 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+import tracing
+
+
+def _trace_name(key):
+    """Kayda özel anahtarlar, örn. ("book_history", id), tek ad altında izlenir"""
+    return key[0] if isinstance(key, tuple) else key
+
+
+class QueryService:
+    """Veritabanı işlerini arka plan thread'inde çalıştırır.
+
+    Sonuçlar bir kuyruğa konur ve Tk ana döngüsünde `root.after` ile
+    yoklanarak geri çağrılara teslim edilir; geri çağrılar her zaman Tk
+    thread'inde çalışır. Aynı anahtarla yeni bir iş gönderildiğinde eski
+    iş henüz başlamadıysa iptal edilir, başladıysa sonucu yok sayılır.
+    Uzun işler ilerleme bildirimi de gönderebilir (bkz. `submit`).
+
+    Her iş arka planda "anahtar" adıyla, geri çağrısı Tk thread'inde
+    "anahtar:ui" adıyla izlenir (bkz. tracing.py).
+    """
+
+    POLL_MS = 15
+
+    def __init__(self, root, on_busy=None, on_error=None, max_workers=1):
+        self.root = root
+        self.on_busy = on_busy
+        self.on_error = on_error
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="okurtakip-db")
+        self._results = queue.Queue()
+        self._progress = queue.Queue()
+        self._latest = {}
+        self._futures = {}
+        self._pending = 0
+        self._polling = False
+
+    def submit(self, key, func, *args, callback=None, errback=None, progress=None):
+        """`func(*args)` işini kuyruğa ekler; sonuç `callback`e verilir.
+
+        `progress` verilirse işe `progress=` anahtar argümanıyla bir bildirim
+        fonksiyonu geçilir; bu fonksiyona verilen argümanlar Tk thread'inde
+        `progress`e iletilir.
+        """
+        generation = self._latest.get(key, 0) + 1
+        self._latest[key] = generation
+        previous = self._futures.get(key)
+        if previous is not None:
+            previous.cancel()
+
+        kwargs = {}
+        if progress is not None:
+            kwargs["progress"] = lambda *values: self._progress.put((key, generation, progress, values))
+        future = self._executor.submit(self._run, _trace_name(key), func, args, kwargs)
+        self._futures[key] = future
+        self._pending += 1
+        future.add_done_callback(
+            lambda f: self._results.put((key, generation, f, callback, errback)))
+
+        if self._pending == 1 and self.on_busy:
+            self.on_busy(True)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_MS, self._poll)
+        return future
+
+    @staticmethod
+    def _run(name, func, args, kwargs):
+        with tracing.span(name):
+            return func(*args, **kwargs)
+
+    def pending(self, key):
+        """Anahtar için sonucu henüz teslim edilmemiş bir iş var mı"""
+        return key in self._futures
+
+    def _poll(self):
+        while True:
+            try:
+                key, generation, progress, values = self._progress.get_nowait()
+            except queue.Empty:
+                break
+            if generation == self._latest.get(key):
+                progress(*values)
+
+        while True:
+            try:
+                key, generation, future, callback, errback = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            if self._futures.get(key) is future:
+                del self._futures[key]
+            if future.cancelled() or generation != self._latest.get(key):
+                continue
+            error = future.exception()
+            if error is not None:
+                handler = errback or self.on_error
+                if handler:
+                    handler(error)
+            elif callback:
+                with tracing.span(f"{_trace_name(key)}:ui"):
+                    callback(future.result())
+
+        if self._pending:
+            self.root.after(self.POLL_MS, self._poll)
+        else:
+            self._polling = False
+            if self.on_busy:
+                self.on_busy(False)
+
+    def shutdown(self):
+        """Bekleyen işleri iptal eder ve thread'i durdurur"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class RefreshScheduler:
+    """Görünüm yenilemelerini Tk boşta döngüsünde birleştirir.
+
+    Görünümler bir ad ve yükleyiciyle kaydedilir (`register`). `mark`
+    görünümü kirli işaretler ve henüz planlanmamışsa `after_idle` ile tek
+    bir boşaltma planlar. Aynı olay turunda kaç kez işaretlenirse
+    işaretlensin her kirli görünüm boşaltmada bir kez, kayıt sırasıyla
+    yüklenir.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._loaders = {}
+        # Sıralı küme olarak kullanılır
+        self._dirty = {}
+        self._job = None
+
+    def register(self, name, loader):
+        self._loaders[name] = loader
+
+    def mark(self, *names):
+        """Görünümleri bir sonraki boşta turunda yüklenmek üzere işaretler"""
+        for name in names:
+            if name not in self._loaders:
+                raise KeyError(f"Kayıtlı olmayan görünüm: {name}")
+            self._dirty[name] = None
+        if self._dirty and self._job is None:
+            self._job = self.root.after_idle(self._run)
+
+    def _run(self):
+        self._job = None
+        self.flush()
+
+    def flush(self):
+        """Kirli görünümleri beklemeden yükler"""
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+        dirty, self._dirty = self._dirty, {}
+        for name, loader in self._loaders.items():
+            if name in dirty:
+                loader()